@@ -0,0 +1,111 @@
+"""
+예약 API 응답 매핑 모듈
+날짜 선택 시 SPA가 받아오는 예약 목록 JSON을 DOM 대신 직접 읽어
+Reservation 레코드로 변환합니다.
+"""
+import json
+import os
+from reservation import Reservation
+
+# 헤더별 JSON 필드 경로 후보 (점(.)으로 중첩 키 표현, 앞에서부터 먼저 찾은 값 사용)
+# 실제 응답 구조에 맞게 RESERVATION_API_FIELD_MAP 환경변수(JSON)로 덮어쓸 수 있습니다.
+DEFAULT_FIELD_MAP = {
+    "팀": ["teamName", "team.name", "team"],
+    "고객명": ["customerName", "guestName", "name"],
+    "예약번호": ["reservationNumber", "reservationNo", "reservationCode"],
+    "채널": ["channel", "agency.code", "agency", "platform"],
+    "인원구분": ["personInfo", "people", "pax"],
+    "국가": ["nationality", "country"],
+    "예약상품": ["productName", "product.name", "product"],
+    "예약시간": ["timeRequest", "reservationTime", "time"],
+}
+
+
+def get_field_map() -> dict:
+    """환경변수 RESERVATION_API_FIELD_MAP으로 덮어쓴 필드 경로 맵을 반환"""
+    field_map = dict(DEFAULT_FIELD_MAP)
+    override = os.getenv("RESERVATION_API_FIELD_MAP")
+    if override:
+        for header, paths in json.loads(override).items():
+            field_map[header] = [paths] if isinstance(paths, str) else list(paths)
+    return field_map
+
+
+def get_path(record: dict, path: str):
+    """점(.)으로 구분된 경로의 값을 반환 (없으면 None)"""
+    value = record
+    for key in path.split("."):
+        if not isinstance(value, dict) or key not in value:
+            return None
+        value = value[key]
+    return value
+
+
+def get_field(record: dict, paths: list[str]) -> str:
+    """후보 경로 중 처음으로 값이 있는 필드를 문자열로 반환"""
+    for path in paths:
+        value = get_path(record, path)
+        if value is not None and not isinstance(value, (dict, list)):
+            return str(value).strip()
+    return ""
+
+
+def find_reservation_records(payload, field_map: dict, team: str = "") -> list[tuple[dict, str]]:
+    """
+    응답 JSON을 순회하며 예약번호 필드를 가진 레코드를 찾습니다.
+    팀 단위로 묶인 응답이면 상위 객체의 팀 이름을 함께 반환합니다.
+
+    Returns:
+        list[tuple[dict, str]]: (예약 레코드, 상위 팀 이름) 리스트
+    """
+    records = []
+    if isinstance(payload, list):
+        for item in payload:
+            records.extend(find_reservation_records(item, field_map, team))
+    elif isinstance(payload, dict):
+        if get_field(payload, field_map["예약번호"]):
+            records.append((payload, team))
+        else:
+            group_team = get_field(payload, field_map["팀"]) or team
+            for value in payload.values():
+                if isinstance(value, (dict, list)):
+                    records.extend(find_reservation_records(value, field_map, group_team))
+    return records
+
+
+def contains_objects(payload) -> bool:
+    """응답 안에 객체(dict)를 담은 리스트가 있는지 확인"""
+    if isinstance(payload, list):
+        return any(isinstance(item, dict) or contains_objects(item) for item in payload)
+    if isinstance(payload, dict):
+        return any(contains_objects(value) for value in payload.values())
+    return False
+
+
+def map_reservation_payload(payload, reservation_date: str) -> list[Reservation]:
+    """
+    예약 목록 API 응답을 Reservation 리스트로 변환합니다.
+    금액은 0으로 두며, 호출하는 쪽에서 상품명으로 계산합니다.
+
+    Args:
+        payload: 예약 목록 API의 JSON 응답
+        reservation_date: 예약 날짜 (예: "2026-01-14")
+    """
+    field_map = get_field_map()
+    scraped_data = []
+
+    for record, group_team in find_reservation_records(payload, field_map):
+        reservation = Reservation.from_headers({
+            header: get_field(record, paths) for header, paths in field_map.items()
+        })
+        reservation.date = reservation_date
+        reservation.team = reservation.team or group_team
+        reservation.time = reservation.time.replace("Time Request:", "").strip()
+        scraped_data.append(reservation)
+
+    if not scraped_data and contains_objects(payload):
+        sample = payload[0] if isinstance(payload, list) else payload
+        keys = list(sample.keys()) if isinstance(sample, dict) else type(sample).__name__
+        print(f"[WARNING] 예약 API 응답에서 예약을 찾지 못했습니다. 응답 키: {keys}")
+
+    return scraped_data
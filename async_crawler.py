@@ -0,0 +1,168 @@
+"""
+비동기 크롤링 모듈 (playwright.async_api)
+하나의 이벤트 루프에서 날짜 조회(페이지 여러 개), 구글 시트 작성기(sheet_writer.AsyncSheetWriter),
+Slack 전송이 동시에 실행되어 브라우저 대기와 시트/Slack 네트워크 I/O가 겹칩니다.
+화면 조작은 scraper/session_store/month_overview의 async 구현(*_async)을 그대로 사용하고,
+이 모듈은 브라우저 연결과 날짜별 페이지 배분만 담당합니다.
+gspread, requests처럼 블로킹 라이브러리 호출은 asyncio.to_thread로 이벤트 루프 밖에서 실행합니다.
+
+실행: python main.py --async
+"""
+from typing import Callable
+import asyncio
+import time
+from playwright.async_api import Browser, BrowserContext, Page
+from scraper import scrape_date_async, wait_for_page_ready_async
+from browser_controller import launch_driver, load_warm_endpoint, parse_viewport
+from resource_filter import install_resource_filter_async
+from reservation import Reservation
+from tracing import traced
+from config import TARGET_URL, BROWSER_KEEP_ALIVE, BROWSER_VIEWPORT
+
+
+# ---------------------------------------------------------------------------
+# 브라우저
+# ---------------------------------------------------------------------------
+
+async def apply_page_profile(context: BrowserContext, page: Page | None = None):
+    """browser_controller.apply_page_profile()의 async 버전 (리소스 차단 + 축소된 뷰포트)"""
+    await install_resource_filter_async(context)
+    viewport = parse_viewport(BROWSER_VIEWPORT)
+    if viewport and page is not None:
+        await page.set_viewport_size(viewport)
+
+
+@traced()
+async def setup_browser(playwright) -> tuple[Page, Browser, BrowserContext, "Driver"]:
+    """
+    browser_controller.setup_browser()의 async 버전
+    SeleniumBase로 Chrome을 실행(또는 상주 Chrome에 연결)하는 동안 이벤트 루프를 막지 않도록 스레드에서 실행합니다.
+    """
+    start = time.perf_counter()
+    driver = None
+    ws_endpoint = await asyncio.to_thread(load_warm_endpoint) if BROWSER_KEEP_ALIVE else None
+    if ws_endpoint is None:
+        driver, ws_endpoint = await asyncio.to_thread(launch_driver)
+    launched = time.perf_counter()
+
+    browser = await playwright.chromium.connect_over_cdp(ws_endpoint)
+    context = browser.contexts[0] if browser.contexts else await browser.new_context()
+    page = context.pages[0] if context.pages else await context.new_page()
+    await apply_page_profile(context, page)
+
+    mode = "새로 실행" if driver is not None else "상주 Chrome 연결"
+    print(
+        f"브라우저 준비 시간 ({mode}): 실행/CDP 대기 {launched - start:.1f}초, "
+        f"Playwright 연결 {time.perf_counter() - launched:.1f}초"
+    )
+    return page, browser, context, driver
+
+
+async def close_browser(context: BrowserContext, browser: Browser, driver):
+    """browser_controller.close_browser()의 async 버전"""
+    if driver is None:
+        try:
+            await browser.close()
+        except Exception:
+            pass
+        return
+
+    for close in (context.close, browser.close):
+        try:
+            await close()
+        except Exception:
+            pass
+    try:
+        await asyncio.to_thread(driver.quit)
+    except Exception:
+        pass
+
+
+# ---------------------------------------------------------------------------
+# 날짜별 페이지 배분
+# ---------------------------------------------------------------------------
+
+async def scrape_dates(
+    browser: Browser,
+    page: Page,
+    storage_state: dict,
+    dates: list[tuple[str, str]],
+    workers: int,
+    on_result: Callable[[str, list[Reservation]], None] | None = None
+) -> list[Reservation]:
+    """
+    날짜마다 태스크를 만들고, 최대 workers개의 페이지에서 동시에 스크래핑합니다.
+    동시에 조회하는 날짜 수는 BoundedSemaphore(workers)로 제한하고, 조회가 끝난 페이지는 다음 날짜에 재사용합니다.
+    첫 페이지는 로그인한 페이지를 그대로 사용하고, 나머지는 필요할 때 로그인 상태를 복사한 새 컨텍스트로 만듭니다.
+
+    Args:
+        browser: 로그인한 브라우저
+        page: 로그인한 페이지
+        storage_state: 로그인한 컨텍스트의 storage state
+        dates: (달력에서 클릭할 일, 예약 날짜) 튜플 리스트
+        workers: 동시에 사용할 페이지 수
+        on_result: (예약 날짜, 결과)를 날짜 순서대로 받을 콜백 (앞선 날짜가 끝나는 대로 호출)
+
+    Returns:
+        list[Reservation]: 날짜 순서대로 병합된 예약 정보 리스트
+    """
+    page_slots = asyncio.BoundedSemaphore(max(1, workers))
+    idle_pages = [(1, page)]  # (페이지 번호, 페이지), 로그인한 페이지부터 사용
+    contexts = []
+
+    results = {}
+    released = 0
+
+    def release():
+        """앞에서부터 연속으로 끝난 날짜의 결과를 on_result로 넘김"""
+        nonlocal released
+        while released in results:
+            if on_result is not None:
+                on_result(dates[released][1], results[released])
+            released += 1
+
+    async def open_page() -> tuple[int, Page]:
+        """쉬고 있는 페이지를 꺼내거나, 없으면 로그인 상태를 복사한 새 페이지를 만듦"""
+        if idle_pages:
+            return idle_pages.pop()
+        context = await browser.new_context(storage_state=storage_state)
+        contexts.append(context)
+        page_id = len(contexts) + 1
+        worker_page = await context.new_page()
+        await apply_page_profile(context, worker_page)
+        await worker_page.goto(TARGET_URL)
+        await wait_for_page_ready_async(worker_page, "worker_page_ready")
+        return page_id, worker_page
+
+    async def scrape_one(idx: int, target_day: str, reservation_date: str):
+        async with page_slots:
+            page_id, worker_page = await open_page()
+            scraped_data = await scrape_date_async(worker_page, target_day, reservation_date)
+            idle_pages.append((page_id, worker_page))
+
+        results[idx] = scraped_data
+        release()
+        if scraped_data:
+            print(f"  [W{page_id}] {reservation_date}: {len(scraped_data)}건 수집")
+        else:
+            print(f"  [W{page_id}] {reservation_date}: 예약 없음")
+
+    try:
+        # 한 날짜에서 오류가 나면 나머지 날짜도 취소
+        async with asyncio.TaskGroup() as group:
+            for idx, (target_day, reservation_date) in enumerate(dates):
+                group.create_task(scrape_one(idx, target_day, reservation_date))
+    except* Exception as errors:
+        error = errors.exceptions[0]
+        raise RuntimeError(f"비동기 스크래핑 실패: {error}") from error
+    finally:
+        for context in contexts:
+            try:
+                await context.close()
+            except Exception:
+                pass
+
+    all_scraped_data = []
+    for idx in range(len(dates)):
+        all_scraped_data.extend(results.get(idx, []))
+    return all_scraped_data
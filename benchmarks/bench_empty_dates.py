@@ -0,0 +1,87 @@
+"""
+예약 없는 날짜 판단 벤치마크
+날짜 선택 후 has_reservations()가 '예약 없음'을 판단하기까지의 시간을 방식별로 비교합니다.
+    legacy: 상호가 나타나기를 RESERVATION_WAIT_TIMEOUT(15초) 기다린 뒤 타임아웃을 예약 없음으로 판단
+            (빈 화면 셀렉터와 API 패턴이 없을 때의 기본 동작)
+    empty_state: 상호와 빈 화면 표시(EMPTY_STATE_SELECTOR) 중 먼저 나타나는 쪽 (EMPTY_DATE_TIMEOUT 이내)
+    api: 예약 목록 API 응답(RESERVATION_API_PATTERN)으로 바로 판단
+
+실행: python -m benchmarks.bench_empty_dates
+"""
+from datetime import date, timedelta
+from urllib.parse import urlparse, parse_qs
+import json
+import statistics
+import time
+from playwright.sync_api import sync_playwright, Route
+import scraper
+from benchmarks.synthetic_page import RESERVATION_APP_HTML, build_reservation_payload
+
+APP_URL = "https://bench.local/"
+DATES = 3
+
+# 방식 -> (EMPTY_STATE_SELECTOR, RESERVATION_API_PATTERN)
+MODES = {
+    "legacy": ("", ""),
+    "empty_state": ("p.empty-state", ""),
+    "api": ("", "/api/reservations"),
+}
+
+
+def serve_empty_app(route: Route):
+    """가짜 SPA와 예약이 없는 예약 목록 API 응답"""
+    url = urlparse(route.request.url)
+    if url.path == "/api/reservations":
+        reservation_date = date.fromisoformat(parse_qs(url.query)["date"][0])
+        route.fulfill(
+            content_type="application/json",
+            body=json.dumps(build_reservation_payload(reservation_date.day, rows=0))
+        )
+    else:
+        route.fulfill(content_type="text/html", body=RESERVATION_APP_HTML)
+
+
+def measure(page, mode: str, targets: list[date]) -> list[float]:
+    """날짜별 has_reservations 소요 시간(ms)"""
+    empty_state_selector, api_pattern = MODES[mode]
+    scraper.EMPTY_STATE_SELECTOR = empty_state_selector
+    scraper.RESERVATION_API_PATTERN = api_pattern
+
+    page.goto(APP_URL)
+    scraper.wait_for_page_ready(page)
+
+    timings = []
+    for target in targets:
+        scraper.click_date_button(page)
+        response = scraper.click_calendar_date(page, str(target.day), target.year, target.month)
+        start = time.perf_counter()
+        found = scraper.has_reservations(page, response=response, reservation_date=target.isoformat())
+        timings.append((time.perf_counter() - start) * 1000)
+        if found:
+            raise RuntimeError(f"{mode}: {target}에 예약이 없어야 합니다.")
+    return timings
+
+
+def main():
+    targets = [date.today() + timedelta(days=offset) for offset in range(1, DATES + 1)]
+
+    with sync_playwright() as playwright:
+        try:
+            browser = playwright.chromium.launch()
+        except Exception as e:
+            print(f"[ERROR] Chromium 실행 실패 (playwright install chromium 필요): {e}")
+            return
+
+        page = browser.new_page()
+        page.route("https://bench.local/**", serve_empty_app)
+
+        results = {mode: measure(page, mode, targets) for mode in MODES}
+        browser.close()
+
+    print(f"{'mode':<14}{'dates':>7}{'median_ms':>12}{'max_ms':>10}")
+    for mode, timings in results.items():
+        print(f"{mode:<14}{len(timings):>7}{statistics.median(timings):>12.0f}{max(timings):>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+날짜 간 화면 초기화 방식 벤치마크
+매 날짜 TARGET_URL을 다시 불러오는 reload 방식과 같은 페이지에서 목록만 접고 다음 날짜를 고르는
+inplace 방식의 날짜당 소요 시간을 가짜 SPA(benchmarks.synthetic_page)에서 비교합니다.
+
+실행: python -m benchmarks.bench_navigation
+"""
+from datetime import date, timedelta
+from urllib.parse import urlparse, parse_qs
+import json
+import statistics
+import time
+from playwright.sync_api import sync_playwright, Route
+import scraper
+from benchmarks.synthetic_page import RESERVATION_APP_HTML, build_reservation_payload
+
+APP_URL = "https://bench.local/"
+DATES = 6
+
+
+def serve_app(route: Route):
+    """가짜 SPA와 예약 목록 API 응답"""
+    url = urlparse(route.request.url)
+    if url.path == "/api/reservations":
+        reservation_date = date.fromisoformat(parse_qs(url.query)["date"][0])
+        route.fulfill(
+            content_type="application/json",
+            body=json.dumps(build_reservation_payload(reservation_date.day))
+        )
+    else:
+        route.fulfill(content_type="text/html", body=RESERVATION_APP_HTML)
+
+
+def measure(page, mode: str, targets: list[date]) -> list[float]:
+    """날짜별 scrape_date 소요 시간(ms)"""
+    page.goto(APP_URL)
+    scraper.wait_for_page_ready(page)
+
+    timings = []
+    for target in targets:
+        start = time.perf_counter()
+        rows = scraper.scrape_date(page, str(target.day), target.isoformat(), navigation_mode=mode)
+        timings.append((time.perf_counter() - start) * 1000)
+        if not rows or not all(row.date == target.isoformat() for row in rows):
+            raise RuntimeError(f"{mode}: {target} 결과가 올바르지 않습니다.")
+    return timings
+
+
+def main():
+    # reset_page()의 reload가 가짜 SPA를 다시 불러오도록 대상 URL 교체
+    scraper.TARGET_URL = APP_URL
+    targets = [date.today() + timedelta(days=offset) for offset in range(1, DATES + 1)]
+
+    with sync_playwright() as playwright:
+        try:
+            browser = playwright.chromium.launch()
+        except Exception as e:
+            print(f"[ERROR] Chromium 실행 실패 (playwright install chromium 필요): {e}")
+            return
+
+        page = browser.new_page()
+        page.route("https://bench.local/**", serve_app)
+
+        results = {mode: measure(page, mode, targets) for mode in ("reload", "inplace")}
+        browser.close()
+
+    print(f"{'mode':<10}{'dates':>7}{'median_ms':>12}{'total_ms':>12}")
+    for mode, timings in results.items():
+        print(f"{mode:<10}{len(timings):>7}{statistics.median(timings):>12.0f}{sum(timings):>12.0f}")
+    saved = statistics.median(results["reload"]) - statistics.median(results["inplace"])
+    print(f"날짜당 절감: {saved:.0f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+scrape_details 추출 방식 벤치마크
+행/필드마다 inner_text()를 호출하는 기존 방식과 page.evaluate() 한 번으로 추출하는 방식의
+CDP 왕복 횟수와 소요 시간을 10/50/200행 페이지에서 비교합니다.
+
+실행: python -m benchmarks.bench_scrape_details
+"""
+from contextlib import contextmanager
+import statistics
+import time
+from playwright.sync_api import sync_playwright, Locator, Page
+from scraper import extract_rows, extract_rows_per_locator
+from benchmarks.synthetic_page import build_reservation_page
+
+ROW_COUNTS = [10, 50, 200]
+REPEAT = 5
+
+# CDP 왕복이 발생하는 메서드 (호출 횟수를 센다)
+COUNTED_METHODS = [
+    (Locator, "inner_text"),
+    (Locator, "all"),
+    (Page, "evaluate"),
+]
+
+
+@contextmanager
+def count_round_trips():
+    """COUNTED_METHODS 호출 횟수를 세는 컨텍스트 매니저"""
+    counter = {"calls": 0}
+    originals = []
+    for cls, name in COUNTED_METHODS:
+        original = getattr(cls, name)
+        originals.append((cls, name, original))
+
+        def wrapper(*args, _original=original, **kwargs):
+            counter["calls"] += 1
+            return _original(*args, **kwargs)
+
+        setattr(cls, name, wrapper)
+    try:
+        yield counter
+    finally:
+        for cls, name, original in originals:
+            setattr(cls, name, original)
+
+
+def measure(page: Page, extractor) -> tuple[int, float]:
+    """(왕복 횟수, 중앙값 소요 시간 ms)"""
+    timings = []
+    calls = 0
+    for _ in range(REPEAT):
+        with count_round_trips() as counter:
+            start = time.perf_counter()
+            extractor(page)
+            timings.append((time.perf_counter() - start) * 1000)
+        calls = counter["calls"]
+    return calls, statistics.median(timings)
+
+
+def main():
+    with sync_playwright() as playwright:
+        try:
+            browser = playwright.chromium.launch()
+        except Exception as e:
+            print(f"[ERROR] Chromium 실행 실패 (playwright install chromium 필요): {e}")
+            return
+
+        page = browser.new_page()
+        print(f"{'rows':>6}{'legacy_calls':>14}{'legacy_ms':>12}{'batched_calls':>15}{'batched_ms':>12}{'speedup':>9}")
+        for rows in ROW_COUNTS:
+            page.set_content(build_reservation_page(rows))
+            legacy_calls, legacy_ms = measure(page, extract_rows_per_locator)
+            batched_calls, batched_ms = measure(page, extract_rows)
+            print(
+                f"{rows:>6}{legacy_calls:>14}{legacy_ms:>12.1f}"
+                f"{batched_calls:>15}{batched_ms:>12.1f}{legacy_ms / batched_ms:>8.1f}x"
+            )
+        browser.close()
+
+
+if __name__ == "__main__":
+    main()
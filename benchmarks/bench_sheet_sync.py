@@ -0,0 +1,90 @@
+"""
+시트 저장(중복 확인 + 추가) 처리량 벤치마크
+로컬 워크시트(sheet_backend.LocalWorksheet)에 1k/10k/100k건의 기존 이력을 채운 뒤,
+시트 전체를 읽어 중복을 확인하던 기존 방식과 로컬 예약번호 인덱스를 쓰는 sync_to_worksheet의
+소요 시간과 읽은 셀 수를 비교합니다. (인덱스는 처음 만들 때(cold)와 이미 맞춰진 상태(warm)를 따로 측정)
+
+실행: python -m benchmarks.bench_sheet_sync
+"""
+from contextlib import redirect_stdout
+from pathlib import Path
+import io
+import random
+import tempfile
+import time
+from config import RESERVATION_DATA_HEADERS
+from gsheets_client import sync_to_worksheet
+from reservation import Reservation
+from sheet_backend import LocalWorksheet
+from sheet_index import SheetIndex
+
+HISTORY_SIZES = [1_000, 10_000, 100_000]
+BATCH_EXISTING = 100  # 이번에 수집한 예약 중 이미 시트에 있는 예약 수
+BATCH_NEW = 100  # 이번에 수집한 새 예약 수
+
+
+def make_reservation(number: int) -> Reservation:
+    return Reservation(
+        f"2026-01-{number % 28 + 1:02d}",
+        team="TEAM 1",
+        customer_name=f"Guest {number} (1)",
+        reservation_no=f"R{number:07d}",
+        product="AB: CUT + STYLING X 1",
+        price=66000,
+    )
+
+
+def build_history(size: int) -> LocalWorksheet:
+    rows = [RESERVATION_DATA_HEADERS] + [make_reservation(n).to_row() for n in range(size)]
+    return LocalWorksheet(rows=rows)
+
+
+def make_batch(size: int, new_start: int) -> list[Reservation]:
+    rng = random.Random(size)
+    existing = [make_reservation(n) for n in rng.sample(range(size), BATCH_EXISTING)]
+    return existing + [make_reservation(n) for n in range(new_start, new_start + BATCH_NEW)]
+
+
+def legacy_sync(worksheet: LocalWorksheet, data: list[Reservation]) -> int:
+    """기존 방식: 시트 전체를 읽어 예약번호 집합을 만든 뒤 새 예약만 추가"""
+    reservation_no_idx = RESERVATION_DATA_HEADERS.index("예약번호")
+    existing = {row[reservation_no_idx] for row in worksheet.get_all_values()[1:] if len(row) > reservation_no_idx}
+    new_rows = [r.to_row() for r in data if r.reservation_no not in existing]
+    worksheet.append_rows(new_rows)
+    return len(new_rows)
+
+
+def measure(worksheet: LocalWorksheet, action) -> tuple[float, int]:
+    """(소요 시간 ms, 읽은 셀 수)"""
+    worksheet.read_cells = 0
+    start = time.perf_counter()
+    action()
+    return (time.perf_counter() - start) * 1000, worksheet.read_cells
+
+
+def main():
+    print(f"{'history':>8}{'legacy_ms':>11}{'legacy_cells':>14}"
+          f"{'cold_ms':>9}{'cold_cells':>12}{'warm_ms':>9}{'warm_cells':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in HISTORY_SIZES:
+            legacy_sheet = build_history(size)
+            legacy_ms, legacy_cells = measure(legacy_sheet, lambda: legacy_sync(legacy_sheet, make_batch(size, size)))
+            legacy_sheet.close()
+
+            sheet = build_history(size)
+            index = SheetIndex(str(Path(tmp) / f"index_{size}.sqlite3"), f"bench:{size}")
+            # 출력이 표를 가리지 않도록 sync_to_worksheet의 진행 메시지는 숨김
+            with redirect_stdout(io.StringIO()):
+                cold_ms, cold_cells = measure(sheet, lambda: sync_to_worksheet(sheet, index, make_batch(size, size)))
+                warm_ms, warm_cells = measure(
+                    sheet, lambda: sync_to_worksheet(sheet, index, make_batch(size, size + BATCH_NEW))
+                )
+            index.close()
+            sheet.close()
+
+            print(f"{size:>8}{legacy_ms:>11.0f}{legacy_cells:>14}"
+                  f"{cold_ms:>9.0f}{cold_cells:>12}{warm_ms:>9.0f}{warm_cells:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+벤치마크용 가짜 예약 상세 페이지 생성 모듈
+실제 사이트와 같은 셀렉터 구조의 HTML을 만들어 오프라인에서 스크래퍼를 측정합니다.
+"""
+from html import escape
+
+PRODUCTS = [
+    "AB: PERSONAL STYLE CONSULTING + CUT + STYLING X 1",
+    "AB: CUT + STYLING X 2",
+    "AB: HOLISTIC HEAD SPA X 1",
+]
+
+
+def build_reservation_row(index: int) -> str:
+    """예약 한 건의 li.css-jywvn2 HTML"""
+    return (
+        '<li class="MuiListItem-root css-jywvn2">'
+        f'<div class="MuiAvatar-root">{"L" if index % 2 else "VI"}</div>'
+        f'<h6 class="css-qdk4z1">{escape(f"Guest {index} (1)")}</h6>'
+        f'<h6 class="css-1r042ka">R{index:06d}</h6>'
+        '<span class="css-xcju41">KOREA</span>'
+        f'<p class="css-17exa0r">Time Request: {10 + index % 8}:00</p>'
+        f'<p class="css-1q5lgor">{escape(PRODUCTS[index % len(PRODUCTS)])}</p>'
+        '<p class="css-mdkayp">Adult 1</p>'
+        '</li>'
+    )
+
+
+def build_reservation_page(rows: int, teams: int = 1) -> str:
+    """
+    rows건의 예약을 teams개 팀에 나눠 담은 예약 상세 페이지 HTML을 반환합니다.
+    """
+    sections = []
+    per_team = -(-rows // teams) if teams else rows
+    for team in range(teams):
+        team_rows = range(team * per_team, min(rows, (team + 1) * per_team))
+        sections.append(
+            '<li class="MuiListSubheader-root">'
+            f'TEAM {team + 1}'
+            '<button class="MuiIconButton-root" aria-expanded="true"></button>'
+            '</li>'
+            + "".join(build_reservation_row(i) for i in team_rows)
+        )
+    return (
+        "<html><body>"
+        '<div class="MuiAccordionSummary-content"><h6>마리엠헤어</h6></div>'
+        f'<ul>{"".join(sections)}</ul>'
+        "</body></html>"
+    )
+
+
+def build_reservation_payload(day: int, rows: int = 8, teams: int = 2) -> dict:
+    """가짜 예약 목록 API 응답 (팀별 예약 행 HTML, rows=0이면 빈 목록)"""
+    per_team = -(-rows // teams)
+    return {
+        "teams": [
+            {
+                "name": f"TEAM {team + 1}",
+                "rows_html": "".join(
+                    build_reservation_row(day * 1000 + i)
+                    for i in range(team * per_team, min(rows, (team + 1) * per_team))
+                ),
+            }
+            for team in range(teams if rows else 0)
+        ]
+    }
+
+
+# 날짜 버튼, 달력, 예약 아코디언, 팀 펼치기 버튼을 실제 사이트와 같은 셀렉터로 흉내 내는 SPA
+RESERVATION_APP_HTML = """
+<html><body>
+<button class="MuiButtonBase-root css-ab6e07" id="date-button">DATE</button>
+<div id="list"></div>
+<div id="picker" hidden>
+  <div class="MuiBackdrop-root"></div>
+  <div class="MuiPickersCalendarHeader-label" id="label"></div>
+  <button aria-label="Previous month" id="prev">&lt;</button>
+  <button aria-label="Next month" id="next">&gt;</button>
+  <div id="days"></div>
+  <button id="ok">OK</button>
+</div>
+<script>
+const MONTHS = ["January", "February", "March", "April", "May", "June", "July",
+                "August", "September", "October", "November", "December"];
+const shown = new Date();
+shown.setDate(1);
+let picked = null;
+
+function renderCalendar() {
+  document.getElementById("label").textContent = `${MONTHS[shown.getMonth()]} ${shown.getFullYear()}`;
+  const last = new Date(shown.getFullYear(), shown.getMonth() + 1, 0).getDate();
+  const days = document.getElementById("days");
+  days.innerHTML = "";
+  for (let day = 1; day <= last; day++) {
+    const button = document.createElement("button");
+    button.className = "MuiPickersDay-root";
+    button.textContent = day;
+    button.onclick = () => { picked = new Date(shown.getFullYear(), shown.getMonth(), day); };
+    days.appendChild(button);
+  }
+}
+
+function toggle(el, target, display) {
+  const expanded = el.getAttribute("aria-expanded") === "true";
+  el.setAttribute("aria-expanded", String(!expanded));
+  target(expanded ? "none" : display);
+}
+
+function renderList(data) {
+  const list = document.getElementById("list");
+  if (!data.teams.length) { list.innerHTML = '<p class="empty-state">예약이 없습니다</p>'; return; }
+  list.innerHTML =
+    '<div class="MuiAccordionSummary-root" aria-expanded="false">' +
+    '<div class="MuiAccordionSummary-content"><h6>마리엠헤어</h6></div></div>' +
+    '<div id="details" style="display: none"><ul>' +
+    data.teams.map(team =>
+      `<li class="MuiListSubheader-root">${team.name}` +
+      '<button class="MuiIconButton-root" aria-expanded="false"></button></li>' +
+      team.rows_html.replaceAll("<li ", '<li style="display: none" ')
+    ).join("") +
+    "</ul></div>";
+
+  const summary = list.querySelector(".MuiAccordionSummary-root");
+  summary.onclick = () => toggle(summary, d => { document.getElementById("details").style.display = d; }, "block");
+  for (const header of list.querySelectorAll(".MuiListSubheader-root")) {
+    const button = header.querySelector("button");
+    button.onclick = () => toggle(button, d => {
+      for (let el = header.nextElementSibling; el && !el.matches(".MuiListSubheader-root"); el = el.nextElementSibling) {
+        el.style.display = d;
+      }
+    }, "list-item");
+  }
+}
+
+document.getElementById("date-button").onclick = () => {
+  document.getElementById("picker").hidden = false;
+  renderCalendar();
+};
+document.getElementById("prev").onclick = () => { shown.setMonth(shown.getMonth() - 1); renderCalendar(); };
+document.getElementById("next").onclick = () => { shown.setMonth(shown.getMonth() + 1); renderCalendar(); };
+document.getElementById("ok").onclick = async () => {
+  document.getElementById("picker").hidden = true;
+  const date = `${picked.getFullYear()}-${String(picked.getMonth() + 1).padStart(2, "0")}-${String(picked.getDate()).padStart(2, "0")}`;
+  const response = await fetch(`/api/reservations?date=${date}`);
+  renderList(await response.json());
+};
+</script>
+</body></html>
+"""
@@ -0,0 +1,120 @@
+"""
+오프라인 재현 벤치마크 (pytest-benchmark)
+python main.py --record로 녹화한 HAR/HTML 스냅샷(REPLAY_DIR)과 가짜 예약 페이지로
+로그인, 날짜별 조회, scrape_details 소요 시간을 실제 사이트 없이 측정합니다.
+녹화가 없으면 녹화가 필요한 항목은 건너뛰고, Chromium을 실행할 수 없으면 전체를 건너뜁니다.
+
+실행: python -m pytest benchmarks/test_replay_benchmark.py --benchmark-only
+"""
+from datetime import date
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from playwright.sync_api import sync_playwright
+from replay import Recording, open_replay_context
+from scraper import login, scrape_date, scrape_details
+from benchmarks.synthetic_page import build_reservation_page
+from config import LOGIN_ID, LOGIN_PASSWORD
+
+ROW_COUNTS = [10, 50, 200]
+
+
+@pytest.fixture(scope="module")
+def browser():
+    with sync_playwright() as playwright:
+        try:
+            browser = playwright.chromium.launch()
+        except Exception as e:
+            pytest.skip(f"Chromium을 실행할 수 없습니다 (playwright install chromium 필요): {e}")
+        yield browser
+        browser.close()
+
+
+@pytest.fixture(scope="module")
+def recording() -> Recording:
+    recording = Recording()
+    if not recording.exists():
+        pytest.skip(f"녹화 파일이 없습니다: {recording.directory} (python main.py --record로 녹화)")
+    return recording
+
+
+@pytest.fixture
+def offline_context(browser):
+    """모든 네트워크 요청을 막은 컨텍스트 (스냅샷/가짜 페이지용)"""
+    context = browser.new_context()
+    context.route("**/*", lambda route: route.abort())
+    yield context
+    context.close()
+
+
+@pytest.mark.parametrize("rows", ROW_COUNTS)
+def test_bench_scrape_details_synthetic(benchmark, offline_context, rows):
+    """가짜 예약 페이지에서 행 수별 scrape_details"""
+    page = offline_context.new_page()
+    page.set_content(build_reservation_page(rows, teams=2))
+
+    result = benchmark(scrape_details, page, "2026-01-18")
+    assert len(result) == rows
+
+
+def test_bench_scrape_details_snapshots(benchmark, offline_context, recording):
+    """녹화한 날짜별 예약 상세 화면 전체에 대한 scrape_details"""
+    manifest = recording.load_manifest()
+    pages = []
+    for reservation_date, path in recording.snapshots().items():
+        page = offline_context.new_page()
+        page.set_content(path.read_text(encoding="utf-8"))
+        pages.append((reservation_date, page))
+    if not pages:
+        pytest.skip("녹화에 예약 상세 스냅샷이 없습니다.")
+
+    def run():
+        return {reservation_date: len(scrape_details(page, reservation_date)) for reservation_date, page in pages}
+
+    counts = benchmark(run)
+    assert counts == {d: manifest["dates"][d] for d, _ in pages}
+
+
+def test_bench_login_replay(benchmark, browser, recording):
+    """HAR 재현 환경에서 첫 화면 로딩 + 로그인"""
+    target_url = recording.load_manifest()["target_url"]
+    contexts = []
+
+    def setup():
+        context = open_replay_context(browser, str(recording.directory))
+        contexts.append(context)
+        page = context.new_page()
+        page.goto(target_url)
+        return (page, LOGIN_ID, LOGIN_PASSWORD), {}
+
+    try:
+        benchmark.pedantic(login, setup=setup, rounds=3)
+    finally:
+        for context in contexts:
+            context.close()
+
+
+def test_bench_date_navigation_replay(benchmark, browser, recording):
+    """HAR 재현 환경에서 녹화한 날짜들을 순서대로 조회 (날짜 선택 + 펼치기 + 추출 + 초기화)"""
+    manifest = recording.load_manifest()
+    dates = [d for d, count in sorted(manifest["dates"].items()) if count]
+    if not dates:
+        pytest.skip("녹화에 예약이 있는 날짜가 없습니다.")
+
+    context = open_replay_context(browser, str(recording.directory))
+    try:
+        page = context.new_page()
+        page.goto(manifest["target_url"])
+        login(page, LOGIN_ID, LOGIN_PASSWORD)
+
+        def run():
+            return [
+                len(scrape_date(page, str(date.fromisoformat(d).day), d))
+                for d in dates
+            ]
+
+        counts = benchmark.pedantic(run, rounds=3)
+        assert counts == [manifest["dates"][d] for d in dates]
+    finally:
+        context.close()
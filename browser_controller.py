@@ -6,10 +6,18 @@ Playwright가 해당 브라우저에 접속하여 제어합니다.
 from seleniumbase import Driver
 from playwright.sync_api import sync_playwright, Browser, BrowserContext, Page
 import time
-import subprocess
 import re
 import os
-import platform
+import socket
+import urllib.request
+import json
+from pathlib import Path
+from tracing import traced, wait_span
+from resource_filter import install_resource_filter
+from config import BROWSER_KEEP_ALIVE, BROWSER_STATE_FILE, BROWSER_VIEWPORT
+
+# setup_browser()가 연결한 CDP 엔드포인트 (병렬 워커가 같은 브라우저에 접속할 때 사용)
+_cdp_endpoint: str | None = None
 
 
 def is_headless_mode() -> bool:
@@ -17,69 +25,178 @@ def is_headless_mode() -> bool:
     return os.getenv("HEADLESS", "").lower() in ("true", "1", "yes")
 
 
-def get_cdp_port() -> str:
-    """Chrome 프로세스에서 디버깅 포트 추출"""
-    cdp_port = None
-    system = platform.system()
+def find_free_port() -> int:
+    """Chrome 디버깅 포트로 쓸 빈 로컬 포트를 운영체제에서 할당받음"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def is_cdp_ready(endpoint: str) -> bool:
+    """CDP 엔드포인트(/json/version)가 응답하는지 확인"""
+    try:
+        with urllib.request.urlopen(f"{endpoint}/json/version", timeout=1) as response:
+            return response.status == 200
+    except Exception:
+        return False
+
+
+def wait_for_cdp_endpoint(endpoint: str, timeout: float = 10.0) -> str:
+    """
+    Chrome의 CDP(/json/version)가 응답할 때까지 폴링하고 엔드포인트를 반환합니다.
+
+    Raises:
+        TimeoutError: timeout 안에 CDP가 응답하지 않은 경우
+    """
+    deadline = time.monotonic() + timeout
+    with wait_span("cdp_ready", timeout * 1000):
+        while not is_cdp_ready(endpoint):
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"Chrome CDP가 {timeout:.0f}초 안에 응답하지 않습니다: {endpoint}")
+            time.sleep(0.05)
+    return endpoint
+
+
+def parse_viewport(value: str) -> dict | None:
+    """뷰포트 설정(예: "1024x768")을 Playwright 뷰포트로 변환 (비어 있으면 None)"""
+    match = re.fullmatch(r"\s*(\d+)\s*[xX]\s*(\d+)\s*", value or "")
+    return {"width": int(match.group(1)), "height": int(match.group(2))} if match else None
+
+
+def apply_page_profile(context: BrowserContext, page: Page):
+    """
+    스크래핑용 경량 프로필 적용: 불필요한 리소스 차단 + 축소된 뷰포트
+    (BLOCK_RESOURCE_TYPES, BLOCK_THIRD_PARTY, BROWSER_VIEWPORT 설정)
+    """
+    install_resource_filter(context)
+    viewport = parse_viewport(BROWSER_VIEWPORT)
+    if viewport:
+        page.set_viewport_size(viewport)
+
+
+def get_cdp_endpoint() -> str:
+    """setup_browser()로 실행한 브라우저의 CDP 엔드포인트를 반환"""
+    if _cdp_endpoint is None:
+        raise RuntimeError("setup_browser()가 먼저 호출되어야 합니다.")
+    return _cdp_endpoint
+
+
+def load_warm_endpoint() -> str | None:
+    """실행 중인 상주 Chrome의 CDP 엔드포인트 (없거나 응답하지 않으면 None)"""
+    try:
+        with open(BROWSER_STATE_FILE, "r", encoding="utf-8") as f:
+            endpoint = json.load(f).get("cdp_endpoint")
+    except (FileNotFoundError, ValueError):
+        return None
+    return endpoint if endpoint and is_cdp_ready(endpoint) else None
+
+
+def launch_driver():
+    """
+    SeleniumBase(uc=True)로 Chrome을 실행하고 CDP가 준비될 때까지 대기합니다.
+    디버깅 포트는 미리 할당한 빈 포트를 지정하므로 다른 Chrome 프로세스와 섞이지 않습니다.
+
+    Returns:
+        tuple: (SeleniumBase Driver, CDP 엔드포인트)
 
+    Raises:
+        TimeoutError: Chrome의 CDP가 준비되지 않은 경우 (실행한 Chrome은 종료)
+    """
+    port = find_free_port()
+    # SeleniumBase로 브라우저 실행 (uc=True로 봇 탐지 우회)
+    driver = Driver(uc=True, headless=is_headless_mode(), chromium_arg=f"--remote-debugging-port={port}")
     try:
-        if system == "Windows":
-            result = subprocess.run(
-                ['wmic', 'process', 'where', "name='chrome.exe'", 'get', 'commandline'],
-                capture_output=True,
-                text=True,
-                encoding='cp949'
-            )
-        else:
-            # Linux/Mac
-            result = subprocess.run(
-                ['ps', 'aux'],
-                capture_output=True,
-                text=True
-            )
-
-        for line in result.stdout.split('\n'):
-            match = re.search(r'--remote-debugging-port=(\d+)', line)
-            if match:
-                cdp_port = match.group(1)
-                break
-    except Exception as e:
-        print(f"Warning: Could not detect CDP port automatically: {e}")
-
-    return cdp_port or "9222"
+        driver.get("about:blank")
+        return driver, wait_for_cdp_endpoint(f"http://127.0.0.1:{port}")
+    except Exception:
+        driver.quit()
+        raise
 
 
+@traced()
 def setup_browser() -> tuple[Page, Browser, BrowserContext, "Driver"]:
     """
     SeleniumBase(uc=True)로 브라우저를 실행하고,
     Playwright가 해당 브라우저에 연결하여 제어합니다.
+    BROWSER_KEEP_ALIVE가 설정되어 있고 상주 Chrome(serve_browser)이 실행 중이면
+    새로 실행하지 않고 해당 Chrome에 연결합니다. (이 경우 Driver는 None)
 
     환경변수:
         HEADLESS: "true"로 설정하면 headless 모드로 실행
+        BROWSER_KEEP_ALIVE: "true"로 설정하면 상주 Chrome 재사용
 
     Returns:
         tuple[Page, Browser, BrowserContext, Driver]: Playwright Page, Browser, Context, SeleniumBase Driver 객체
     """
-    headless = is_headless_mode()
-
-    # 1. SeleniumBase로 브라우저 실행 (uc=True로 봇 탐지 우회)
-    driver = Driver(uc=True, headless=headless)
-    driver.get("about:blank")
+    global _cdp_endpoint
+    start = time.perf_counter()
 
-    # 2. Playwright가 디버깅 포트로 연결할 수 있도록 대기
-    time.sleep(3)
+    # 1. 상주 Chrome이 있으면 연결, 없으면 새로 실행
+    driver = None
+    ws_endpoint = load_warm_endpoint() if BROWSER_KEEP_ALIVE else None
+    if ws_endpoint is None:
+        driver, ws_endpoint = launch_driver()
+    launched = time.perf_counter()
 
-    # 3. Chrome 프로세스에서 디버깅 포트 추출
-    cdp_port = get_cdp_port()
-
-    # 4. Playwright를 통해 실행 중인 브라우저에 연결
+    # 2. Playwright를 통해 실행 중인 브라우저에 연결
     playwright = sync_playwright().start()
 
-    ws_endpoint = f"http://127.0.0.1:{cdp_port}"
     browser = playwright.chromium.connect_over_cdp(ws_endpoint)
+    _cdp_endpoint = ws_endpoint
 
     # 기존 컨텍스트와 페이지 사용
     context = browser.contexts[0] if browser.contexts else browser.new_context()
     page = context.pages[0] if context.pages else context.new_page()
+    apply_page_profile(context, page)
+
+    mode = "새로 실행" if driver is not None else "상주 Chrome 연결"
+    print(
+        f"브라우저 준비 시간 ({mode}): 실행/CDP 대기 {launched - start:.1f}초, "
+        f"Playwright 연결 {time.perf_counter() - launched:.1f}초"
+    )
 
     return page, browser, context, driver
+
+
+def close_browser(context: BrowserContext, browser: Browser, driver):
+    """
+    브라우저를 종료합니다.
+    상주 Chrome에 연결한 경우(driver가 None)에는 연결만 끊고 Chrome은 그대로 둡니다.
+    """
+    if driver is None:
+        try:
+            browser.close()
+        except Exception:
+            pass
+        return
+
+    for close in (context.close, browser.close, driver.quit):
+        try:
+            close()
+        except Exception:
+            pass
+
+
+def serve_browser():
+    """
+    상주 Chrome을 실행하고 CDP 엔드포인트를 BROWSER_STATE_FILE에 기록한 뒤 종료 신호까지 유지합니다.
+    BROWSER_KEEP_ALIVE=true로 실행하는 main.py가 이 Chrome에 연결해 실행 시간을 줄입니다.
+    """
+    driver, ws_endpoint = launch_driver()
+    Path(BROWSER_STATE_FILE).parent.mkdir(parents=True, exist_ok=True)
+    with open(BROWSER_STATE_FILE, "w", encoding="utf-8") as f:
+        json.dump({"cdp_endpoint": ws_endpoint, "pid": os.getpid()}, f)
+    print(f"상주 Chrome 실행 중: {ws_endpoint} (Ctrl+C로 종료)")
+
+    try:
+        while is_cdp_ready(ws_endpoint):
+            time.sleep(5)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        Path(BROWSER_STATE_FILE).unlink(missing_ok=True)
+        driver.quit()
+
+
+if __name__ == "__main__":
+    serve_browser()
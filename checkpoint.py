@@ -0,0 +1,101 @@
+"""
+실행 체크포인트 모듈
+실행 구간(run window)별로 날짜마다 스크래핑 결과, 다이제스트, 완료 시각을 로컬 파일에 기록합니다.
+실행이 중간에 실패해도 --resume으로 다시 실행하면 완료된 날짜는 건너뛰고 저장된 결과를 재사용합니다.
+"""
+from datetime import datetime
+from pathlib import Path
+import hashlib
+import json
+import os
+import threading
+from reservation import Reservation
+
+
+def rows_digest(rows: list[dict]) -> str:
+    """스크래핑 결과의 다이제스트"""
+    payload = json.dumps(rows, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class CheckpointStore:
+    """실행 구간 하나의 날짜별 체크포인트"""
+
+    def __init__(self, directory: str, run_window: str, resume: bool = False):
+        """
+        Args:
+            directory: 체크포인트 파일 디렉토리
+            run_window: 실행 구간 식별자 (예: "2026-01-18_2026-01-31")
+            resume: True면 기존 체크포인트를 이어서 사용, False면 새로 시작
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.path = self.directory / f"checkpoint_{run_window}.json"
+        self._lock = threading.Lock()
+
+        # 다른 실행 구간의 오래된 체크포인트 정리
+        for old in self.directory.glob("checkpoint_*.json"):
+            if old != self.path:
+                old.unlink(missing_ok=True)
+
+        self._entries = self._load() if resume else {}
+        if not resume:
+            self.path.unlink(missing_ok=True)
+
+    def _load(self) -> dict:
+        """체크포인트 파일을 읽고, 다이제스트가 맞지 않는 날짜는 버립니다."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            print(f"[WARNING] 체크포인트 로드 실패, 처음부터 실행합니다: {e}")
+            return {}
+
+        valid = {}
+        for reservation_date, entry in entries.items():
+            if rows_digest(entry.get("rows", [])) == entry.get("digest") and self._loadable(entry["rows"]):
+                valid[reservation_date] = entry
+            else:
+                print(f"[WARNING] {reservation_date} 체크포인트가 손상되어 다시 스크래핑합니다.")
+        return valid
+
+    @staticmethod
+    def _loadable(rows: list[dict]) -> bool:
+        """Reservation으로 읽을 수 있는 형식인지 확인 (이전 형식의 체크포인트 대비)"""
+        try:
+            for row in rows:
+                Reservation.from_dict(row)
+        except TypeError:
+            return False
+        return True
+
+    def _save(self):
+        """임시 파일에 쓴 뒤 교체하여 중간에 끊겨도 파일이 깨지지 않도록 저장"""
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._entries, f, ensure_ascii=False, default=str)
+        os.replace(tmp_path, self.path)
+
+    def completed_dates(self) -> set[str]:
+        with self._lock:
+            return set(self._entries)
+
+    def get(self, reservation_date: str) -> list[Reservation] | None:
+        """완료된 날짜의 저장된 결과 (없으면 None)"""
+        with self._lock:
+            entry = self._entries.get(reservation_date)
+            return [Reservation.from_dict(row) for row in entry["rows"]] if entry else None
+
+    def record(self, reservation_date: str, rows: list[Reservation]):
+        """날짜 하나의 스크래핑 완료를 기록"""
+        # 이후 시트 저장 과정에서 is_new 등이 바뀌어도 영향이 없도록 딕셔너리로 복사해서 보관
+        rows = [row.to_dict() for row in rows]
+        with self._lock:
+            self._entries[reservation_date] = {
+                "rows": rows,
+                "digest": rows_digest(rows),
+                "scraped_at": datetime.now().isoformat(timespec="seconds"),
+            }
+            self._save()
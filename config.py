@@ -17,10 +17,90 @@ LOGIN_PASSWORD = os.getenv("LOGIN_PASSWORD", "")
 # 타겟 URL
 TARGET_URL = os.getenv("TARGET_URL", "https://guide.ktourstory.com/")
 
+# 예약 목록 API URL에 포함된 문자열 (설정 시 날짜 선택 후 해당 응답 도착을 대기 조건으로 사용)
+RESERVATION_API_PATTERN = os.getenv("RESERVATION_API_PATTERN", "")
+
+# 스크래핑 방식
+#   dom: 예약 목록을 펼쳐 DOM에서 추출 (기본값)
+#   api: 날짜 선택 시 받아오는 예약 API 응답(JSON)을 바로 매핑 (RESERVATION_API_PATTERN 필요)
+#   http: 로그인 후 브라우저 없이 예약 API를 직접 호출 (RESERVATION_API_URL 필요)
+SCRAPE_MODE = os.getenv("SCRAPE_MODE", "dom").lower()
+
+# 날짜 사이 화면 초기화 방식
+#   inplace: 펼친 예약/팀을 접고 같은 페이지에서 다음 날짜 선택 (기본값, 실패 시 reload로 대체)
+#   reload: TARGET_URL을 다시 불러와 초기화
+NAVIGATION_MODE = os.getenv("NAVIGATION_MODE", "inplace").lower()
+
+# 예약이 없는 날짜의 빈 화면 표시 셀렉터 (예: "text=예약이 없습니다", 비워두면 예약 표시만 기다림)
+# 날짜 선택 후 예약 목록(상호)과 이 요소 중 먼저 나타나는 쪽으로 예약 유무를 판단합니다.
+EMPTY_STATE_SELECTOR = os.getenv("EMPTY_STATE_SELECTOR", "")
+
+# 예약 목록 로딩이 끝난 뒤 예약/빈 화면 표시를 기다리는 최대 시간(ms), 넘으면 예약 없음으로 판단
+# EMPTY_STATE_SELECTOR가 설정된 경우에만 사용합니다. (예약 없음을 빈 화면 표시로 직접 확인할 수 있을 때)
+EMPTY_DATE_TIMEOUT = int(os.getenv("EMPTY_DATE_TIMEOUT", "2000"))
+
+# EMPTY_STATE_SELECTOR가 없을 때 상호(예약 목록)를 기다리는 최대 시간(ms)
+# 느린 렌더링을 예약 없음으로 잘못 판단하지 않도록 길게 둡니다.
+RESERVATION_WAIT_TIMEOUT = int(os.getenv("RESERVATION_WAIT_TIMEOUT", "15000"))
+
+# 날짜별 예약 목록 API URL 템플릿 (예: https://.../reservations?date={date})
+RESERVATION_API_URL = os.getenv("RESERVATION_API_URL", "")
+
+# 인증 토큰이 저장된 localStorage 키 (비워두면 이름에 token이 들어간 키 사용)
+AUTH_TOKEN_STORAGE_KEY = os.getenv("AUTH_TOKEN_STORAGE_KEY", "")
+
+# http 모드 동시 요청 수
+HTTP_WORKERS = max(1, int(os.getenv("HTTP_WORKERS", "8")))
+
+# 조회 범위: 오늘부터 N일 뒤까지 (월을 넘어갈 수 있음, 0이면 이번 달 말일까지)
+SCRAPE_DAYS_AHEAD = max(0, int(os.getenv("SCRAPE_DAYS_AHEAD", "0")))
+
+# 적응형 스케줄: 가까운 날짜는 매번, 먼 날짜는 예약 건수 변화 빈도에 따라 가끔 조회
+SCHEDULE_ADAPTIVE = os.getenv("SCHEDULE_ADAPTIVE", "").lower() in ("true", "1", "yes")
+SCHEDULE_NEAR_DAYS = int(os.getenv("SCHEDULE_NEAR_DAYS", "7"))
+SCHEDULE_MAX_INTERVAL = max(1, int(os.getenv("SCHEDULE_MAX_INTERVAL", "7")))
+
+# 월간 예약 현황 미리 조회 (예약이 없는 날짜는 날짜별 조회에서 건너뜀, 오늘은 항상 조회)
+#   off: 사용하지 않음 (기본값)
+#   calendar: 날짜 선택 달력의 날짜 표시(OVERVIEW_DAY_MARKER_SELECTOR, 예: "span.MuiBadge-badge")를 읽음
+#   api: 월간 현황 API(OVERVIEW_API_URL, 예: https://.../reservations/summary?from={start}&to={end})를 한 번 호출
+OVERVIEW_SOURCE = os.getenv("OVERVIEW_SOURCE", "off").lower()
+OVERVIEW_DAY_MARKER_SELECTOR = os.getenv("OVERVIEW_DAY_MARKER_SELECTOR", "")
+OVERVIEW_API_URL = os.getenv("OVERVIEW_API_URL", "")
+
+# 지난 실행과 예약 건수가 같은 날짜도 건너뛸지 여부 (건수가 같으면 시간/상품 변경은 다음 조회 때 반영됨)
+OVERVIEW_SKIP_UNCHANGED = os.getenv("OVERVIEW_SKIP_UNCHANGED", "").lower() in ("true", "1", "yes")
+
+# 날짜별 병렬 스크래핑 워커 수 (1이면 기존처럼 단일 페이지에서 순차 실행)
+SCRAPE_WORKERS = max(1, int(os.getenv("SCRAPE_WORKERS", "1")))
+
+# 스크래핑 브라우저에서 차단할 리소스 타입 (쉼표 구분, 비워두면 차단하지 않음)
+BLOCK_RESOURCE_TYPES = [
+    t.strip() for t in os.getenv("BLOCK_RESOURCE_TYPES", "image,font,media").split(",") if t.strip()
+]
+
+# TARGET_URL 호스트(와 하위 도메인)가 아닌 사이트의 요청(분석 도구 등) 차단 여부 (xhr/fetch/document는 차단하지 않음)
+BLOCK_THIRD_PARTY = os.getenv("BLOCK_THIRD_PARTY", "true").lower() in ("true", "1", "yes")
+
+# 외부 사이트여도 차단하지 않을 호스트 (쉼표 구분, 하위 도메인 포함, 예: 같은 회사의 static.ktourstory.com)
+BLOCK_ALLOW_HOSTS = [h.strip() for h in os.getenv("BLOCK_ALLOW_HOSTS", "").split(",") if h.strip()]
+
+# 스크래핑 페이지 뷰포트 (예: "1024x768", 비워두면 브라우저 기본값)
+BROWSER_VIEWPORT = os.getenv("BROWSER_VIEWPORT", "1024x768")
+
 # Google Sheets 설정
 GOOGLE_SHEET_TITLE = os.getenv("GOOGLE_SHEET_TITLE", "케이투어_관광객예약리스트")
 GOOGLE_WORKSHEET_NAME = os.getenv("GOOGLE_WORKSHEET_NAME", "crawlingDB")
 
+# 스프레드시트 키 (URL의 /d/<키>/ 부분)
+# 비워두면 GOOGLE_SHEETS_URL에서 추출하고, 그것도 없으면 제목(GOOGLE_SHEET_TITLE)으로 Drive에서 검색
+GOOGLE_SHEET_KEY = os.getenv("GOOGLE_SHEET_KEY", "")
+
+# Sheets API 할당량 초과(429)/서버 오류(5xx) 시 재시도 횟수와 지수 백오프 대기 시간(초)
+SHEET_MAX_RETRIES = int(os.getenv("SHEET_MAX_RETRIES", "5"))
+SHEET_BACKOFF_BASE = float(os.getenv("SHEET_BACKOFF_BASE", "1"))
+SHEET_BACKOFF_MAX = float(os.getenv("SHEET_BACKOFF_MAX", "64"))
+
 # Google Sheets 인증 파일 경로
 CREDENTIALS_FILE = str(Path(__file__).parent / "credentials.json")
 
@@ -39,6 +119,55 @@ RESERVATION_DATA_HEADERS = [
     "is_new"
 ]
 
+# 로컬 캐시 디렉토리 (시트 인덱스 등 실행 간 유지되는 파일)
+CACHE_DIR = Path(os.getenv("CACHE_DIR", str(Path(__file__).parent / ".cache")))
+
+# 상주 Chrome 재사용 여부 (python browser_controller.py로 띄운 Chrome에 연결)
+BROWSER_KEEP_ALIVE = os.getenv("BROWSER_KEEP_ALIVE", "").lower() in ("true", "1", "yes")
+
+# 상주 Chrome의 CDP 엔드포인트 기록 파일
+BROWSER_STATE_FILE = str(CACHE_DIR / "browser.json")
+
+# 로그인 세션(storage state) 암호화 저장 파일과 암호화 키 (키가 없으면 세션을 저장하지 않음)
+SESSION_FILE = str(CACHE_DIR / "session.enc")
+SESSION_ENCRYPTION_KEY = os.getenv("SESSION_ENCRYPTION_KEY", "")
+
+# 실행 체크포인트 디렉토리 (--resume 시 완료된 날짜 재사용)
+CHECKPOINT_DIR = str(CACHE_DIR / "checkpoints")
+
+# 적응형 스케줄의 날짜별 예약 건수 이력
+SCHEDULE_FILE = str(CACHE_DIR / "schedule.json")
+
+# 월간 예약 현황의 날짜별 건수 이력 (OVERVIEW_SKIP_UNCHANGED 비교용)
+OVERVIEW_FILE = str(CACHE_DIR / "overview.json")
+
+# 구글 시트 예약번호 로컬 인덱스 (SQLite)
+SHEET_INDEX_FILE = str(CACHE_DIR / "sheet_index.sqlite3")
+
+# 예약 저장소
+#   google: 구글 시트 (기본값)
+#   local: SHEET_LOCAL_FILE의 SQLite 워크시트 (구글 API 없이 실행/측정할 때)
+SHEET_BACKEND = os.getenv("SHEET_BACKEND", "google").lower()
+SHEET_LOCAL_FILE = os.getenv("SHEET_LOCAL_FILE", str(CACHE_DIR / "local_sheet.sqlite3"))
+
+# 내용이 바뀐 기존 예약(시간, 상품, 인원, 금액 등)을 시트에서 갱신할지 여부
+SHEET_UPSERT = os.getenv("SHEET_UPSERT", "").lower() in ("true", "1", "yes")
+
+# 실행 간 변경 감지: 날짜별 스냅샷과 비교해 취소/변경된 예약을 Slack에 알리고,
+# 지난 실행과 같은 예약은 시트 저장 단계로 넘기지 않음
+CHANGE_TRACKING = os.getenv("CHANGE_TRACKING", "").lower() in ("true", "1", "yes")
+SNAPSHOT_FILE = str(CACHE_DIR / "snapshot.sqlite3")
+
+# 스크래핑 결과를 시트에 저장하는 단위 (건수 또는 첫 결과 이후 경과 시간(초) 중 먼저 도달한 쪽)
+SHEET_FLUSH_SIZE = max(1, int(os.getenv("SHEET_FLUSH_SIZE", "50")))
+SHEET_FLUSH_INTERVAL = float(os.getenv("SHEET_FLUSH_INTERVAL", "30"))
+
+# 오프라인 재현용 녹화 디렉토리 (python main.py --record로 HAR + 날짜별 HTML 스냅샷 저장)
+REPLAY_DIR = os.getenv("REPLAY_DIR", str(CACHE_DIR / "replay"))
+
+# 단계별 소요 시간 trace 파일 (JSON lines, 실행마다 새로 작성, 비워두면 파일로 기록하지 않음)
+TRACE_FILE = os.getenv("TRACE_FILE", str(CACHE_DIR / "trace.jsonl"))
+
 # 가격 데이터 파일 경로
 PRICE_FILE = str(Path(__file__).parent / "price.json")
 
@@ -0,0 +1,19 @@
+import pytest
+from reservation import Reservation
+
+
+def build_reservation(reservation_no: str, date: str = "2026-01-18", **fields) -> Reservation:
+    values = dict(
+        date=date, team="TEAM 1", customer_name=f"고객{reservation_no}", reservation_no=reservation_no,
+        channel="KKDAY", people="성인 1", country="JP", product="CUT + STYLING", time="10:00", price=66000
+    )
+    values.update(fields)
+    return Reservation(**values)
+
+
+@pytest.fixture
+def make_reservation():
+    """
+    테스트용 예약을 만드는 함수 (예약번호, 날짜와 바꿀 필드만 지정)
+    """
+    return build_reservation
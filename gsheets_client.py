@@ -1,12 +1,25 @@
 from config import (
+    GOOGLE_SHEET_KEY,
     GOOGLE_SHEET_TITLE,
+    GOOGLE_SHEETS_URL,
     GOOGLE_WORKSHEET_NAME,
     RESERVATION_DATA_HEADERS,
-    CREDENTIALS_FILE
+    CREDENTIALS_FILE,
+    SHEET_INDEX_FILE,
+    SHEET_UPSERT,
+    SHEET_BACKEND,
+    SHEET_LOCAL_FILE
 )
+from sheet_index import SheetIndex, RESERVATION_NO_COLUMN, content_hash, parse_updated_start_row
+from sheet_backend import WorksheetBackend, LocalWorksheet
+from sheet_api import RetryingHTTPClient
+from reservation import Reservation
+from tracing import traced
+from gspread.utils import rowcol_to_a1, extract_id_from_url
 import gspread
 import json
 import os
+import re
 
 
 def fix_json_newlines(json_str):
@@ -37,41 +50,49 @@ def get_gspread_client():
     Google Sheets API 클라이언트를 반환합니다.
     환경변수 GOOGLE_CREDENTIALS_JSON이 있으면 해당 값을 사용하고,
     없으면 credentials.json 파일을 사용합니다.
+    모든 요청은 할당량 초과 시 재시도하고 호출 수를 집계하는 RetryingHTTPClient로 보냅니다.
     """
     creds_json = os.getenv("GOOGLE_CREDENTIALS_JSON")
 
     if creds_json:
         creds_json = fix_json_newlines(creds_json)
         creds_dict = json.loads(creds_json)
-        return gspread.service_account_from_dict(creds_dict)
+        return gspread.service_account_from_dict(creds_dict, http_client=RetryingHTTPClient)
     else:
-        return gspread.service_account(filename=CREDENTIALS_FILE)
+        return gspread.service_account(filename=CREDENTIALS_FILE, http_client=RetryingHTTPClient)
 
 
-def save_to_sheet(data: list[dict]) -> tuple[list[dict], list[dict]]:
-    """
-    스크랩된 데이터를 구글 시트에 저장합니다.
-    중복 확인 후 새로운 데이터만 추가합니다.
+def spreadsheet_key() -> str | None:
+    """GOOGLE_SHEET_KEY, 없으면 GOOGLE_SHEETS_URL에서 추출한 스프레드시트 키 (둘 다 없으면 None)"""
+    if GOOGLE_SHEET_KEY:
+        return GOOGLE_SHEET_KEY
+    if GOOGLE_SHEETS_URL:
+        try:
+            return extract_id_from_url(GOOGLE_SHEETS_URL)
+        except gspread.exceptions.NoValidUrlKeyFound:
+            print(f"[WARNING] GOOGLE_SHEETS_URL에서 스프레드시트 키를 찾을 수 없습니다: {GOOGLE_SHEETS_URL}")
+    return None
 
-    Args:
-        data: 저장할 예약 정보 딕셔너리 리스트
 
-    Returns:
-        tuple: (새로 추가된 예약 리스트, 기존 예약 리스트)
+def open_worksheet(gc=None):
     """
-    if not data:
-        print("저장할 데이터가 없습니다.")
-        return [], []
+    설정된 스프레드시트의 워크시트를 엽니다. (워크시트가 없으면 생성)
 
+    Returns:
+        tuple: (Spreadsheet, Worksheet)
+    """
     # 1. Google Sheets API 인증
-    gc = get_gspread_client()
+    gc = gc or get_gspread_client()
 
     # 2. 스프레드시트 열기 (이미 존재해야 함)
+    #    키가 있으면 키로 바로 열고, 없을 때만 제목으로 Drive를 검색
+    key = spreadsheet_key()
+    name = key or GOOGLE_SHEET_TITLE
     try:
-        spreadsheet = gc.open(GOOGLE_SHEET_TITLE)
-        print(f"스프레드시트 '{GOOGLE_SHEET_TITLE}' 열기 완료")
+        spreadsheet = gc.open_by_key(key) if key else gc.open(GOOGLE_SHEET_TITLE)
+        print(f"스프레드시트 '{spreadsheet.title}' 열기 완료")
     except gspread.exceptions.SpreadsheetNotFound:
-        print(f"[ERROR] 스프레드시트 '{GOOGLE_SHEET_TITLE}'를 찾을 수 없습니다.")
+        print(f"[ERROR] 스프레드시트 '{name}'를 찾을 수 없습니다.")
         print("Google Drive에서 스프레드시트를 생성하고 서비스 계정과 공유해주세요.")
         raise
 
@@ -87,78 +108,228 @@ def save_to_sheet(data: list[dict]) -> tuple[list[dict], list[dict]]:
         )
         print(f"워크시트 '{GOOGLE_WORKSHEET_NAME}' 생성 완료.")
 
-    # 4. 기존 데이터 가져오기
-    all_values = worksheet.get_all_values()
+    return spreadsheet, worksheet
+
+
+def open_sheet_index(spreadsheet, worksheet) -> SheetIndex:
+    """스프레드시트/워크시트에 해당하는 로컬 예약번호 인덱스를 엽니다."""
+    return SheetIndex(SHEET_INDEX_FILE, f"{spreadsheet.id}:{worksheet.id}")
+
+
+def open_backend() -> tuple[WorksheetBackend, SheetIndex]:
+    """
+    설정된 저장소(SHEET_BACKEND)의 워크시트와 로컬 예약번호 인덱스를 엽니다.
+
+    Returns:
+        tuple: (Worksheet 또는 LocalWorksheet, SheetIndex)
+    """
+    if SHEET_BACKEND == "local":
+        worksheet = LocalWorksheet(SHEET_LOCAL_FILE)
+        print(f"로컬 워크시트 '{SHEET_LOCAL_FILE}' 열기 완료")
+        return worksheet, SheetIndex(SHEET_INDEX_FILE, f"local:{SHEET_LOCAL_FILE}")
+
+    spreadsheet, worksheet = open_worksheet()
+    return worksheet, open_sheet_index(spreadsheet, worksheet)
+
+
+def ensure_header(worksheet: WorksheetBackend, index: SheetIndex, defer_append: bool = False) -> bool:
+    """
+    시트와 로컬 인덱스를 맞추고, 첫 행에 헤더가 없으면 작성합니다.
+    defer_append=True이면 빈 시트의 헤더를 바로 쓰지 않고, 호출한 쪽이 새 예약과 함께 한 번에 추가합니다.
+
+    Returns:
+        bool: 헤더를 아직 쓰지 않아 호출한 쪽에서 추가해야 하면 True
+    """
+    header = index.reconcile(worksheet)
+    if header == RESERVATION_DATA_HEADERS:
+        return False
+
+    if index.row_count == 0:
+        if defer_append:
+            return True
+        # 빈 시트면 헤더 추가
+        worksheet.append_row(RESERVATION_DATA_HEADERS)
+        index.set_row_count(1)
+        print("헤더 작성 완료.")
+    else:
+        # 헤더가 다르면 첫 행에 삽입
+        worksheet.insert_row(RESERVATION_DATA_HEADERS, 1)
+        index.shift_rows(1)
+        print("헤더 삽입 완료.")
+    return False
+
+
+def find_modified(
+    worksheet: WorksheetBackend,
+    index: SheetIndex,
+    existing_data: list[Reservation],
+    found: dict
+) -> list[tuple[int, Reservation]]:
+    """
+    기존 예약 중 시트에 저장된 내용과 달라진 예약을 찾습니다.
+    인덱스에 내용 해시가 없는 행(다른 경로로 추가된 행)은 한 번의 batch_get으로 읽어 해시를 채웁니다.
+
+    Returns:
+        list[tuple[int, Reservation]]: (시트 행 번호, 달라진 예약) 리스트
+    """
+    unknown_rows = sorted({
+        found[r.reservation_no][0] for r in existing_data if found[r.reservation_no][1] is None
+    })
+    if unknown_rows:
+        last_col = re.sub(r"\d", "", rowcol_to_a1(1, len(RESERVATION_DATA_HEADERS)))
+        values = worksheet.batch_get([f"A{row}:{last_col}{row}" for row in unknown_rows])
+        index.record_row_numbers([
+            (row_number, value[0] if value else [])
+            for row_number, value in zip(unknown_rows, values)
+        ])
+        found = index.lookup(list(found.keys()))
+
+    modified = {}
+    for reservation in existing_data:
+        row_number, stored_hash = found[reservation.reservation_no]
+        if content_hash(reservation.to_row()) != stored_hash:
+            modified[reservation.reservation_no] = (row_number, reservation)
+    return list(modified.values())
+
+
+def rows_match(worksheet: WorksheetBackend, modified: list[tuple[int, Reservation]]) -> bool:
+    """갱신할 행의 예약번호 칸을 한 번의 batch_get으로 읽어 인덱스의 행 번호가 아직 맞는지 확인"""
+    values = worksheet.batch_get([f"{RESERVATION_NO_COLUMN}{row_number}" for row_number, _ in modified])
+    return all(
+        bool(value and value[0]) and value[0][0] == reservation.reservation_no
+        for value, (_, reservation) in zip(values, modified)
+    )
+
+
+@traced()
+def sync_to_worksheet(
+    worksheet: WorksheetBackend,
+    index: SheetIndex,
+    data: list[Reservation],
+    upsert: bool = False
+) -> tuple[list[Reservation], list[Reservation], list[Reservation]]:
+    """
+    로컬 인덱스로 중복을 확인하고 새 예약만 워크시트에 추가합니다.
+    upsert=True이면 내용이 바뀐 기존 예약도 한 번의 batch_update로 갱신합니다.
+    갱신 전에 대상 행의 예약번호를 다시 읽어, 인덱스의 행 번호가 어긋났으면 인덱스를 재구성합니다.
+    쓰기 요청은 최대 두 번입니다. (변경 갱신 batch_update 1회 + 빈 시트의 헤더를 포함한 새 예약 append_rows 1회)
+
+    Args:
+        worksheet: gspread Worksheet 또는 LocalWorksheet
+        index: 워크시트의 로컬 예약번호 인덱스
+        data: 저장할 예약 리스트
+        upsert: 변경된 기존 예약 갱신 여부
+
+    Returns:
+        tuple: (새로 추가된 예약 리스트, 기존 예약 리스트, 변경되어 갱신된 예약 리스트)
+    """
+    # 1. 인덱스 갱신 및 헤더 확인 (헤더 + 새로 추가된 예약번호 컬럼만 읽음)
+    header_pending = ensure_header(worksheet, index, defer_append=True)
+    print(f"기존 예약 {len(index)}건 확인")
+
+    # 2. 중복 확인 (이번에 수집한 예약번호만 인덱스에서 조회)
+    found = index.lookup([r.reservation_no for r in data])
 
-    # 5. 헤더 확인 및 작성
-    if not all_values or all_values[0] != RESERVATION_DATA_HEADERS:
-        # 첫 행에 헤더가 없으면 추가
-        if not all_values:
-            worksheet.append_row(RESERVATION_DATA_HEADERS)
-            print("헤더 작성 완료.")
-            all_values = [RESERVATION_DATA_HEADERS]
-        elif all_values[0] != RESERVATION_DATA_HEADERS:
-            # 헤더가 다르면 첫 행에 삽입
-            worksheet.insert_row(RESERVATION_DATA_HEADERS, 1)
-            print("헤더 삽입 완료.")
-            all_values = [RESERVATION_DATA_HEADERS] + all_values
-
-    # 6. 기존 예약번호 목록 추출 (중복 확인용)
-    existing_reservation_nos = set()
-    if len(all_values) > 1:
-        # 예약번호는 4번째 컬럼 (인덱스 3)
-        reservation_no_idx = RESERVATION_DATA_HEADERS.index("예약번호")
-        for row in all_values[1:]:  # 헤더 제외
-            if len(row) > reservation_no_idx:
-                existing_reservation_nos.add(row[reservation_no_idx])
-
-    print(f"기존 예약 {len(existing_reservation_nos)}건 확인")
-
-    # 7. 중복 제거 및 새 데이터만 추가
     new_data = []
+    seen = set()
     for reservation in data:
-        reservation_no = reservation.get("예약번호", "")
-        if reservation_no and reservation_no not in existing_reservation_nos:
+        reservation_no = reservation.reservation_no
+        if reservation_no and reservation_no not in found and reservation_no not in seen:
+            seen.add(reservation_no)
             new_data.append(reservation)
 
     # 기존 예약 리스트 (중복된 것들)
     existing_data = [
         reservation for reservation in data
-        if reservation.get("예약번호", "") in existing_reservation_nos
+        if reservation.reservation_no in found
     ]
+    for reservation in existing_data:
+        reservation.is_new = False
+
+    # 3. 변경된 기존 예약 갱신 (한 번의 batch_update)
+    modified_data = []
+    if upsert and existing_data:
+        modified = find_modified(worksheet, index, existing_data, found)
+        if modified and not rows_match(worksheet, modified):
+            # 마지막 행은 그대로인 정렬/행 이동은 reconcile에서 찾지 못하므로 예약번호 컬럼 전체를 다시 읽음
+            print("갱신할 행의 예약번호가 인덱스와 달라 예약번호 컬럼 전체를 다시 읽습니다.")
+            index.clear()
+            index.reconcile(worksheet)
+            found = index.lookup([r.reservation_no for r in existing_data])
+            # 그 사이 시트에서 삭제된 예약은 새 예약으로 추가
+            for reservation in existing_data:
+                if reservation.reservation_no not in found and reservation.reservation_no not in seen:
+                    seen.add(reservation.reservation_no)
+                    new_data.append(reservation)
+            existing_data = [r for r in existing_data if r.reservation_no in found]
+            modified = find_modified(worksheet, index, existing_data, found)
+        if modified:
+            updates = [
+                {"range": f"A{row_number}", "values": [reservation.to_row()]}
+                for row_number, reservation in modified
+            ]
+            worksheet.batch_update(updates)
+            index.record_row_numbers([
+                (row_number, reservation.to_row()) for row_number, reservation in modified
+            ])
+            modified_data = [reservation for _, reservation in modified]
+            modified_nos = {r.reservation_no for r in modified_data}
+            existing_data = [r for r in existing_data if r.reservation_no not in modified_nos]
+            print(f"{len(modified_data)}개의 변경된 예약 정보를 갱신했습니다.")
 
     if not new_data:
+        if header_pending:
+            worksheet.append_row(RESERVATION_DATA_HEADERS)
+            index.set_row_count(1)
+            print("헤더 작성 완료.")
         print("새로 추가할 데이터가 없습니다. (모두 중복)")
-        return [], existing_data
+        return [], existing_data, modified_data
 
-    # 8. 새 데이터 행 추가 (새 예약은 is_new = True로 설정)
+    # 4. 새 데이터 행 추가 (새 예약은 is_new = True로 설정)
     rows_to_add = []
     for reservation in new_data:
-        reservation['is_new'] = True  # 저장 전에 플래그 설정
-        row = [
-            reservation.get("날짜", ""),
-            reservation.get("팀", ""),
-            reservation.get("고객명", ""),
-            reservation.get("예약번호", ""),
-            reservation.get("채널", ""),
-            reservation.get("인원구분", ""),
-            reservation.get("국가", ""),
-            reservation.get("예약상품", ""),
-            reservation.get("예약시간", ""),
-            reservation.get("금액", ""),
-            reservation.get("is_new", "")
-        ]
-        rows_to_add.append(row)
-
-    # 배치로 추가 (효율성)
-    worksheet.append_rows(rows_to_add)
+        reservation.is_new = True  # 저장 전에 플래그 설정
+        rows_to_add.append(reservation.to_row())
+
+    # 배치로 추가 (빈 시트면 헤더도 같은 요청으로 추가)
+    header_rows = [RESERVATION_DATA_HEADERS] if header_pending else []
+    response = worksheet.append_rows(header_rows + rows_to_add)
+
+    start_row = parse_updated_start_row(response)
+    if start_row is not None:
+        index.record_rows(start_row + len(header_rows), rows_to_add)
+    if header_pending:
+        print("헤더 작성 완료.")
 
     print(f"{len(new_data)}개의 새 예약 정보를 구글 시트에 저장했습니다.")
     if len(data) - len(new_data) > 0:
         print(f"({len(data) - len(new_data)}개는 중복으로 제외됨)")
 
-    # 기존 예약에 is_new 플래그 설정
-    for reservation in existing_data:
-        reservation['is_new'] = False
+    return new_data, existing_data, modified_data
+
+
+@traced()
+def save_to_sheet(
+    data: list[Reservation],
+    upsert: bool = SHEET_UPSERT
+) -> tuple[list[Reservation], list[Reservation], list[Reservation]]:
+    """
+    스크랩된 데이터를 구글 시트에 저장합니다.
+    중복 확인 후 새로운 데이터만 추가하고, upsert 모드면 변경된 기존 예약을 갱신합니다.
 
-    return new_data, existing_data
+    Args:
+        data: 저장할 예약 리스트
+        upsert: 변경된 기존 예약 갱신 여부 (기본값: SHEET_UPSERT 설정)
+
+    Returns:
+        tuple: (새로 추가된 예약 리스트, 기존 예약 리스트, 변경되어 갱신된 예약 리스트)
+    """
+    if not data:
+        print("저장할 데이터가 없습니다.")
+        return [], [], []
+
+    worksheet, index = open_backend()
+    try:
+        return sync_to_worksheet(worksheet, index, data, upsert=upsert)
+    finally:
+        index.close()
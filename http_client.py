@@ -0,0 +1,184 @@
+"""
+예약 API HTTP 클라이언트 모듈
+브라우저 로그인 후 BrowserContext의 쿠키/토큰을 requests 세션으로 옮겨,
+날짜별 예약 목록을 백엔드에서 직접 조회합니다.
+브라우저는 로그인(및 세션 만료 시 재로그인)에만 사용합니다.
+"""
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable
+import requests
+from requests.adapters import HTTPAdapter
+from api_capture import map_reservation_payload
+from scraper import load_price_data
+from reservation import Reservation
+from tracing import traced
+from config import RESERVATION_API_URL, AUTH_TOKEN_STORAGE_KEY
+
+
+class SessionExpiredError(Exception):
+    """API가 401/403을 반환해 재로그인이 필요한 경우"""
+
+
+class ReservationHttpClient:
+    """로그인된 브라우저의 인증 정보를 사용하는 예약 API 클라이언트"""
+
+    def __init__(self, storage_state: dict, max_workers: int = 8, api_url: str = None):
+        self.api_url = api_url or RESERVATION_API_URL
+        if not self.api_url:
+            raise RuntimeError("SCRAPE_MODE=http는 RESERVATION_API_URL 설정이 필요합니다.")
+
+        self.max_workers = max_workers
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({"Accept": "application/json"})
+        self.load_storage_state(storage_state)
+
+    def load_storage_state(self, storage_state: dict):
+        """storage state의 쿠키와 localStorage 토큰을 세션에 적용"""
+        self.session.cookies.clear()
+        for cookie in storage_state.get("cookies", []):
+            self.session.cookies.set(
+                cookie["name"],
+                cookie["value"],
+                domain=cookie.get("domain"),
+                path=cookie.get("path", "/")
+            )
+
+        token = find_auth_token(storage_state)
+        if token:
+            self.session.headers["Authorization"] = f"Bearer {token}"
+        else:
+            self.session.headers.pop("Authorization", None)
+
+    @traced(attrs=("reservation_date",))
+    def fetch_date(self, reservation_date: str):
+        """
+        한 날짜의 예약 목록 JSON을 조회합니다.
+
+        Raises:
+            SessionExpiredError: 인증이 만료된 경우 (401/403)
+        """
+        url = self.api_url.format(date=reservation_date)
+        response = self.session.get(url, timeout=15)
+        if response.status_code in (401, 403):
+            raise SessionExpiredError(f"HTTP {response.status_code}: {url}")
+        response.raise_for_status()
+        return response.json()
+
+    def fetch_dates(
+        self,
+        reservation_dates: list[str],
+        on_payload: Callable[[str, object], None]
+    ) -> tuple[list[str], dict[str, Exception]]:
+        """
+        여러 날짜를 최대 max_workers개까지 동시에 조회하고, 끝나는 순서대로 on_payload(날짜, 응답 JSON)를 호출합니다.
+        한 날짜의 조회 실패는 나머지 날짜 조회를 멈추지 않습니다.
+
+        Returns:
+            tuple: (인증 만료로 실패한 날짜 리스트, 그 밖의 오류로 실패한 날짜별 예외)
+        """
+        expired = []
+        failed = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self.fetch_date, reservation_date): reservation_date
+                for reservation_date in reservation_dates
+            }
+            for future in as_completed(futures):
+                reservation_date = futures[future]
+                try:
+                    payload = future.result()
+                except SessionExpiredError:
+                    expired.append(reservation_date)
+                    continue
+                except Exception as e:
+                    failed[reservation_date] = e
+                    continue
+                on_payload(reservation_date, payload)
+
+        return expired, failed
+
+
+def find_auth_token(storage_state: dict) -> str:
+    """
+    localStorage에서 인증 토큰을 찾습니다.
+    AUTH_TOKEN_STORAGE_KEY가 설정되어 있으면 해당 키를, 없으면 이름에 token이 들어간 키를 사용합니다.
+    """
+    for origin in storage_state.get("origins", []):
+        for item in origin.get("localStorage", []):
+            name = item.get("name", "")
+            if AUTH_TOKEN_STORAGE_KEY:
+                if name == AUTH_TOKEN_STORAGE_KEY:
+                    return item.get("value", "")
+            elif "token" in name.lower():
+                return item.get("value", "")
+    return ""
+
+
+def scrape_dates_http(
+    client: ReservationHttpClient,
+    dates: list[tuple[str, str]],
+    reauth: Callable[[], dict],
+    on_result: Callable[[str, list[Reservation]], None] | None = None
+) -> list[Reservation]:
+    """
+    HTTP 클라이언트로 날짜별 예약 내역을 조회합니다.
+    조회가 끝난 날짜부터 바로 변환해 on_result로 넘기므로, 중간에 실패해도 이미 받은 날짜는 저장됩니다.
+    인증이 만료된 날짜는 reauth()로 다시 로그인한 뒤 한 번 더 조회하고,
+    끝내 조회하지 못한 날짜는 실패 날짜로 출력합니다. (체크포인트에 남지 않으므로 --resume으로 다시 조회)
+
+    Args:
+        client: 예약 API 클라이언트
+        dates: (달력에서 클릭할 일, 예약 날짜) 튜플 리스트
+        reauth: 브라우저에서 다시 로그인하고 새 storage state를 반환하는 함수
+        on_result: (예약 날짜, 결과)를 조회가 끝나는 순서대로 받을 콜백
+
+    Returns:
+        list[Reservation]: 조회에 성공한 날짜의 예약 정보를 날짜 순서대로 병합한 리스트
+    """
+    reservation_dates = [reservation_date for _, reservation_date in dates]
+    price_catalog = load_price_data()
+    results = {}
+    failed = {}
+
+    def on_payload(reservation_date: str, payload):
+        try:
+            scraped_data = map_reservation_payload(payload, reservation_date)
+        except Exception as e:
+            print(f"  [ERROR] {reservation_date}: 응답 변환 실패 ({e})")
+            failed[reservation_date] = e
+            return
+        for reservation in scraped_data:
+            reservation.price = price_catalog.price(reservation.product)
+
+        if scraped_data:
+            print(f"  {reservation_date}: {len(scraped_data)}건 수집")
+        else:
+            print(f"  {reservation_date}: 예약 없음")
+        results[reservation_date] = scraped_data
+        if on_result is not None:
+            on_result(reservation_date, scraped_data)
+
+    expired, fetch_failed = client.fetch_dates(reservation_dates, on_payload)
+    failed.update(fetch_failed)
+
+    if expired:
+        print(f"  세션 만료로 {len(expired)}일 조회 실패, 재로그인 후 다시 조회합니다.")
+        client.load_storage_state(reauth())
+        expired, fetch_failed = client.fetch_dates(expired, on_payload)
+        failed.update(fetch_failed)
+        for reservation_date in expired:
+            failed[reservation_date] = SessionExpiredError("재로그인 후에도 인증 실패")
+
+    if failed:
+        print(f"[WARNING] 조회하지 못한 날짜 {len(failed)}일:")
+        for reservation_date in sorted(failed):
+            print(f"  {reservation_date}: {failed[reservation_date]}")
+
+    all_scraped_data = []
+    for reservation_date in reservation_dates:
+        all_scraped_data.extend(results.get(reservation_date, []))
+    return all_scraped_data
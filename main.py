@@ -1,19 +1,34 @@
 # main.py
-from datetime import datetime
+from datetime import datetime, date, timedelta
+from typing import Callable
+import argparse
+import asyncio
 import calendar
-from browser_controller import setup_browser
-from scraper import (
-    login,
-    click_date_button,
-    click_calendar_date,
-    has_reservations,
-    click_reservation_text,
-    click_team_button,
-    scrape_details
-)
-from gsheets_client import save_to_sheet
+from browser_controller import setup_browser, get_cdp_endpoint, close_browser, apply_page_profile
+from scraper import login, scrape_date
+from session_store import ensure_logged_in, ensure_logged_in_async, save_state
+from parallel_scraper import scrape_dates_parallel
+from http_client import ReservationHttpClient, scrape_dates_http
+from sheet_writer import SheetWriter, AsyncSheetWriter
+import async_crawler
+from playwright.async_api import async_playwright
+from checkpoint import CheckpointStore
+from scrape_schedule import AdaptiveScheduler
+from month_overview import OverviewHistory, prefetch_counts, prefetch_counts_async
+from snapshot_diff import ChangeTracker, ReservationDiff
 from slack_notifier import SlackNotifier
-from config import TARGET_URL, LOGIN_ID, LOGIN_PASSWORD, GOOGLE_SHEETS_URL
+from reservation import Reservation
+from replay import start_recording, stop_recording
+from resource_filter import resource_stats
+from sheet_api import api_stats
+from tracing import tracer
+from price_catalog import get_price_catalog
+from config import (
+    TARGET_URL, LOGIN_ID, LOGIN_PASSWORD, GOOGLE_SHEETS_URL,
+    SCRAPE_MODE, SCRAPE_WORKERS, HTTP_WORKERS, CHECKPOINT_DIR,
+    SCRAPE_DAYS_AHEAD, SCHEDULE_ADAPTIVE, SCHEDULE_NEAR_DAYS, SCHEDULE_MAX_INTERVAL, SCHEDULE_FILE,
+    OVERVIEW_SOURCE, OVERVIEW_SKIP_UNCHANGED, OVERVIEW_FILE, CHANGE_TRACKING, SNAPSHOT_FILE
+)
 
 
 def format_date(year: int, month: int, day: int) -> str:
@@ -31,16 +46,174 @@ def get_date_range_for_month() -> list[str]:
     return [str(day) for day in range(today.day, last_day + 1)]
 
 
-def main():
+def get_target_dates(today: date, days_ahead: int = SCRAPE_DAYS_AHEAD) -> list[date]:
+    """
+    조회할 날짜 목록을 반환합니다.
+    days_ahead가 0이면 오늘부터 이번 달 말일까지, 아니면 오늘부터 days_ahead일 뒤까지 (월 경계 포함)
+    """
+    if days_ahead <= 0:
+        return [date(today.year, today.month, int(day)) for day in get_date_range_for_month()]
+    return [today + timedelta(days=offset) for offset in range(days_ahead + 1)]
+
+
+def plan_target_dates(today: date) -> tuple[list[date], list[date], AdaptiveScheduler | None]:
+    """
+    Returns:
+        tuple: (조회 범위 전체 날짜, 이번 실행에서 조회할 날짜, 적응형 스케줄러(사용하지 않으면 None))
+    """
+    planned_dates = get_target_dates(today)
+    target_dates = planned_dates
+    print(f"검색 대상: {target_dates[0]} ~ {target_dates[-1]} ({len(target_dates)}일간)")
+
+    # 적응형 스케줄: 이번 실행에서 조회할 먼 날짜만 고름
+    scheduler = None
+    if SCHEDULE_ADAPTIVE:
+        scheduler = AdaptiveScheduler(SCHEDULE_FILE, SCHEDULE_NEAR_DAYS, SCHEDULE_MAX_INTERVAL)
+        target_dates, skipped_dates = scheduler.select(target_dates, today)
+        if skipped_dates:
+            print(f"적응형 스케줄: 변화가 적은 먼 날짜 {len(skipped_dates)}일은 이번 실행에서 건너뜀")
+    return planned_dates, target_dates, scheduler
+
+
+def skip_by_overview(
+    overview: OverviewHistory,
+    counts: dict[str, int | None],
+    dates: list[tuple[str, str]],
+    today: date
+) -> list[tuple[str, str]]:
+    """
+    월간 예약 현황으로 예약이 없는 날짜(OVERVIEW_SKIP_UNCHANGED면 지난 실행과 건수가 같은 날짜 포함)를 뺍니다.
+    """
+    due, empty, unchanged = overview.select(
+        [date.fromisoformat(reservation_date) for _, reservation_date in dates],
+        counts, today, OVERVIEW_SKIP_UNCHANGED
+    )
+    if empty or unchanged:
+        print(
+            f"월간 예약 현황: 예약 없는 날짜 {len(empty)}일, 건수가 같은 날짜 {len(unchanged)}일은 "
+            f"이번 실행에서 건너뜀 (조회 {len(due)}일)"
+        )
+    due_dates = {target.isoformat() for target in due}
+    return [d for d in dates if d[1] in due_dates]
+
+
+def track_cleared_dates(
+    tracker: ChangeTracker,
+    overview: OverviewHistory,
+    counts: dict[str, int | None],
+    planned_dates: list[date],
+    today: date
+):
+    """
+    월간 예약 현황에서 0건으로 확인되어 조회하지 않는 날짜(적응형 스케줄로 건너뛴 날짜 포함) 중
+    지난 실행에 예약이 있던 날짜를 예약 0건으로 변경 감지에 반영합니다. (예약이 모두 취소된 날짜)
+    """
+    _, empty, _ = overview.select(planned_dates, counts, today)
+    cleared = tracker.track_empty([target.isoformat() for target in empty])
+    if cleared:
+        print(f"월간 예약 현황: 지난 실행에 예약이 있던 {len(cleared)}일이 0건이 되어 취소로 반영합니다.")
+
+
+def replay_checkpoint(
+    checkpoint: CheckpointStore,
+    dates: list[tuple[str, str]],
+    put: Callable[[str, list[Reservation]], None]
+) -> tuple[list[tuple[str, str]], int]:
+    """
+    이어서 실행: 완료된 날짜는 저장된 결과를 put(예약 날짜, 결과)으로 시트 저장 단계에 넘기고 건너뜁니다.
+
+    Returns:
+        tuple: (남은 날짜 리스트, 재사용한 예약 건수)
+    """
+    completed = checkpoint.completed_dates()
+    if not completed:
+        return dates, 0
+
+    replayed_count = 0
+    for _, reservation_date in dates:
+        if reservation_date in completed:
+            replayed = checkpoint.get(reservation_date)
+            replayed_count += len(replayed)
+            put(reservation_date, replayed)
+    dates = [d for d in dates if d[1] not in completed]
+    print(f"\n체크포인트에서 {len(completed)}일 결과를 재사용합니다. (남은 날짜 {len(dates)}일)")
+    return dates, replayed_count
+
+
+def send_daily_summary(
+    today_str: str,
+    new_reservations: list[Reservation],
+    existing_reservations: list[Reservation],
+    modified_reservations: list[Reservation],
+    changes: ReservationDiff | None = None
+):
+    """
+    당일 예약현황 + 새로 추가된 예약(변경 감지 시 취소/변경된 예약 포함)을 Slack으로 보내고 실행 결과를 출력합니다.
+    """
+    slack = SlackNotifier()
+    changes = changes or ReservationDiff()
+
+    # 당일 예약 필터링 (변경 감지 시 지난 실행과 같은 예약은 시트 저장 단계를 거치지 않으므로 함께 포함)
+    today_reservations = [
+        r for r in (new_reservations + existing_reservations + modified_reservations + changes.unchanged)
+        if r.date == today_str
+    ]
+
+    # Slack 메시지 생성 및 전송
+    message = slack.format_daily_summary_message(
+        today_reservations=today_reservations,
+        new_reservations=new_reservations,
+        today_date=today_str,
+        notify_everyone=bool(new_reservations or changes.removed),
+        sheet_url=GOOGLE_SHEETS_URL or None,
+        removed_reservations=changes.removed,
+        changed_reservations=changes.modified
+    )
+    slack.send_message(message)
+
+    print("\n" + "=" * 50)
+    print("모든 작업 완료!")
+    print(f"  - 당일({today_str}) 예약: {len(today_reservations)}건")
+    print(f"  - 새로 추가된 예약: {len(new_reservations)}건")
+    print(f"  - 변경된 예약: {len(modified_reservations)}건")
+    if changes.removed or changes.modified:
+        print(f"  - 지난 실행 대비 취소 {len(changes.removed)}건, 변경 {len(changes.modified)}건")
+    print("=" * 50)
+
+
+def send_failure(error: Exception):
+    """실패 알림 (알림 전송 오류는 무시)"""
+    try:
+        slack = SlackNotifier()
+        slack.send_message(f"🚨 크롤링 작업 실패: {error}")
+    except Exception:
+        pass
+
+
+def print_run_summaries():
+    """실행 종료 시 단계별 소요 시간(대기 포함)/리소스/시트 API/가격표 요약 출력"""
+    tracer.close()
+    tracer.print_summary()
+    resource_stats.print_summary()
+    api_stats.print_summary()
+    get_price_catalog().report_unmatched()
+
+
+def main(resume: bool = False, record: bool = False):
     """
     메인 실행 함수
     1. 브라우저 실행
     2. 로그인
-    3. 오늘부터 월말까지 모든 날짜 순회
+    3. 오늘부터 월말(또는 SCRAPE_DAYS_AHEAD일 뒤)까지 날짜 순회
+       (OVERVIEW_SOURCE 설정 시 월간 예약 현황을 먼저 읽어 예약 없는 날짜는 건너뜀)
     4. 각 날짜별 예약 데이터 스크래핑
-    5. Google Sheets에 중복 제외 저장
-    6. Slack 알림 (당일 예약현황 + 새로 추가된 예약 구분)
+    5. 날짜별 결과를 백그라운드에서 Google Sheets에 중복 제외 저장
+    6. Slack 알림 (당일 예약현황 + 새로 추가된 예약 구분, CHANGE_TRACKING 시 취소/변경된 예약 포함)
     7. 브라우저 종료
+
+    Args:
+        resume: True면 같은 실행 구간에서 이미 완료된 날짜는 건너뛰고 저장된 결과를 재사용
+        record: True면 트래픽(HAR)과 날짜별 화면을 REPLAY_DIR에 녹화 (로그인부터 순차 실행)
     """
     today = datetime.now()
     today_str = format_date(today.year, today.month, today.day)
@@ -48,116 +221,289 @@ def main():
     print("=" * 50)
     print("Ktourstory 예약 정보 크롤링 시작")
     print("=" * 50)
+    tracer.start()
 
     # 날짜 범위 계산
-    target_days = get_date_range_for_month()
-    print(f"검색 대상: {today.month}월 {target_days[0]}일 ~ {target_days[-1]}일 ({len(target_days)}일간)")
+    planned_dates, target_dates, scheduler = plan_target_dates(today.date())
 
     # 1. 브라우저 실행
     print("\n[1/6] 브라우저 실행 중...")
     page, browser, context, driver = setup_browser()
+    browser_context = context
+    if record:
+        # 녹화용 새 컨텍스트에서 로그인부터 진행
+        context, page = start_recording(browser)
+        apply_page_profile(context, page)
+        print("녹화 모드: 트래픽과 날짜별 화면을 저장합니다.")
     print("[OK] 브라우저 실행 완료")
 
-    all_scraped_data = []  # 전체 스크래핑 데이터
+    # 실행 구간(오늘 ~ 마지막 날짜)별 체크포인트
+    checkpoint = CheckpointStore(
+        CHECKPOINT_DIR,
+        f"{today_str}_{target_dates[-1].isoformat()}",
+        resume=resume
+    )
+
+    # 월간 예약 현황 이력 (녹화 시에는 모든 날짜를 녹화하도록 사용하지 않음)
+    overview = OverviewHistory(OVERVIEW_FILE) if OVERVIEW_SOURCE != "off" and not record else None
+    overview_counts = {}
+
+    # 날짜별 결과를 받아 구글 시트에 저장하는 백그라운드 작성기
+    writer = SheetWriter().start()
+    tracker = ChangeTracker(SNAPSHOT_FILE) if CHANGE_TRACKING else None
+    scraped_count = 0  # 전체 스크래핑 건수
+
+    def put_rows(reservation_date: str, scraped_data: list[Reservation]):
+        """변경 감지 시 지난 실행과 같은 예약은 빼고 시트 작성기로 넘김"""
+        writer.put(tracker.track(reservation_date, scraped_data) if tracker else scraped_data)
+
+    def on_result(reservation_date: str, scraped_data: list[Reservation]):
+        nonlocal scraped_count
+        checkpoint.record(reservation_date, scraped_data)
+        if scheduler is not None:
+            scheduler.record(reservation_date, len(scraped_data), today.date())
+        scraped_count += len(scraped_data)
+        put_rows(reservation_date, scraped_data)
 
     try:
         # 2. 타겟 URL로 이동 및 로그인
         print("\n[2/6] 로그인 중...")
-        page.goto(TARGET_URL)
-        login(page, LOGIN_ID, LOGIN_PASSWORD)
-        page.wait_for_load_state("networkidle")
-        page.wait_for_timeout(3000)
-        print("[OK] 로그인 완료")
+        if record:
+            # 재현 시 로그인 과정도 측정할 수 있도록 저장된 세션을 쓰지 않음
+            page.goto(TARGET_URL)
+            login(page, LOGIN_ID, LOGIN_PASSWORD)
+            login_result = "login"
+        else:
+            login_result = ensure_logged_in(page, context, LOGIN_ID, LOGIN_PASSWORD)
+        if login_result == "login":
+            print("[OK] 로그인 완료")
+        else:
+            print("[OK] 저장된 세션으로 로그인 생략")
 
         # 3. 각 날짜별 스크래핑
-        print(f"\n[3/6] 날짜별 예약 조회 중... (총 {len(target_days)}일)")
-        for idx, target_day in enumerate(target_days, 1):
-            reservation_date = format_date(today.year, today.month, int(target_day))
-            print(f"\n  [{idx}/{len(target_days)}] {reservation_date} 조회 중...")
-
-            # 날짜 선택
-            click_date_button(page)
-            page.wait_for_timeout(1000)
-            click_calendar_date(page, target_day)
-            page.wait_for_load_state("networkidle")
-            page.wait_for_timeout(2000)
-
-            # 예약 내역 확인
-            if not has_reservations(page):
-                print(f"  [{idx}/{len(target_days)}] {reservation_date}: 예약 없음")
-                continue
-
-            # 예약 상세 조회
-            click_reservation_text(page)
-            page.wait_for_timeout(2000)
-            click_team_button(page)
-            page.wait_for_timeout(2000)
-
-            # 데이터 스크래핑
-            scraped_data = scrape_details(page, reservation_date)
-            all_scraped_data.extend(scraped_data)
-            print(f"  [{idx}/{len(target_days)}] {reservation_date}: {len(scraped_data)}건 수집")
-
-            # 다음 날짜 조회를 위해 페이지 초기화
-            page.goto(TARGET_URL)
-            page.wait_for_load_state("networkidle")
-            page.wait_for_timeout(2000)
+        dates = [
+            (str(target.day), format_date(target.year, target.month, target.day))
+            for target in target_dates
+        ]
+
+        # 이어서 실행: 완료된 날짜는 저장된 결과를 시트 저장 단계로 넘기고 건너뜀
+        dates, replayed_count = replay_checkpoint(checkpoint, dates, put_rows)
+        scraped_count += replayed_count
+
+        # 월간 예약 현황으로 예약 없는 날짜 건너뛰기
+        if overview is not None:
+            overview_counts = prefetch_counts(page, context.storage_state(), planned_dates)
+            dates = skip_by_overview(overview, overview_counts, dates, today.date())
+            if tracker is not None:
+                track_cleared_dates(tracker, overview, overview_counts, planned_dates, today.date())
 
-        print(f"\n[4/6] 전체 스크래핑 완료 (총 {len(all_scraped_data)}건)")
+        if SCRAPE_MODE == "http" and not record:
+            print(f"\n[3/6] 날짜별 예약 조회 중... (총 {len(dates)}일, API 직접 호출 {HTTP_WORKERS}개 동시)")
+            client = ReservationHttpClient(context.storage_state(), max_workers=HTTP_WORKERS)
+            # 재로그인 전까지 브라우저는 필요 없으므로 SPA를 내려 메모리를 반환
+            page.goto("about:blank")
 
-        # 4. 데이터 저장
-        print("\n[5/6] Google Sheets에 데이터 저장 중...")
-        if all_scraped_data:
-            new_reservations, existing_reservations = save_to_sheet(all_scraped_data)
+            def reauth() -> dict:
+                page.goto(TARGET_URL)
+                login(page, LOGIN_ID, LOGIN_PASSWORD)
+                state = context.storage_state()
+                save_state(state)
+                page.goto("about:blank")
+                return state
+
+            scrape_dates_http(client, dates, reauth, on_result=on_result)
+        elif SCRAPE_WORKERS > 1 and len(dates) > 1 and not record:
+            print(f"\n[3/6] 날짜별 예약 조회 중... (총 {len(dates)}일, 페이지 {SCRAPE_WORKERS}개 병렬)")
+            scrape_dates_parallel(
+                get_cdp_endpoint(), context.storage_state(), dates, SCRAPE_WORKERS,
+                on_result=on_result
+            )
         else:
-            new_reservations, existing_reservations = [], []
+            print(f"\n[3/6] 날짜별 예약 조회 중... (총 {len(dates)}일)")
+            for idx, (target_day, reservation_date) in enumerate(dates, 1):
+                print(f"\n  [{idx}/{len(dates)}] {reservation_date} 조회 중...")
+                scraped_data = scrape_date(page, target_day, reservation_date)
+                on_result(reservation_date, scraped_data)
+                if not scraped_data:
+                    print(f"  [{idx}/{len(dates)}] {reservation_date}: 예약 없음")
+                    continue
+                print(f"  [{idx}/{len(dates)}] {reservation_date}: {len(scraped_data)}건 수집")
+
+        print(f"\n[4/6] 전체 스크래핑 완료 (총 {scraped_count}건)")
+
+        # 4. 남은 데이터 저장 마무리
+        print("\n[5/6] Google Sheets에 남은 데이터 저장 중...")
+        writer.close()
+        new_reservations = writer.new_reservations
+        existing_reservations = writer.existing_reservations
+        modified_reservations = writer.modified_reservations
+        if overview is not None:
+            overview.save(overview_counts, today.date())
+        changes = None
+        if tracker is not None:
+            changes = tracker.finalize()
+            tracker.commit(today.date())
         print("[OK] 데이터 저장 완료")
 
         # 5. Slack 알림 전송
         print("\n[6/6] Slack 알림 전송 중...")
-        slack = SlackNotifier()
-
-        # 당일 예약 필터링
-        today_reservations = [
-            r for r in (new_reservations + existing_reservations)
-            if r.get("날짜") == today_str
-        ]
-
-        # Slack 메시지 생성 및 전송
-        message = slack.format_daily_summary_message(
-            today_reservations=today_reservations,
-            new_reservations=new_reservations,
-            today_date=today_str,
-            notify_everyone=bool(new_reservations),
-            sheet_url=GOOGLE_SHEETS_URL or None
-        )
-        slack.send_message(message)
-
-        print("\n" + "=" * 50)
-        print("모든 작업 완료!")
-        print(f"  - 당일({today_str}) 예약: {len(today_reservations)}건")
-        print(f"  - 새로 추가된 예약: {len(new_reservations)}건")
-        print("=" * 50)
+        send_daily_summary(today_str, new_reservations, existing_reservations, modified_reservations, changes)
 
     except Exception as e:
         print(f"\n[ERROR] 오류 발생: {e}")
-        try:
-            slack = SlackNotifier()
-            slack.send_message(f"🚨 크롤링 작업 실패: {e}")
-        except Exception:
-            pass
+        # 오류 전까지 수집한 날짜는 시트에 남김
+        writer.close(raise_error=False)
+        send_failure(e)
         raise
 
     finally:
+        if tracker is not None:
+            tracker.close()
+        print_run_summaries()
+
         print("\n브라우저 종료 중...")
-        try:
-            context.close()
-            browser.close()
-            driver.quit()
-        except Exception:
-            pass
+        if record:
+            stop_recording(context)
+        close_browser(browser_context, browser, driver)
         print("[OK] 브라우저 종료 완료")
 
 
+async def main_async(resume: bool = False):
+    """
+    main()의 asyncio 버전 (python main.py --async)
+    날짜 조회(최대 SCRAPE_WORKERS개 페이지)와 구글 시트 작성기가 하나의 이벤트 루프에서 동시에 실행되고,
+    Slack 전송은 태스크로 시작해 예약 현황 이력/스냅샷 저장, 브라우저 종료와 겹쳐 실행합니다.
+    SCRAPE_MODE=http와 녹화는 지원하지 않습니다.
+
+    Args:
+        resume: True면 같은 실행 구간에서 이미 완료된 날짜는 건너뛰고 저장된 결과를 재사용
+    """
+    today = datetime.now()
+    today_str = format_date(today.year, today.month, today.day)
+
+    print("=" * 50)
+    print("Ktourstory 예약 정보 크롤링 시작 (async)")
+    print("=" * 50)
+    tracer.start()
+
+    planned_dates, target_dates, scheduler = plan_target_dates(today.date())
+    checkpoint = CheckpointStore(
+        CHECKPOINT_DIR,
+        f"{today_str}_{target_dates[-1].isoformat()}",
+        resume=resume
+    )
+
+    overview = OverviewHistory(OVERVIEW_FILE) if OVERVIEW_SOURCE != "off" else None
+    overview_counts = {}
+
+    async with async_playwright() as playwright:
+        print("\n[1/6] 브라우저 실행 중...")
+        page, browser, context, driver = await async_crawler.setup_browser(playwright)
+        print("[OK] 브라우저 실행 완료")
+
+        writer = AsyncSheetWriter().start()
+        tracker = ChangeTracker(SNAPSHOT_FILE) if CHANGE_TRACKING else None
+        scraped_count = 0
+        notifications = []  # Slack 전송 태스크
+
+        def put_rows(reservation_date: str, scraped_data: list[Reservation]):
+            writer.put(tracker.track(reservation_date, scraped_data) if tracker else scraped_data)
+
+        def on_result(reservation_date: str, scraped_data: list[Reservation]):
+            nonlocal scraped_count
+            checkpoint.record(reservation_date, scraped_data)
+            if scheduler is not None:
+                scheduler.record(reservation_date, len(scraped_data), today.date())
+            scraped_count += len(scraped_data)
+            put_rows(reservation_date, scraped_data)
+
+        try:
+            print("\n[2/6] 로그인 중...")
+            login_result = await ensure_logged_in_async(page, context, LOGIN_ID, LOGIN_PASSWORD)
+            if login_result == "login":
+                print("[OK] 로그인 완료")
+            else:
+                print("[OK] 저장된 세션으로 로그인 생략")
+
+            dates = [
+                (str(target.day), format_date(target.year, target.month, target.day))
+                for target in target_dates
+            ]
+            dates, replayed_count = replay_checkpoint(checkpoint, dates, put_rows)
+            scraped_count += replayed_count
+
+            if overview is not None:
+                overview_counts = await prefetch_counts_async(
+                    page, await context.storage_state(), planned_dates
+                )
+                dates = skip_by_overview(overview, overview_counts, dates, today.date())
+                if tracker is not None:
+                    track_cleared_dates(tracker, overview, overview_counts, planned_dates, today.date())
+
+            print(f"\n[3/6] 날짜별 예약 조회 중... (총 {len(dates)}일, 페이지 {SCRAPE_WORKERS}개 동시)")
+            if dates:
+                await async_crawler.scrape_dates(
+                    browser, page, await context.storage_state(), dates, SCRAPE_WORKERS,
+                    on_result=on_result
+                )
+            print(f"\n[4/6] 전체 스크래핑 완료 (총 {scraped_count}건)")
+
+            print("\n[5/6] Google Sheets에 남은 데이터 저장 중...")
+            await writer.close()
+            changes = tracker.finalize() if tracker is not None else None
+
+            # Slack 알림은 태스크로 보내고, 전송하는 동안 예약 현황 이력/스냅샷 저장과 브라우저 종료를 진행
+            print("\n[6/6] Slack 알림 전송 시작...")
+            notifications.append(asyncio.create_task(asyncio.to_thread(
+                send_daily_summary, today_str,
+                writer.new_reservations, writer.existing_reservations, writer.modified_reservations, changes
+            )))
+            if overview is not None:
+                overview.save(overview_counts, today.date())
+            if tracker is not None:
+                tracker.commit(today.date())
+            print("[OK] 데이터 저장 완료")
+
+        except Exception as e:
+            print(f"\n[ERROR] 오류 발생: {e}")
+            await writer.close(raise_error=False)
+            notifications.append(asyncio.create_task(asyncio.to_thread(send_failure, e)))
+            raise
+
+        finally:
+            if tracker is not None:
+                tracker.close()
+
+            print("\n브라우저 종료 중...")
+            await async_crawler.close_browser(context, browser, driver)
+            print("[OK] 브라우저 종료 완료")
+
+            await asyncio.gather(*notifications)
+            print_run_summaries()
+
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Ktourstory 예약 정보 크롤러")
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="같은 실행 구간에서 이미 완료된 날짜는 건너뛰고 체크포인트의 결과를 재사용"
+    )
+    parser.add_argument(
+        "--record",
+        action="store_true",
+        help="오프라인 재현/벤치마크용으로 트래픽(HAR)과 날짜별 화면을 REPLAY_DIR에 녹화"
+    )
+    parser.add_argument(
+        "--async",
+        dest="use_async",
+        action="store_true",
+        help="playwright async API로 날짜 조회, 시트 저장, Slack 전송을 하나의 이벤트 루프에서 동시에 실행"
+    )
+    args = parser.parse_args()
+    if args.use_async:
+        if args.record or SCRAPE_MODE == "http":
+            parser.error("--async는 --record와 SCRAPE_MODE=http를 지원하지 않습니다.")
+        asyncio.run(main_async(resume=args.resume))
+    else:
+        main(resume=args.resume, record=args.record)
\ No newline at end of file
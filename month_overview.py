@@ -0,0 +1,244 @@
+"""
+월간 예약 현황 미리 조회 모듈
+실행마다 한 번, 조회 범위 전체의 날짜별 예약 건수를 달력의 날짜 표시(배지) 또는 월간 현황 API로 먼저 읽어
+예약이 없는 날짜(와 선택 시 지난 실행과 건수가 같은 날짜)는 날짜별 조회에서 건너뜁니다.
+오늘 날짜는 Slack 당일 현황에 쓰이므로 항상 조회합니다.
+
+건수 표기:
+    int: 예약 건수 (0이면 예약 없음, 건너뛰는 것은 명시적으로 0인 날짜뿐)
+    None: 예약은 있지만 건수를 알 수 없음 (숫자 없는 점 표시 등)
+    날짜가 없으면: 알 수 없음 → 조회 (표시를 하나도 찾지 못한 달 포함)
+"""
+from datetime import date
+from itertools import groupby
+from pathlib import Path
+import json
+import os
+import re
+from playwright.sync_api import Page
+from scraper import click_date_button_async, navigate_calendar_to_month_async, wait_for_backdrop_gone_async
+from sync_bridge import PageApi, SyncPage, run_sync, to_thread
+from http_client import ReservationHttpClient
+from tracing import traced
+from config import OVERVIEW_SOURCE, OVERVIEW_API_URL, OVERVIEW_DAY_MARKER_SELECTOR
+
+# 월간 현황 API 응답에서 날짜/건수를 찾을 필드 후보 (실제 응답 구조에 맞게 수정)
+DATE_FIELDS = ("date", "day", "reservationDate")
+COUNT_FIELDS = ("count", "total", "reservationCount", "cnt")
+WRAPPER_FIELDS = ("data", "items", "result")
+
+# 열린 달력에서 이번 달 날짜 버튼마다 [날짜 텍스트, 표시 텍스트(없으면 null)]를 반환
+# 표시는 날짜 버튼 안이나 버튼을 감싼 Badge 안에서 찾습니다.
+DAY_MARKERS_SCRIPT = """
+([markerSelector]) => Array.from(document.querySelectorAll('button.MuiPickersDay-root'))
+    .filter(button => !button.classList.contains('MuiPickersDay-dayOutsideMonth'))
+    .map(button => {
+        const badge = button.closest('.MuiBadge-root');
+        const marker = button.querySelector(markerSelector) || (badge && badge.querySelector(markerSelector));
+        const hidden = !marker || marker.classList.contains('MuiBadge-invisible');
+        return [button.textContent.trim(), hidden ? null : marker.textContent.trim()];
+    })
+"""
+
+
+def normalize_date(value) -> str | None:
+    """"2026-01-18", "2026-01-18T00:00:00" 형식에서 YYYY-MM-DD를 반환 (아니면 None)"""
+    match = re.match(r"\d{4}-\d{2}-\d{2}", str(value))
+    return match.group(0) if match else None
+
+
+def count_of(value) -> int | None:
+    """건수 값(숫자, 숫자 문자열, 예약 리스트, 건수 필드를 가진 객체)을 정수로 변환 (알 수 없으면 None)"""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        return int(value) if value.strip().isdigit() else None
+    if isinstance(value, list):
+        return len(value)
+    if isinstance(value, dict):
+        for field in COUNT_FIELDS:
+            if field in value:
+                return count_of(value[field])
+        lists = [item for item in value.values() if isinstance(item, list)]
+        return len(lists[0]) if len(lists) == 1 else None
+    return None
+
+
+def parse_overview_payload(payload) -> dict[str, int | None]:
+    """
+    월간 현황 API 응답을 날짜별 건수로 변환합니다.
+    {"2026-01-18": 3, ...}처럼 날짜를 키로 쓰는 객체와 [{"date": ..., "count": ...}, ...] 리스트를 지원하고,
+    {"data": ...}처럼 감싼 응답은 안쪽을 읽습니다.
+    """
+    if isinstance(payload, dict):
+        for field in WRAPPER_FIELDS:
+            if isinstance(payload.get(field), (dict, list)):
+                return parse_overview_payload(payload[field])
+        return {
+            reservation_date: count_of(value)
+            for key, value in payload.items()
+            if (reservation_date := normalize_date(key))
+        }
+
+    counts = {}
+    if isinstance(payload, list):
+        for item in payload:
+            if not isinstance(item, dict):
+                continue
+            reservation_date = next(
+                (normalize_date(item[field]) for field in DATE_FIELDS if field in item), None
+            )
+            if reservation_date:
+                counts[reservation_date] = count_of(item)
+    return counts
+
+
+def marker_count(text: str | None) -> int | None:
+    """달력 날짜 표시 텍스트를 건수로 변환 (표시 없음: 0, 숫자 없는 표시: None)"""
+    if text is None:
+        return 0
+    digits = re.sub(r"\D", "", text)
+    return int(digits) if digits else None
+
+
+def month_marker_counts(year: int, month: int, markers: list) -> dict[str, int | None]:
+    """
+    한 달의 [날짜 텍스트, 표시 텍스트] 목록을 날짜별 건수로 변환합니다.
+    그 달에 표시가 하나도 없으면 셀렉터가 틀렸거나 화면 구조가 바뀐 것일 수 있으므로
+    예약 없음(0)으로 보지 않고 빈 딕셔너리(알 수 없음 → 모든 날짜 조회)를 반환합니다.
+    """
+    if not any(text is not None for _, text in markers):
+        print(f"[WARNING] {year}-{month:02d} 달력에서 날짜 표시를 찾지 못해 건수를 알 수 없는 것으로 처리합니다.")
+        return {}
+    return {
+        date(year, month, int(day)).isoformat(): marker_count(text)
+        for day, text in markers
+        if day.isdigit()
+    }
+
+
+def fetch_api_counts(storage_state: dict, target_dates: list[date]) -> dict[str, int | None]:
+    """로그인 세션으로 OVERVIEW_API_URL({start}, {end})을 한 번 호출해 날짜별 건수를 읽습니다."""
+    if not OVERVIEW_API_URL:
+        raise RuntimeError("OVERVIEW_SOURCE=api는 OVERVIEW_API_URL 설정이 필요합니다.")
+    client = ReservationHttpClient(storage_state, max_workers=1, api_url=OVERVIEW_API_URL)
+    url = OVERVIEW_API_URL.format(start=target_dates[0].isoformat(), end=target_dates[-1].isoformat())
+    response = client.session.get(url, timeout=15)
+    response.raise_for_status()
+    return parse_overview_payload(response.json())
+
+
+async def read_calendar_counts_async(page: PageApi, target_dates: list[date]) -> dict[str, int | None]:
+    """
+    날짜 선택 달력을 열어 조회 범위의 달마다 날짜 표시(OVERVIEW_DAY_MARKER_SELECTOR)를 읽고 닫습니다.
+    날짜를 선택하지 않으므로 현재 화면은 바뀌지 않습니다.
+    """
+    if not OVERVIEW_DAY_MARKER_SELECTOR:
+        raise RuntimeError("OVERVIEW_SOURCE=calendar는 OVERVIEW_DAY_MARKER_SELECTOR 설정이 필요합니다.")
+
+    counts = {}
+    await click_date_button_async(page)
+    try:
+        for (year, month), _ in groupby(target_dates, key=lambda d: (d.year, d.month)):
+            await navigate_calendar_to_month_async(page, year, month)
+            markers = await page.evaluate(DAY_MARKERS_SCRIPT, [OVERVIEW_DAY_MARKER_SELECTOR])
+            counts.update(month_marker_counts(year, month, markers))
+    finally:
+        await page.keyboard.press("Escape")
+        await wait_for_backdrop_gone_async(page, "calendar_closed")
+    return counts
+
+
+def read_calendar_counts(page: Page, target_dates: list[date]) -> dict[str, int | None]:
+    """read_calendar_counts_async()의 sync 진입점"""
+    return run_sync(read_calendar_counts_async(SyncPage(page), target_dates))
+
+
+@traced()
+async def prefetch_counts_async(
+    page: PageApi,
+    storage_state: dict,
+    target_dates: list[date]
+) -> dict[str, int | None]:
+    """
+    OVERVIEW_SOURCE에 따라 조회 범위의 날짜별 예약 건수를 읽습니다. (API 호출은 이벤트 루프 밖에서 실행)
+    실패하면 경고 후 빈 딕셔너리를 반환해 모든 날짜를 그대로 조회합니다.
+    """
+    if not target_dates:
+        return {}
+    try:
+        if OVERVIEW_SOURCE == "api":
+            return await to_thread(fetch_api_counts, storage_state, target_dates)
+        if OVERVIEW_SOURCE == "calendar":
+            return await read_calendar_counts_async(page, target_dates)
+        raise RuntimeError(f"알 수 없는 OVERVIEW_SOURCE: {OVERVIEW_SOURCE}")
+    except Exception as e:
+        print(f"[WARNING] 월간 예약 현황 조회 실패, 모든 날짜를 조회합니다: {e}")
+        return {}
+
+
+def prefetch_counts(page: Page, storage_state: dict, target_dates: list[date]) -> dict[str, int | None]:
+    """prefetch_counts_async()의 sync 진입점"""
+    return run_sync(prefetch_counts_async(SyncPage(page), storage_state, target_dates))
+
+
+class OverviewHistory:
+    """지난 실행의 날짜별 예약 건수로 이번 실행에서 건너뛸 날짜를 고르는 기록"""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self._counts = self._load()
+
+    def _load(self) -> dict:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            print(f"[WARNING] 예약 현황 이력 로드 실패, 건수 비교 없이 진행합니다: {e}")
+            return {}
+
+    def select(
+        self,
+        targets: list[date],
+        counts: dict[str, int | None],
+        today: date,
+        skip_unchanged: bool = False
+    ) -> tuple[list[date], list[date], list[date]]:
+        """
+        Returns:
+            tuple: (조회할 날짜, 예약이 없어 건너뛸 날짜, 지난 실행과 건수가 같아 건너뛸 날짜)
+        """
+        due, empty, unchanged = [], [], []
+        for target in targets:
+            key = target.isoformat()
+            count = counts.get(key)
+            if target == today or key not in counts:
+                due.append(target)
+            elif count == 0:
+                empty.append(target)
+            elif skip_unchanged and count is not None and self._counts.get(key) == count:
+                unchanged.append(target)
+            else:
+                due.append(target)
+        return due, empty, unchanged
+
+    def save(self, counts: dict[str, int | None], today: date):
+        """이번 실행의 건수를 기록 (건수를 알 수 없는 날짜는 비교하지 않도록 지우고, 지난 날짜는 정리)"""
+        today_str = today.isoformat()
+        merged = {d: c for d, c in self._counts.items() if d >= today_str}
+        for reservation_date, count in counts.items():
+            if count is None:
+                merged.pop(reservation_date, None)
+            elif reservation_date >= today_str:
+                merged[reservation_date] = count
+        self._counts = merged
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(merged, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,134 @@
+"""
+병렬 스크래핑 모듈
+로그인된 브라우저의 인증 상태(storage state)를 여러 페이지에 공유하고,
+작업 큐로 날짜를 나눠 동시에 스크래핑합니다.
+
+Playwright sync API 객체는 스레드 간에 공유할 수 없으므로,
+각 워커 스레드는 같은 CDP 엔드포인트에 별도로 연결해 자신의 페이지를 사용합니다.
+"""
+import queue
+import threading
+from typing import Callable
+from playwright.sync_api import sync_playwright
+from scraper import scrape_date, wait_for_page_ready
+from browser_controller import apply_page_profile
+from reservation import Reservation
+from config import TARGET_URL
+
+
+def _worker(
+    worker_id: int,
+    cdp_endpoint: str,
+    storage_state: dict,
+    tasks: queue.Queue,
+    results: dict,
+    errors: list,
+    lock: threading.Lock,
+    release: Callable[[], None]
+):
+    """작업 큐에서 날짜를 꺼내 스크래핑하는 워커"""
+    playwright = sync_playwright().start()
+    context = None
+    try:
+        browser = playwright.chromium.connect_over_cdp(cdp_endpoint)
+        context = browser.new_context(storage_state=storage_state)
+        page = context.new_page()
+        apply_page_profile(context, page)
+        page.goto(TARGET_URL)
+        wait_for_page_ready(page, "worker_page_ready")
+
+        while True:
+            try:
+                idx, target_day, reservation_date = tasks.get_nowait()
+            except queue.Empty:
+                break
+
+            with lock:
+                # 다른 워커에서 오류가 났으면 남은 작업은 처리하지 않음
+                if errors:
+                    break
+
+            try:
+                scraped_data = scrape_date(page, target_day, reservation_date)
+            except Exception as e:
+                with lock:
+                    errors.append((reservation_date, e))
+                break
+
+            with lock:
+                results[idx] = scraped_data
+                release()
+            if scraped_data:
+                print(f"  [W{worker_id}] {reservation_date}: {len(scraped_data)}건 수집")
+            else:
+                print(f"  [W{worker_id}] {reservation_date}: 예약 없음")
+    except Exception as e:
+        with lock:
+            errors.append((f"worker {worker_id}", e))
+    finally:
+        try:
+            if context is not None:
+                context.close()
+        except Exception:
+            pass
+        playwright.stop()
+
+
+def scrape_dates_parallel(
+    cdp_endpoint: str,
+    storage_state: dict,
+    dates: list[tuple[str, str]],
+    workers: int,
+    on_result: Callable[[str, list[Reservation]], None] | None = None
+) -> list[Reservation]:
+    """
+    여러 페이지에서 날짜별 스크래핑을 동시에 수행합니다.
+
+    Args:
+        cdp_endpoint: 로그인된 브라우저의 CDP 엔드포인트
+        storage_state: 로그인된 BrowserContext의 storage state (쿠키 + localStorage)
+        dates: (달력에서 클릭할 일, 예약 날짜) 튜플 리스트
+        workers: 동시에 사용할 페이지 수
+        on_result: (예약 날짜, 결과)를 날짜 순서대로 받을 콜백 (앞선 날짜가 끝나는 대로 호출)
+
+    Returns:
+        list[Reservation]: 날짜 순서대로 병합된 예약 정보 리스트
+    """
+    tasks = queue.Queue()
+    for idx, (target_day, reservation_date) in enumerate(dates):
+        tasks.put((idx, target_day, reservation_date))
+
+    results = {}
+    errors = []
+    lock = threading.Lock()
+    released = 0  # on_result로 넘긴 날짜 수
+
+    def release():
+        """앞에서부터 연속으로 끝난 날짜의 결과를 on_result로 넘김 (lock 안에서 호출)"""
+        nonlocal released
+        while released in results:
+            if on_result is not None:
+                on_result(dates[released][1], results[released])
+            released += 1
+
+    threads = [
+        threading.Thread(
+            target=_worker,
+            args=(worker_id, cdp_endpoint, storage_state, tasks, results, errors, lock, release),
+            daemon=True
+        )
+        for worker_id in range(1, min(workers, len(dates)) + 1)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    if errors:
+        failed_at, error = errors[0]
+        raise RuntimeError(f"병렬 스크래핑 실패 ({failed_at}): {error}") from error
+
+    all_scraped_data = []
+    for idx in range(len(dates)):
+        all_scraped_data.extend(results.get(idx, []))
+    return all_scraped_data
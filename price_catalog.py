@@ -0,0 +1,164 @@
+"""
+가격 카탈로그 모듈
+price.json을 한 번만 읽어 정규화된 상품명 인덱스를 만들고(파일 수정 시각이 바뀐 경우에만 다시 읽음),
+예약상품 문자열별 가격 계산 결과를 캐시합니다.
+정확히 일치하는 상품이 없으면 별칭 → 가장 긴 접두어 순으로 찾습니다.
+접두어 뒤에는 괄호 설명만 허용하고("CUT + STYLING (EN)"), "+ PERM"처럼 상품이 더 붙은 이름은 매칭하지 않습니다.
+별칭/접두어로 찾은 상품과 끝내 찾지 못한 상품은 모아서 보고합니다.
+
+price.json 형식:
+    {
+        "CUT + STYLING": 66000,
+        "DEFAULT": 0,
+        "ALIASES": {"HAIR CUT + STYLING": "CUT + STYLING"}   (선택)
+    }
+"""
+import json
+import os
+import re
+import threading
+from config import PRICE_FILE
+
+DEFAULT_KEY = "DEFAULT"
+ALIASES_KEY = "ALIASES"
+
+# "AB: " 같은 채널 접두어
+CHANNEL_PREFIX_RE = re.compile(r"^[^:]*:\s+")
+# 끝의 " X 숫자" 수량 표기
+QUANTITY_RE = re.compile(r"\s*X\s*(\d+)\s*$", re.IGNORECASE)
+# "+" 주변 공백, 연속 공백
+PLUS_RE = re.compile(r"\s*\+\s*")
+SPACES_RE = re.compile(r"\s+")
+# 접두어 매칭 시 상품명 뒤에 허용하는 부분 (괄호 설명과 공백)
+PREFIX_TAIL_RE = re.compile(r"(\s*\([^()]*\))*\s*")
+
+
+def normalize_name(name: str) -> str:
+    """대소문자, 공백, '+' 주변 공백 차이를 없앤 상품명"""
+    name = PLUS_RE.sub(" + ", name.strip())
+    return SPACES_RE.sub(" ", name).casefold()
+
+
+def parse_product(product_name: str) -> tuple[str, int]:
+    """
+    예약상품 문자열에서 상품명과 수량을 분리합니다.
+    예: "AB: CUT + STYLING X 2" -> ("CUT + STYLING", 2)
+    """
+    name = CHANNEL_PREFIX_RE.sub("", product_name, count=1)
+    quantity = 1
+    match = QUANTITY_RE.search(name)
+    if match:
+        quantity = int(match.group(1))
+        name = name[:match.start()]
+    return name.strip(), quantity
+
+
+class PriceCatalog:
+    """정규화된 상품명 -> 단가 인덱스와 예약상품별 가격 캐시"""
+
+    def __init__(self, prices: dict, path: str | None = None, mtime: float | None = None):
+        """
+        Args:
+            prices: price.json 내용
+            path, mtime: 읽은 파일 경로와 수정 시각 (파일에서 읽은 경우)
+        """
+        self.path = path
+        self.mtime = mtime
+        self.default_price = int(prices.get(DEFAULT_KEY, 0))
+        self._names = {
+            normalize_name(name): name
+            for name, price in prices.items()
+            if name not in (DEFAULT_KEY, ALIASES_KEY) and isinstance(price, (int, float))
+        }
+        self._index = {key: int(prices[name]) for key, name in self._names.items()}
+        self._aliases = {
+            normalize_name(alias): normalize_name(target)
+            for alias, target in prices.get(ALIASES_KEY, {}).items()
+        }
+        # 접두어 매칭은 긴 상품명부터 확인
+        self._prefixes = sorted(self._index, key=len, reverse=True)
+        self._cache = {}  # 예약상품 문자열 -> 총 가격
+        self.unmatched = set()  # 가격표에서 찾지 못해 DEFAULT를 사용한 상품명
+        self.fuzzy = {}  # 별칭/접두어로 찾은 상품명 -> 가격표 상품명
+
+    @classmethod
+    def from_file(cls, path: str = PRICE_FILE) -> "PriceCatalog":
+        mtime = os.stat(path).st_mtime
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f), path, mtime)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def unit_price(self, name: str) -> int | None:
+        """
+        상품명의 단가 (정확히 일치 → 별칭 → 가장 긴 접두어, 없으면 None)
+        별칭/접두어로 찾은 경우 fuzzy에 기록합니다.
+        """
+        key = normalize_name(name)
+        if key in self._index:
+            return self._index[key]
+        if self._aliases.get(key) in self._index:
+            self.fuzzy[name] = self._names[self._aliases[key]]
+            return self._index[self._aliases[key]]
+        for prefix in self._prefixes:
+            # "CUT + STYLING (EN)"처럼 뒤에 괄호 설명만 붙은 상품명
+            if key.startswith(prefix) and PREFIX_TAIL_RE.fullmatch(key, len(prefix)):
+                self.fuzzy[name] = self._names[prefix]
+                return self._index[prefix]
+        return None
+
+    def price(self, product_name: str) -> int:
+        """예약상품 문자열의 총 가격 (단가 x 수량)"""
+        cached = self._cache.get(product_name)
+        if cached is not None:
+            return cached
+
+        name, quantity = parse_product(product_name)
+        unit_price = self.unit_price(name)
+        if unit_price is None:
+            self.unmatched.add(name)
+            unit_price = self.default_price
+
+        total = unit_price * quantity
+        self._cache[product_name] = total
+        return total
+
+    def report_unmatched(self):
+        """가격표에서 찾지 못한 상품과 별칭/접두어로 찾은 상품 출력"""
+        if self.fuzzy:
+            print(
+                f"[WARNING] 가격표(price.json)와 이름이 다른 상품 {len(self.fuzzy)}개, 별칭/접두어로 계산: "
+                + ", ".join(f"{name} → {matched}" for name, matched in sorted(self.fuzzy.items()))
+            )
+        if self.unmatched:
+            print(
+                f"[WARNING] 가격표(price.json)에 없는 상품 {len(self.unmatched)}개, "
+                f"기본값 {self.default_price:,}원으로 계산: {', '.join(sorted(self.unmatched))}"
+            )
+
+
+_catalog: PriceCatalog | None = None
+_catalog_lock = threading.Lock()
+
+
+def get_price_catalog(path: str = PRICE_FILE) -> PriceCatalog:
+    """
+    프로세스 전체에서 공유하는 가격 카탈로그를 반환합니다.
+    price.json의 수정 시각이 바뀐 경우에만 다시 읽고, 읽을 수 없으면 빈 카탈로그를 사용합니다.
+    """
+    global _catalog
+    try:
+        mtime = os.stat(path).st_mtime
+    except OSError as e:
+        print(f"가격 데이터 로드 실패: {e}")
+        return PriceCatalog({})
+
+    with _catalog_lock:
+        if _catalog is None or _catalog.mtime != mtime or _catalog.path != path:
+            try:
+                _catalog = PriceCatalog.from_file(path)
+            except Exception as e:
+                print(f"가격 데이터 로드 실패: {e}")
+                return PriceCatalog({})
+        return _catalog
@@ -0,0 +1,114 @@
+"""
+오프라인 재현(replay) 모듈
+record: 실행 중 네트워크 트래픽을 HAR 파일로, 날짜별 예약 상세 화면을 HTML 스냅샷으로 저장합니다.
+replay: 저장한 HAR로 네트워크 응답을 대신해 실제 사이트 없이 같은 화면을 재현합니다.
+녹화 파일에는 로그인 요청과 쿠키가 들어 있으므로 REPLAY_DIR(기본값 .cache/replay) 밖으로 공유하지 않습니다.
+"""
+from datetime import datetime
+from pathlib import Path
+import json
+import os
+import shutil
+from playwright.sync_api import Browser, BrowserContext, Page
+from config import REPLAY_DIR, TARGET_URL
+
+HAR_FILE = "session.har"
+MANIFEST_FILE = "manifest.json"
+SNAPSHOT_DIR = "snapshots"
+
+
+class Recording:
+    """녹화 디렉토리 (HAR + 날짜별 HTML 스냅샷 + manifest)"""
+
+    def __init__(self, directory: str = REPLAY_DIR):
+        self.directory = Path(directory)
+        self.har_path = self.directory / HAR_FILE
+        self.manifest_path = self.directory / MANIFEST_FILE
+        self.snapshot_dir = self.directory / SNAPSHOT_DIR
+
+    def exists(self) -> bool:
+        return self.har_path.exists() and self.manifest_path.exists()
+
+    def load_manifest(self) -> dict:
+        """{"recorded_at": ISO 시각, "target_url": URL, "dates": {예약 날짜: 예약 건수}}"""
+        with open(self.manifest_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def save_manifest(self, manifest: dict):
+        tmp_path = self.manifest_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+
+    def snapshot_path(self, reservation_date: str) -> Path:
+        return self.snapshot_dir / f"{reservation_date}.html"
+
+    def snapshots(self) -> dict[str, Path]:
+        """예약 날짜 -> 스냅샷 파일 (날짜 순)"""
+        return {path.stem: path for path in sorted(self.snapshot_dir.glob("*.html"))}
+
+
+# 녹화 중인 Recording (녹화하지 않으면 None)
+_active: Recording | None = None
+
+
+def start_recording(browser: Browser, directory: str = REPLAY_DIR) -> tuple[BrowserContext, Page]:
+    """
+    기존 녹화를 지우고, 트래픽을 HAR로 기록하는 새 컨텍스트와 페이지를 만듭니다.
+    HAR 파일은 stop_recording()에서 컨텍스트를 닫을 때 기록됩니다.
+    """
+    global _active
+    recording = Recording(directory)
+    shutil.rmtree(recording.directory, ignore_errors=True)
+    recording.snapshot_dir.mkdir(parents=True)
+    recording.save_manifest({
+        "recorded_at": datetime.now().astimezone().isoformat(timespec="seconds"),
+        "target_url": TARGET_URL,
+        "dates": {},
+    })
+
+    context = browser.new_context(record_har_path=str(recording.har_path), record_har_content="embed")
+    _active = recording
+    return context, context.new_page()
+
+
+def is_recording() -> bool:
+    return _active is not None
+
+
+def save_snapshot(reservation_date: str, html: str, reservation_count: int):
+    """녹화 중이면 예약 상세가 펼쳐진 화면의 HTML(page.content())을 스냅샷으로 저장"""
+    if _active is None:
+        return
+    _active.snapshot_path(reservation_date).write_text(html, encoding="utf-8")
+    manifest = _active.load_manifest()
+    manifest["dates"][reservation_date] = reservation_count
+    _active.save_manifest(manifest)
+
+
+def stop_recording(context: BrowserContext):
+    """녹화 컨텍스트를 닫아 HAR 파일을 기록"""
+    global _active
+    if _active is None:
+        return
+    try:
+        context.close()
+        print(f"[OK] 녹화 저장 완료: {_active.directory}")
+    finally:
+        _active = None
+
+
+def open_replay_context(browser: Browser, directory: str = REPLAY_DIR) -> BrowserContext:
+    """
+    녹화한 HAR로 응답하는 컨텍스트를 만듭니다. (HAR에 없는 요청은 중단)
+    SPA가 녹화 당시의 '오늘'로 같은 요청을 보내도록 브라우저 시계를 녹화 시각으로 맞춥니다.
+    """
+    recording = Recording(directory)
+    if not recording.exists():
+        raise FileNotFoundError(f"녹화 파일이 없습니다: {recording.directory} (python main.py --record로 녹화)")
+
+    manifest = recording.load_manifest()
+    context = browser.new_context()
+    context.route_from_har(str(recording.har_path), not_found="abort")
+    context.clock.install(time=datetime.fromisoformat(manifest["recorded_at"]))
+    return context
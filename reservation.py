@@ -0,0 +1,104 @@
+"""
+예약 레코드 모듈
+스크래퍼, 구글 시트, Slack 알림이 같은 형식으로 주고받는 예약 한 건의 데이터입니다.
+금액은 정수로 보관하고, 시트에 쓸 때만 천 단위 콤마 문자열로 변환합니다.
+"""
+from dataclasses import dataclass, asdict
+from config import RESERVATION_DATA_HEADERS
+
+# 시트 헤더 -> Reservation 필드
+FIELD_BY_HEADER = {
+    "날짜": "date",
+    "팀": "team",
+    "고객명": "customer_name",
+    "예약번호": "reservation_no",
+    "채널": "channel",
+    "인원구분": "people",
+    "국가": "country",
+    "예약상품": "product",
+    "예약시간": "time",
+    "금액": "price",
+    "is_new": "is_new",
+}
+
+# RESERVATION_DATA_HEADERS 순서의 필드 이름
+ROW_FIELDS = [FIELD_BY_HEADER[header] for header in RESERVATION_DATA_HEADERS]
+
+
+def parse_price(value) -> int:
+    """시트의 금액 값("110,000" 등)을 정수로 변환 (해석할 수 없으면 0)"""
+    if isinstance(value, (int, float)):
+        return int(value)
+    try:
+        return int(str(value).replace(",", "").strip() or 0)
+    except ValueError:
+        return 0
+
+
+def parse_is_new(value) -> bool | None:
+    """시트의 is_new 값(TRUE/FALSE)을 bool로 변환 (비어 있으면 None)"""
+    if isinstance(value, bool) or value is None:
+        return value
+    text = str(value).strip().lower()
+    if text == "true":
+        return True
+    if text == "false":
+        return False
+    return None
+
+
+@dataclass(slots=True)
+class Reservation:
+    """예약 한 건"""
+
+    date: str = ""
+    team: str = ""
+    customer_name: str = ""
+    reservation_no: str = ""
+    channel: str = ""
+    people: str = ""
+    country: str = ""
+    product: str = ""
+    time: str = ""
+    price: int = 0
+    is_new: bool | None = None  # 시트 저장 전에는 None
+
+    @classmethod
+    def from_headers(cls, values: dict) -> "Reservation":
+        """시트 헤더(한글) 키의 딕셔너리로 생성 (없는 헤더는 기본값)"""
+        reservation = cls(**{
+            FIELD_BY_HEADER[header]: value
+            for header, value in values.items()
+            if header in FIELD_BY_HEADER
+        })
+        reservation.price = parse_price(reservation.price)
+        reservation.is_new = parse_is_new(reservation.is_new)
+        return reservation
+
+    @classmethod
+    def from_row(cls, row: list) -> "Reservation":
+        """시트에서 읽은 행(RESERVATION_DATA_HEADERS 순서)으로 생성"""
+        padded = list(row[:len(ROW_FIELDS)]) + [""] * (len(ROW_FIELDS) - len(row))
+        return cls.from_headers({
+            header: str(value) for header, value in zip(RESERVATION_DATA_HEADERS, padded)
+        })
+
+    def to_row(self) -> list:
+        """RESERVATION_DATA_HEADERS 순서의 시트 행 (금액은 천 단위 콤마 문자열)"""
+        row = []
+        for field in ROW_FIELDS:
+            value = getattr(self, field)
+            if field == "price":
+                value = f"{value:,}"
+            elif field == "is_new" and value is None:
+                value = ""
+            row.append(value)
+        return row
+
+    def to_dict(self) -> dict:
+        """JSON으로 저장할 수 있는 딕셔너리 (체크포인트 등)"""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, values: dict) -> "Reservation":
+        return cls(**values)
@@ -0,0 +1,140 @@
+"""
+리소스 차단 모듈
+스크래핑에 필요 없는 이미지/폰트/미디어와 외부 사이트(분석 도구 등) 요청을 차단하고,
+실행 동안 차단한 요청 수와 불러온 요청/바이트 수를 집계합니다.
+"""
+from collections import Counter
+from urllib.parse import urlparse
+import threading
+from playwright.sync_api import BrowserContext, Route, Response
+from playwright.async_api import BrowserContext as AsyncBrowserContext, Route as AsyncRoute
+from config import TARGET_URL, BLOCK_RESOURCE_TYPES, BLOCK_THIRD_PARTY, BLOCK_ALLOW_HOSTS
+
+# 외부 사이트여도 차단하면 앱이 동작하지 않는 요청 타입
+ESSENTIAL_RESOURCE_TYPES = ("document", "xhr", "fetch")
+
+
+def host_matches(host: str, allowed: str) -> bool:
+    """host가 allowed 자신이거나 그 하위 도메인인지 확인"""
+    return host == allowed or host.endswith("." + allowed)
+
+
+def should_block(
+    resource_type: str,
+    url: str,
+    first_party_host: str = urlparse(TARGET_URL).hostname or "",
+    blocked_types: list[str] = BLOCK_RESOURCE_TYPES,
+    block_third_party: bool = BLOCK_THIRD_PARTY,
+    allow_hosts: list[str] = BLOCK_ALLOW_HOSTS
+) -> bool:
+    """
+    요청을 차단할지 결정
+    TARGET_URL 호스트와 그 하위 도메인만 같은 사이트로 봅니다. (co.kr처럼 두 단계 도메인 뒤에 붙는
+    다른 사이트를 같은 사이트로 보지 않도록 마지막 두 레이블로 묶지 않음, 형제 도메인은 BLOCK_ALLOW_HOSTS로 허용)
+    """
+    if resource_type in blocked_types:
+        return True
+    if not block_third_party or resource_type in ESSENTIAL_RESOURCE_TYPES:
+        return False
+
+    host = urlparse(url).hostname
+    if not host:
+        # data:, blob: 등
+        return False
+    if host_matches(host, first_party_host) or any(host_matches(host, h) for h in allow_hosts):
+        return False
+    return True
+
+
+class ResourceStats:
+    """차단/허용된 요청 집계 (여러 워커 스레드에서 동시에 사용 가능)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.blocked = Counter()  # resource type -> 차단한 요청 수
+        self.loaded_requests = 0
+        self.loaded_bytes = 0
+
+    def record_blocked(self, resource_type: str):
+        with self._lock:
+            self.blocked[resource_type] += 1
+
+    def record_loaded(self, size: int):
+        with self._lock:
+            self.loaded_requests += 1
+            self.loaded_bytes += size
+
+    def reset(self):
+        with self._lock:
+            self.blocked.clear()
+            self.loaded_requests = 0
+            self.loaded_bytes = 0
+
+    def summary_lines(self) -> list[str]:
+        """차단 요약"""
+        with self._lock:
+            blocked = dict(self.blocked)
+            loaded_requests, loaded_bytes = self.loaded_requests, self.loaded_bytes
+
+        if not blocked and not loaded_requests:
+            return []
+
+        lines = [
+            f"차단한 요청: {sum(blocked.values())}건 "
+            f"({', '.join(f'{t} {n}' for t, n in sorted(blocked.items(), key=lambda i: -i[1])) or '-'})",
+            # Content-Length 기준이라 압축/청크 전송 응답은 일부만 반영됨
+            f"불러온 요청: {loaded_requests}건, 약 {loaded_bytes / 1024 / 1024:.1f}MB",
+        ]
+        return lines
+
+    def print_summary(self):
+        lines = self.summary_lines()
+        if not lines:
+            return
+        print("\n[리소스 차단 요약]")
+        for line in lines:
+            print(f"  {line}")
+
+
+# 전역 집계
+resource_stats = ResourceStats()
+
+
+def _handle_route(route: Route):
+    request = route.request
+    if should_block(request.resource_type, request.url):
+        resource_stats.record_blocked(request.resource_type)
+        route.abort("blockedbyclient")
+    else:
+        route.continue_()
+
+
+async def _handle_route_async(route: AsyncRoute):
+    request = route.request
+    if should_block(request.resource_type, request.url):
+        resource_stats.record_blocked(request.resource_type)
+        await route.abort("blockedbyclient")
+    else:
+        await route.continue_()
+
+
+def _record_response(response: Response):
+    try:
+        size = int(response.headers.get("content-length", 0))
+    except ValueError:
+        size = 0
+    resource_stats.record_loaded(size)
+
+
+def install_resource_filter(context: BrowserContext):
+    """컨텍스트의 모든 요청에 차단 규칙을 적용하고 불러온 응답을 집계합니다."""
+    if BLOCK_RESOURCE_TYPES or BLOCK_THIRD_PARTY:
+        context.route("**/*", _handle_route)
+    context.on("response", _record_response)
+
+
+async def install_resource_filter_async(context: AsyncBrowserContext):
+    """install_resource_filter()의 async API 버전"""
+    if BLOCK_RESOURCE_TYPES or BLOCK_THIRD_PARTY:
+        await context.route("**/*", _handle_route_async)
+    context.on("response", _record_response)
@@ -0,0 +1,92 @@
+"""
+적응형 스크래핑 스케줄 모듈
+가까운 날짜는 매 실행마다 조회하고, 먼 날짜는 과거에 예약 건수가 얼마나 자주 바뀌었는지에 따라
+조회 간격을 늘려 넓은 조회 범위를 유지하면서도 실행당 브라우저 시간을 줄입니다.
+"""
+from datetime import date
+from pathlib import Path
+import json
+import os
+import threading
+
+
+class AdaptiveScheduler:
+    """날짜별 예약 건수 변화 이력을 바탕으로 이번 실행에서 조회할 날짜를 고르는 스케줄러"""
+
+    def __init__(self, path: str, near_days: int = 7, max_interval: int = 7):
+        """
+        Args:
+            path: 날짜별 이력 파일 경로 (JSON)
+            near_days: 오늘부터 이 일수 이내의 날짜는 항상 조회
+            max_interval: 먼 날짜의 최대 조회 간격(일)
+        """
+        self.path = Path(path)
+        self.near_days = near_days
+        self.max_interval = max_interval
+        self._lock = threading.Lock()
+        self._history = self._load()
+
+    def _load(self) -> dict:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            print(f"[WARNING] 스케줄 이력 로드 실패, 모든 날짜를 조회합니다: {e}")
+            return {}
+
+    def _save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._history, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def interval_for(self, reservation_date: str) -> int:
+        """
+        날짜의 조회 간격(일)
+        예약 건수가 바뀐 비율(라플라스 보정)의 역수를 1 ~ max_interval 범위로 제한합니다.
+        """
+        entry = self._history.get(reservation_date)
+        if not entry:
+            return 1
+        change_rate = (entry["changes"] + 1) / (entry["observations"] + 2)
+        return max(1, min(self.max_interval, int(1 / change_rate)))
+
+    def is_due(self, target: date, today: date) -> bool:
+        """이번 실행에서 조회해야 하는 날짜인지 확인"""
+        if (target - today).days <= self.near_days:
+            return True
+        entry = self._history.get(target.isoformat())
+        if not entry:
+            return True
+        days_since = (today - date.fromisoformat(entry["last_scraped"])).days
+        return days_since >= self.interval_for(target.isoformat())
+
+    def select(self, targets: list[date], today: date) -> tuple[list[date], list[date]]:
+        """
+        Returns:
+            tuple: (이번에 조회할 날짜 리스트, 건너뛸 날짜 리스트)
+        """
+        due, skipped = [], []
+        for target in targets:
+            (due if self.is_due(target, today) else skipped).append(target)
+        return due, skipped
+
+    def record(self, reservation_date: str, count: int, today: date):
+        """날짜 하나의 조회 결과(예약 건수)를 이력에 반영하고 지난 날짜는 정리"""
+        with self._lock:
+            entry = self._history.get(reservation_date)
+            if entry is None:
+                entry = {"observations": 0, "changes": 0, "last_count": None}
+            if entry["last_count"] is not None and entry["last_count"] != count:
+                entry["changes"] += 1
+            entry["observations"] += 1
+            entry["last_count"] = count
+            entry["last_scraped"] = today.isoformat()
+            self._history[reservation_date] = entry
+
+            today_str = today.isoformat()
+            self._history = {d: e for d, e in self._history.items() if d >= today_str}
+            self._save()
@@ -1,31 +1,180 @@
+"""
+예약 페이지 화면 조작 모듈
+각 단계는 async 함수(*_async)로 한 번만 구현하고, 같은 이름의 sync 함수는 sync playwright Page를
+sync_bridge.SyncPage로 감싸 같은 코루틴을 실행하는 진입점입니다.
+async 함수는 sync_bridge의 Protocol(PageApi 등)에 정한 playwright API만 사용합니다.
+"""
 from datetime import datetime
-from playwright.sync_api import Page
-import time
-import json
+from playwright.sync_api import Page, Response
 import re
-from config import PRICE_FILE
-
-
-def retry_action(action, max_retries: int = 3, delay: float = 1.0):
+from config import (
+    TARGET_URL, RESERVATION_API_PATTERN, SCRAPE_MODE, NAVIGATION_MODE, EMPTY_STATE_SELECTOR, EMPTY_DATE_TIMEOUT,
+    RESERVATION_WAIT_TIMEOUT
+)
+from api_capture import map_reservation_payload, contains_objects
+from price_catalog import PriceCatalog, get_price_catalog
+from reservation import Reservation
+from replay import is_recording, save_snapshot
+from sync_bridge import LocatorApi, PageApi, ResponseApi, SyncPage, SyncResponse, run_sync, sleep
+from tracing import traced, wait_span
+
+
+# 화면 요소 셀렉터
+BACKDROP_SELECTOR = "div.MuiBackdrop-root"
+DATE_BUTTON_SELECTOR = "button.MuiButtonBase-root.css-ab6e07"
+CALENDAR_LABEL_SELECTOR = "div.MuiPickersCalendarHeader-label"
+LOGIN_ICON_SELECTOR = 'button[aria-label="log in"]'
+EMAIL_SELECTOR = "input#email"
+PASSWORD_SELECTOR = "input#password"
+USER_MENU_SELECTOR = "button.MuiIconButton-edgeEnd"
+
+# 예약 상세 행 셀렉터와 행 안의 필드별 셀렉터
+# 필드를 추가해도 한 번의 page.evaluate()로 함께 추출되므로 CDP 왕복 횟수는 늘어나지 않습니다.
+STORE_SELECTOR = "div.MuiAccordionSummary-content h6"
+ACCORDION_SUMMARY_SELECTOR = "div.MuiAccordionSummary-root"
+TEAM_HEADER_SELECTOR = "li.MuiListSubheader-root"
+RESERVATION_ROW_SELECTOR = "li.css-jywvn2"
+TEAM_EXPAND_SELECTOR = f"ul > {TEAM_HEADER_SELECTOR} button.MuiIconButton-root"
+RESERVATION_FIELD_SELECTORS = {
+    "고객명": "h6.css-qdk4z1",
+    "예약번호": "h6.css-1r042ka",
+    "국가": "span.css-xcju41",
+    "예약시간": "p.css-17exa0r",
+    "예약상품": "p.css-1q5lgor",
+    "채널": "div.MuiAvatar-root",  # MuiAvatar의 L, VI 등
+    "인원구분": "p.css-mdkayp",
+}
+
+# 모든 예약 행의 필드를 한 번에 추출하는 스크립트 (없는 필드는 null)
+# 팀 헤더와 예약 행을 문서 순서대로 훑으며 각 행을 바로 위 팀 헤더에 귀속시킵니다.
+EXTRACT_ROWS_SCRIPT = """
+([teamSelector, rowSelector, selectors]) => {
+    const rows = [];
+    let team = "";
+    for (const el of document.querySelectorAll(`${teamSelector}, ${rowSelector}`)) {
+        if (el.matches(teamSelector)) {
+            team = el.innerText;
+            continue;
+        }
+        rows.push([team, selectors.map(selector => {
+            const field = el.querySelector(selector);
+            return field ? field.innerText : null;
+        })]);
+    }
+    return rows;
+}
+"""
+
+EXTRACT_ROWS_ARGS = [TEAM_HEADER_SELECTOR, RESERVATION_ROW_SELECTOR, list(RESERVATION_FIELD_SELECTORS.values())]
+
+# 접혀 있는 모든 팀의 펼치기 버튼을 클릭하는 스크립트
+# aria-expanded가 없으면 헤더 바로 다음에 예약 행이 있는지로 펼침 여부를 판단합니다.
+EXPAND_TEAMS_SCRIPT = """
+([headerSelector, buttonSelector, rowSelector]) => {
+    let clicked = 0;
+    for (const header of document.querySelectorAll(headerSelector)) {
+        const button = header.querySelector(buttonSelector);
+        if (!button) continue;
+        const expanded = button.getAttribute("aria-expanded");
+        if (expanded === "true") continue;
+        if (expanded === null) {
+            const next = header.nextElementSibling;
+            if (next && next.matches(rowSelector)) continue;
+        }
+        button.click();
+        clicked++;
+    }
+    return clicked;
+}
+"""
+
+EXPAND_TEAMS_ARGS = [f"ul > {TEAM_HEADER_SELECTOR}", "button.MuiIconButton-root", RESERVATION_ROW_SELECTOR]
+
+# 펼쳐진 팀과 예약 아코디언을 접는 스크립트 (이미 접힌 것은 클릭하지 않음)
+COLLAPSE_SCRIPT = """
+([teamButtonSelector, accordionSelector]) => {
+    let clicked = 0;
+    for (const el of document.querySelectorAll(`${teamButtonSelector}, ${accordionSelector}`)) {
+        if (el.getAttribute("aria-expanded") !== "true") continue;
+        el.click();
+        clicked++;
+    }
+    return clicked;
+}
+"""
+
+# 예약 행이 하나도 보이지 않는지 확인하는 스크립트 (접힌 Collapse는 visibility: hidden)
+ROWS_HIDDEN_SCRIPT = """
+rowSelector => [...document.querySelectorAll(rowSelector)].every(
+    el => !el.checkVisibility({visibilityProperty: true, checkVisibilityCSS: true})
+)
+"""
+
+# 로그인 폼의 제출 버튼 클릭
+SUBMIT_LOGIN_SCRIPT = "document.querySelector('button[type=\"submit\"]').click()"
+
+# 달력 헤더 문구가 이전 값에서 바뀔 때까지 기다리는 조건
+CALENDAR_LABEL_CHANGED_SCRIPT = """
+([selector, previous]) => {
+    const el = document.querySelector(selector);
+    return el && el.innerText.trim() !== previous;
+}
+"""
+
+
+async def retry_action_async(action, max_retries: int = 3, delay: float = 1.0):
     """
-    액션을 재시도하는 래퍼 함수.
+    액션(코루틴 함수)을 재시도하는 래퍼 함수.
     """
     last_error = None
     for attempt in range(max_retries):
         try:
-            return action()
+            return await action()
         except Exception as e:
             last_error = e
             if attempt < max_retries - 1:
-                time.sleep(delay)
+                await sleep(delay)
     raise last_error
 
 
+async def wait_for_backdrop_gone_async(page: PageApi, step: str = "backdrop_gone", timeout: int = 5000):
+    """
+    MUI 모달 백드롭이 사라질 때까지 대기합니다. (백드롭이 없으면 즉시 반환)
+    """
+    with wait_span(step, timeout):
+        await page.wait_for_selector(BACKDROP_SELECTOR, state="hidden", timeout=timeout)
+
+
+def wait_for_backdrop_gone(page: Page, step: str = "backdrop_gone", timeout: int = 5000):
+    """wait_for_backdrop_gone_async()의 sync 진입점"""
+    run_sync(wait_for_backdrop_gone_async(SyncPage(page), step, timeout))
+
+
+async def wait_for_page_ready_async(page: PageApi, step: str = "network_idle", timeout: int = 30000):
+    """
+    페이지의 네트워크 요청이 모두 끝날 때까지 대기합니다.
+    """
+    with wait_span(step, timeout):
+        await page.wait_for_load_state("networkidle", timeout=timeout)
+
+
+def wait_for_page_ready(page: Page, step: str = "network_idle", timeout: int = 30000):
+    """wait_for_page_ready_async()의 sync 진입점"""
+    run_sync(wait_for_page_ready_async(SyncPage(page), step, timeout))
+
+
+def is_reservation_response(response) -> bool:
+    """
+    예약 목록 API 응답인지 확인합니다. (RESERVATION_API_PATTERN이 URL에 포함된 응답)
+    """
+    return bool(RESERVATION_API_PATTERN) and RESERVATION_API_PATTERN in response.url
+
+
 def close_login_dialog(page: Page):
     """
     페이지에 로그인 다이얼로그가 있다면 닫습니다.
     """
-    backdrop_selector = "div.MuiBackdrop-root.MuiModal-backdrop"
+    backdrop_selector = f"{BACKDROP_SELECTOR}.MuiModal-backdrop"
 
     try:
         page.locator(backdrop_selector).click(timeout=1000)
@@ -34,167 +183,482 @@ def close_login_dialog(page: Page):
         pass
 
 
-def click_date_button(page: Page):
+@traced()
+async def click_date_button_async(page: PageApi):
     """
     페이지 상단의 날짜 버튼을 클릭하여 달력을 엽니다.
     """
-    date_button_selector = "button.MuiButtonBase-root.css-ab6e07"
+    with wait_span("date_button", 15000):
+        await page.locator(DATE_BUTTON_SELECTOR).wait_for(state="visible", timeout=15000)
+    await page.locator(DATE_BUTTON_SELECTOR).click()
+
+
+def click_date_button(page: Page):
+    """click_date_button_async()의 sync 진입점"""
+    run_sync(click_date_button_async(SyncPage(page)))
+
+
+def month_offset(label_text: str, year: int, month: int) -> int:
+    """달력 헤더(예: "January 2026")에서 목표 연월까지 이동할 개월 수"""
+    try:
+        shown = datetime.strptime(label_text, "%B %Y")
+    except ValueError:
+        raise RuntimeError(f"달력 헤더를 해석할 수 없습니다: {label_text!r}")
+    return (year - shown.year) * 12 + (month - shown.month)
+
+
+def month_button_selector(diff: int) -> str:
+    """이동할 방향의 이전/다음 달 버튼"""
+    button_label = "Next month" if diff > 0 else "Previous month"
+    return f'button[aria-label="{button_label}"]'
+
+
+def calendar_day_selector(day: str) -> str:
+    return f"button.MuiPickersDay-root:text-is('{day}')"
+
+
+async def navigate_calendar_to_month_async(page: PageApi, year: int, month: int):
+    """
+    열린 달력의 이전/다음 달 버튼으로 원하는 연월을 표시합니다.
+    """
+    label = page.locator(CALENDAR_LABEL_SELECTOR)
+    with wait_span("calendar_header", 10000):
+        await label.wait_for(state="visible", timeout=10000)
+
+    for _ in range(36):
+        text = (await label.inner_text()).strip()
+        diff = month_offset(text, year, month)
+        if diff == 0:
+            return
 
-    page.locator(date_button_selector).wait_for(state="visible", timeout=15000)
-    page.locator(date_button_selector).click()
+        await page.locator(month_button_selector(diff)).click()
+        with wait_span("calendar_month_change", 5000):
+            await page.wait_for_function(
+                CALENDAR_LABEL_CHANGED_SCRIPT,
+                arg=[CALENDAR_LABEL_SELECTOR, text],
+                timeout=5000
+            )
 
+    raise RuntimeError(f"달력을 {year}-{month:02d}로 이동하지 못했습니다.")
 
-def click_calendar_date(page: Page, day: str):
+
+def navigate_calendar_to_month(page: Page, year: int, month: int):
+    """navigate_calendar_to_month_async()의 sync 진입점"""
+    run_sync(navigate_calendar_to_month_async(SyncPage(page), year, month))
+
+
+@traced(attrs=("day",))
+async def click_calendar_date_async(
+    page: PageApi, day: str, year: int = None, month: int = None
+) -> ResponseApi | None:
     """
     달력에서 특정 날짜를 클릭하고 'OK' 버튼을 누릅니다.
+    year/month를 지정하면 먼저 달력을 해당 연월로 이동합니다.
+    달력이 닫히고 해당 날짜의 예약 목록 로딩이 끝날 때까지 대기합니다.
+
+    Returns:
+        Response | None: RESERVATION_API_PATTERN이 설정된 경우 예약 목록 API 응답
     """
-    date_selector = page.locator(f"button.MuiPickersDay-root:text-is('{day}')")
-    date_selector.wait_for(state="visible", timeout=10000)
-    date_selector.click()
+    response = None
+    if year is not None and month is not None:
+        await navigate_calendar_to_month_async(page, year, month)
+    date_selector = page.locator(calendar_day_selector(day))
+    with wait_span("calendar_day", 10000):
+        await date_selector.wait_for(state="visible", timeout=10000)
+    await date_selector.click()
 
     ok_button_selector = page.get_by_role("button", name="OK", exact=True)
-    ok_button_selector.wait_for(state="visible", timeout=5000)
-    ok_button_selector.click()
+    with wait_span("calendar_ok_button", 5000):
+        await ok_button_selector.wait_for(state="visible", timeout=5000)
+
+    if RESERVATION_API_PATTERN:
+        # 예약 목록 API 응답이 도착할 때까지 대기
+        with wait_span("reservation_response", 15000):
+            async with page.expect_response(is_reservation_response, timeout=15000) as response_info:
+                await ok_button_selector.click()
+        response = await response_info.value
+    else:
+        await ok_button_selector.click()
+        await wait_for_page_ready_async(page, "reservation_list_idle")
+
+    await wait_for_backdrop_gone_async(page, "calendar_closed")
+    return response
+
+
+def click_calendar_date(page: Page, day: str, year: int = None, month: int = None) -> Response | None:
+    """click_calendar_date_async()의 sync 진입점"""
+    response = run_sync(click_calendar_date_async(SyncPage(page), day, year, month))
+    return response.response if response is not None else None
+
+
+def payload_has_reservations(payload, reservation_date: str) -> bool | None:
+    """
+    예약 목록 API 응답으로 예약 유무를 판단합니다.
+
+    Returns:
+        bool | None: 응답에 객체가 없으면 False, 예약을 매핑할 수 있으면 True, 판단할 수 없으면 None
+    """
+    if not contains_objects(payload):
+        return False
+    return True if map_reservation_payload(payload, reservation_date) else None
+
+
+def reservation_indicator(page: PageApi) -> LocatorApi:
+    """예약 목록(상호) 또는 빈 화면 표시 중 먼저 나타나는 요소"""
+    store = page.locator(STORE_SELECTOR)
+    if EMPTY_STATE_SELECTOR:
+        return store.or_(page.locator(EMPTY_STATE_SELECTOR)).first
+    return store.first
+
+
+def has_reservations_timeout() -> int:
+    """
+    has_reservations()의 기본 대기 시간(ms)
+    빈 화면 표시(EMPTY_STATE_SELECTOR)로 예약 없음을 직접 확인할 수 있을 때만 짧은 EMPTY_DATE_TIMEOUT을 쓰고,
+    없으면 느린 렌더링을 예약 없음으로 판단하지 않도록 RESERVATION_WAIT_TIMEOUT까지 기다립니다.
+    """
+    return EMPTY_DATE_TIMEOUT if EMPTY_STATE_SELECTOR else RESERVATION_WAIT_TIMEOUT
 
 
-def has_reservations(page: Page, timeout: int = 15000) -> bool:
+@traced()
+async def has_reservations_async(
+    page: PageApi,
+    timeout: int | None = None,
+    response: ResponseApi | None = None,
+    reservation_date: str = ""
+) -> bool:
     """
     현재 페이지에 예약이 있는지 확인합니다.
-    상호(마리엠헤어)가 있으면 예약 있음.
+    예약 목록 API 응답(성공 응답만)으로 판단할 수 있으면 바로 판단하고, 아니면 상호(마리엠헤어)와
+    빈 화면 표시(EMPTY_STATE_SELECTOR) 중 먼저 나타나는 쪽으로 판단합니다.
+    timeout을 지정하지 않으면 has_reservations_timeout()을 사용합니다.
     """
-    store_selector = "div.MuiAccordionSummary-content h6"
+    timeout = has_reservations_timeout() if timeout is None else timeout
+    # 오류 응답(5xx 등)의 본문은 예약 목록이 아니므로 화면으로 판단
+    if response is not None and response.ok:
+        try:
+            found = payload_has_reservations(await response.json(), reservation_date)
+        except Exception:
+            found = None
+        if found is not None:
+            return found
+
     try:
-        page.locator(store_selector).wait_for(state="visible", timeout=timeout)
-        return True
+        with wait_span("reservation_indicator", timeout):
+            await reservation_indicator(page).wait_for(state="visible", timeout=timeout)
+        return await page.locator(STORE_SELECTOR).first.is_visible()
     except Exception:
         return False
 
 
+def has_reservations(
+    page: Page,
+    timeout: int | None = None,
+    response: Response | None = None,
+    reservation_date: str = ""
+) -> bool:
+    """has_reservations_async()의 sync 진입점"""
+    sync_response = SyncResponse(response) if response is not None else None
+    return run_sync(has_reservations_async(SyncPage(page), timeout, sync_response, reservation_date))
+
+
+@traced()
+async def click_reservation_text_async(page: PageApi):
+    """
+    상호(마리엠헤어) 텍스트를 클릭해 예약 목록을 펼칩니다.
+    같은 페이지에서 날짜를 바꿔 이미 펼쳐져 있는 경우에는 다시 클릭하지 않습니다.
+    """
+    store = page.locator(STORE_SELECTOR)
+    summary = page.locator(ACCORDION_SUMMARY_SELECTOR).filter(has=store).first
+
+    async def action():
+        with wait_span("reservation_text", 15000):
+            await store.wait_for(state="visible", timeout=15000)
+        if await summary.count() and await summary.get_attribute("aria-expanded") == "true":
+            return
+        await store.click()
+
+    await retry_action_async(action)
+
+
 def click_reservation_text(page: Page):
+    """click_reservation_text_async()의 sync 진입점"""
+    run_sync(click_reservation_text_async(SyncPage(page)))
+
+
+@traced()
+async def click_team_button_async(page: PageApi) -> int:
     """
-    상호(마리엠헤어) 텍스트를 클릭합니다.
+    모든 팀의 펼치기 버튼을 한 번의 스크립트 실행으로 클릭합니다.
+    이미 펼쳐진 팀은 다시 클릭하지 않습니다.
+
+    Returns:
+        int: 새로 펼친 팀 수
     """
-    store_selector = "div.MuiAccordionSummary-content h6"
+    async def action():
+        with wait_span("team_button", 10000):
+            await page.locator(TEAM_EXPAND_SELECTOR).first.wait_for(state="visible", timeout=10000)
+        return await page.evaluate(EXPAND_TEAMS_SCRIPT, EXPAND_TEAMS_ARGS)
+
+    return await retry_action_async(action)
 
-    def action():
-        page.locator(store_selector).wait_for(state="visible", timeout=15000)
-        page.locator(store_selector).click()
 
-    retry_action(action)
+def click_team_button(page: Page) -> int:
+    """click_team_button_async()의 sync 진입점"""
+    return run_sync(click_team_button_async(SyncPage(page)))
 
 
-def click_team_button(page: Page):
+async def collapse_reservations_async(page: PageApi, timeout: int = 5000) -> int:
     """
-    첫 번째 팀의 펼치기 버튼을 클릭합니다.
+    펼쳐진 팀과 예약 목록을 접고, 이전 날짜의 예약 행이 모두 가려질 때까지 대기합니다.
+    다음 날짜를 같은 페이지에서 선택해도 이전 날짜의 행을 읽지 않도록 합니다.
+
+    Returns:
+        int: 접은 요소 수
     """
-    team_expand_selector = '//ul/li[contains(@class, "MuiListSubheader-root")]//button[contains(@class, "MuiIconButton-root")]'
+    clicked = await page.evaluate(COLLAPSE_SCRIPT, [TEAM_EXPAND_SELECTOR, ACCORDION_SUMMARY_SELECTOR])
+    with wait_span("rows_collapsed", timeout):
+        await page.wait_for_function(ROWS_HIDDEN_SCRIPT, arg=RESERVATION_ROW_SELECTOR, timeout=timeout)
+    return clicked
 
-    def action():
-        page.locator(team_expand_selector).first.wait_for(state="visible", timeout=10000)
-        page.locator(team_expand_selector).first.click()
 
-    retry_action(action)
+def collapse_reservations(page: Page, timeout: int = 5000) -> int:
+    """collapse_reservations_async()의 sync 진입점"""
+    return run_sync(collapse_reservations_async(SyncPage(page), timeout))
 
 
-def login(page: Page, email: str, password: str):
+@traced()
+async def reset_page_async(page: PageApi, navigation_mode: str = NAVIGATION_MODE):
+    """
+    다음 날짜 조회를 위해 화면을 초기화합니다.
+    inplace 모드는 SPA를 다시 불러오지 않고 목록만 접으며, 실패하면 reload로 대체합니다.
+    """
+    if navigation_mode == "inplace":
+        try:
+            await collapse_reservations_async(page)
+            return
+        except Exception as e:
+            print(f"[WARNING] 같은 페이지에서 초기화 실패, 페이지를 다시 불러옵니다: {e}")
+
+    await page.goto(TARGET_URL)
+    await wait_for_page_ready_async(page, "page_reset")
+
+
+def reset_page(page: Page, navigation_mode: str = NAVIGATION_MODE):
+    """reset_page_async()의 sync 진입점"""
+    run_sync(reset_page_async(SyncPage(page), navigation_mode))
+
+
+@traced()
+async def login_async(page: PageApi, email: str, password: str):
     """
     제공된 이메일과 비밀번호로 로그인합니다.
     """
-    login_icon_selector = 'button[aria-label="log in"]'
-    page.locator(login_icon_selector).wait_for(state="visible", timeout=15000)
-    page.locator(login_icon_selector).click()
+    with wait_span("login_icon", 15000):
+        await page.locator(LOGIN_ICON_SELECTOR).wait_for(state="visible", timeout=15000)
+    await page.locator(LOGIN_ICON_SELECTOR).click()
+
+    with wait_span("login_form", 10000):
+        await page.locator(EMAIL_SELECTOR).wait_for(state="visible", timeout=10000)
+    await page.locator(EMAIL_SELECTOR).fill(email)
+    await page.locator(PASSWORD_SELECTOR).fill(password)
+
+    await page.evaluate(SUBMIT_LOGIN_SCRIPT)
 
-    email_selector = "input#email"
-    password_selector = "input#password"
+    with wait_span("login_user_menu", 15000):
+        await page.locator(USER_MENU_SELECTOR).wait_for(state="visible", timeout=15000)
 
-    page.locator(email_selector).wait_for(state="visible", timeout=10000)
-    page.locator(email_selector).fill(email)
-    page.locator(password_selector).fill(password)
+    # 로그인 다이얼로그가 닫히고 초기 데이터 로딩이 끝날 때까지 대기
+    await wait_for_backdrop_gone_async(page, "login_dialog_closed")
+    await wait_for_page_ready_async(page, "login_idle")
 
-    page.evaluate("document.querySelector('button[type=\"submit\"]').click()")
 
-    user_menu_button_selector = "button.MuiIconButton-edgeEnd"
-    page.locator(user_menu_button_selector).wait_for(state="visible", timeout=15000)
+def login(page: Page, email: str, password: str):
+    """login_async()의 sync 진입점"""
+    run_sync(login_async(SyncPage(page), email, password))
 
 
 def get_team_name(page: Page) -> str:
     """
-    현재 열린 팀의 이름을 가져옵니다.
+    첫 번째 팀의 이름을 가져옵니다.
     """
-    team_header_selector = "li.MuiListSubheader-root"
     try:
-        return page.locator(team_header_selector).first.inner_text(timeout=5000)
+        return page.locator(TEAM_HEADER_SELECTOR).first.inner_text(timeout=5000)
     except Exception:
         return ""
 
 
-def scrape_details(page: Page, reservation_date: str) -> list[dict]:
+async def extract_rows_async(page: PageApi) -> list[tuple[str, list]]:
+    """
+    page.evaluate() 한 번으로 모든 팀의 예약 행 필드 값을 추출합니다.
+
+    Returns:
+        list[tuple]: (팀 이름, RESERVATION_FIELD_SELECTORS 순서의 필드 값 리스트) 리스트
+    """
+    rows = await page.evaluate(EXTRACT_ROWS_SCRIPT, EXTRACT_ROWS_ARGS)
+    return [(team, values) for team, values in rows]
+
+
+def extract_rows(page: Page) -> list[tuple[str, list]]:
+    """extract_rows_async()의 sync 진입점"""
+    return run_sync(extract_rows_async(SyncPage(page)))
+
+
+def extract_rows_per_locator(page: Page) -> list[tuple[str, list]]:
+    """
+    행/필드마다 locator.inner_text()를 호출하는 기존 추출 방식입니다. (벤치마크 비교용)
+    extract_rows()와 같은 형식의 결과를 반환하지만, 모든 행을 첫 번째 팀에 귀속시킵니다.
     """
-    예약 상세 정보 페이지에서 모든 예약 내역을 스크래핑하여 딕셔너리 리스트로 반환합니다.
+    team_name = get_team_name(page)
+    rows = []
+    for res in page.locator(RESERVATION_ROW_SELECTOR).all():
+        values = []
+        for selector in RESERVATION_FIELD_SELECTORS.values():
+            try:
+                values.append(res.locator(selector).inner_text(timeout=3000))
+            except Exception:
+                values.append(None)
+        rows.append((team_name, values))
+    return rows
+
+
+@traced(attrs=("reservation_date",))
+async def scrape_details_async(page: PageApi, reservation_date: str) -> list[Reservation]:
+    """
+    예약 상세 정보 페이지에서 모든 예약 내역을 스크래핑하여 Reservation 리스트로 반환합니다.
 
     Args:
         page: Playwright Page 객체
         reservation_date: 예약 날짜 (예: "2026-01-14")
     """
-    details_container_selector = "li.css-jywvn2"
-    page.wait_for_selector(details_container_selector, state="visible", timeout=10000)
+    with wait_span("detail_rows", 10000):
+        await page.wait_for_selector(RESERVATION_ROW_SELECTOR, state="visible", timeout=10000)
+
+    return build_reservations(await extract_rows_async(page), reservation_date)
 
-    # 팀 이름 가져오기
-    team_name = get_team_name(page)
 
-    # 가격 데이터 로드
-    price_data = load_price_data()
+def scrape_details(page: Page, reservation_date: str) -> list[Reservation]:
+    """scrape_details_async()의 sync 진입점"""
+    return run_sync(scrape_details_async(SyncPage(page), reservation_date))
+
+
+def build_reservations(rows: list[tuple[str, list]], reservation_date: str) -> list[Reservation]:
+    """
+    extract_rows() 결과를 Reservation 리스트로 변환합니다. (필드가 빠진 행은 건너뜀)
+    """
+    # 가격 카탈로그
+    price_catalog = load_price_data()
 
-    reservations = page.locator(details_container_selector).all()
     scraped_data = []
+    field_names = list(RESERVATION_FIELD_SELECTORS.keys())
 
-    for res in reservations:
-        try:
-            # 고객명
-            name = res.locator("h6.css-qdk4z1").inner_text(timeout=3000)
-
-            # 예약번호
-            reservation_no = res.locator("h6.css-1r042ka").inner_text(timeout=3000)
-
-            # 국가
-            nationality = res.locator("span.css-xcju41").inner_text(timeout=3000)
-
-            # 예약시간
-            time_text = res.locator("p.css-17exa0r").inner_text(timeout=3000)
-            reservation_time = time_text.replace("Time Request:", "").strip()
-
-            # 예약상품
-            product_name = res.locator("p.css-1q5lgor").inner_text(timeout=3000)
-
-            # 채널 (MuiAvatar에서 추출 - L, VI 등)
-            channel = res.locator("div.MuiAvatar-root").inner_text(timeout=3000)
-
-            # 인원구분 (p.css-mdkayp에서 추출)
-            person_info = res.locator("p.css-mdkayp").inner_text(timeout=3000)
-
-            # 금액 계산
-            price = calculate_price(product_name, price_data)
-
-            scraped_data.append({
-                "날짜": reservation_date,
-                "팀": team_name,
-                "고객명": name,
-                "예약번호": reservation_no,
-                "채널": channel,
-                "인원구분": person_info,
-                "국가": nationality,
-                "예약상품": product_name,
-                "예약시간": reservation_time,
-                "금액": price,
-                "is_new": ""
-            })
-        except Exception as e:
-            print(f"예약 정보 추출 실패: {e}")
+    for team_name, values in rows:
+        fields = dict(zip(field_names, values))
+        missing = [name for name, value in fields.items() if value is None]
+        if missing:
+            print(f"예약 정보 추출 실패: {', '.join(missing)} 항목 없음")
             continue
 
+        fields["예약시간"] = fields["예약시간"].replace("Time Request:", "").strip()
+
+        reservation = Reservation.from_headers(fields)
+        reservation.date = reservation_date
+        reservation.team = team_name
+        reservation.price = price_catalog.price(reservation.product)
+        scraped_data.append(reservation)
+
     return scraped_data
 
 
+@traced(attrs=("reservation_date",))
+async def scrape_date_async(
+    page: PageApi,
+    target_day: str,
+    reservation_date: str,
+    navigation_mode: str = NAVIGATION_MODE
+) -> list[Reservation]:
+    """
+    한 날짜를 선택해 예약 내역을 스크래핑합니다.
+    예약이 있었던 경우 다음 날짜 조회를 위해 화면을 초기화합니다.
+
+    Args:
+        page: 로그인된 Playwright Page 객체
+        target_day: 달력에서 클릭할 일(day) 문자열 (예: "18")
+        reservation_date: 예약 날짜 (예: "2026-01-18")
+        navigation_mode: 화면 초기화 방식 ("inplace" 또는 "reload")
+
+    Returns:
+        list[Reservation]: 예약 정보 리스트 (예약이 없으면 빈 리스트)
+    """
+    if SCRAPE_MODE == "api":
+        return await scrape_date_from_api_async(page, target_day, reservation_date)
+
+    # 날짜 선택 (달력 닫힘 + 예약 목록 로딩까지 대기)
+    target = datetime.strptime(reservation_date, "%Y-%m-%d")
+    await click_date_button_async(page)
+    response = await click_calendar_date_async(page, target_day, target.year, target.month)
+
+    # 예약 내역 확인 (예약 목록 또는 빈 화면 표시 중 먼저 나타나는 쪽)
+    if not await has_reservations_async(page, response=response, reservation_date=reservation_date):
+        return []
+
+    # 예약 상세 조회 (각 단계는 다음 요소가 보일 때까지 대기, 모든 팀을 한 번에 펼침)
+    await click_reservation_text_async(page)
+    await click_team_button_async(page)
+
+    # 데이터 스크래핑
+    scraped_data = await scrape_details_async(page, reservation_date)
+
+    # 녹화 중이면 예약 상세 화면 저장 (오프라인 재현/벤치마크용)
+    if is_recording():
+        save_snapshot(reservation_date, await page.content(), len(scraped_data))
+
+    # 다음 날짜 조회를 위해 화면 초기화
+    await reset_page_async(page, navigation_mode)
+
+    return scraped_data
+
+
+def scrape_date(
+    page: Page,
+    target_day: str,
+    reservation_date: str,
+    navigation_mode: str = NAVIGATION_MODE
+) -> list[Reservation]:
+    """scrape_date_async()의 sync 진입점"""
+    return run_sync(scrape_date_async(SyncPage(page), target_day, reservation_date, navigation_mode))
+
+
+@traced(attrs=("reservation_date",))
+async def scrape_date_from_api_async(page: PageApi, target_day: str, reservation_date: str) -> list[Reservation]:
+    """
+    날짜를 선택할 때 SPA가 받아오는 예약 목록 API 응답에서 예약 내역을 추출합니다.
+    DOM 탐색과 예약/팀 펼치기 클릭이 필요 없으므로 페이지 초기화도 하지 않습니다.
+    """
+    if not RESERVATION_API_PATTERN:
+        raise RuntimeError("SCRAPE_MODE=api는 RESERVATION_API_PATTERN 설정이 필요합니다.")
+
+    target = datetime.strptime(reservation_date, "%Y-%m-%d")
+    await click_date_button_async(page)
+    response = await click_calendar_date_async(page, target_day, target.year, target.month)
+    # 오류 응답의 본문을 빈 예약 목록으로 저장하지 않도록 날짜 조회 실패로 처리
+    if not response.ok:
+        raise RuntimeError(f"예약 목록 API 응답 오류 ({response.status}): {reservation_date}")
+
+    scraped_data = map_reservation_payload(await response.json(), reservation_date)
+
+    price_catalog = load_price_data()
+    for reservation in scraped_data:
+        reservation.price = price_catalog.price(reservation.product)
+
+    return scraped_data
+
+
+def scrape_date_from_api(page: Page, target_day: str, reservation_date: str) -> list[Reservation]:
+    """scrape_date_from_api_async()의 sync 진입점"""
+    return run_sync(scrape_date_from_api_async(SyncPage(page), target_day, reservation_date))
+
+
 def extract_person_count(name: str) -> str:
     """
     고객명에서 인원수를 추출합니다.
@@ -206,42 +670,20 @@ def extract_person_count(name: str) -> str:
     return ""
 
 
-def load_price_data() -> dict:
+def load_price_data() -> PriceCatalog:
     """
-    price.json에서 가격 데이터를 로드합니다.
+    price.json의 가격 카탈로그를 반환합니다. (파일이 바뀐 경우에만 다시 읽음)
     """
-    try:
-        with open(PRICE_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except Exception as e:
-        print(f"가격 데이터 로드 실패: {e}")
-        return {}
+    return get_price_catalog()
 
 
-def calculate_price(product_name: str, price_data: dict) -> str:
+def calculate_price(product_name: str, price_data: PriceCatalog | dict) -> str:
     """
     상품명에서 가격을 계산합니다.
     예: "AB: PERSONAL STYLE CONSULTING + CUT + STYLING X 1" -> "110,000"
     """
-    # 상품명에서 순수 상품명 추출 (AB: 제거, X 숫자 제거)
-    clean_name = product_name
-
-    # "AB: " 같은 접두어 제거
-    if ": " in clean_name:
-        clean_name = clean_name.split(": ", 1)[1]
-
-    # " X 숫자" 부분에서 수량 추출 및 제거
-    quantity = 1
-    quantity_match = re.search(r'\s*X\s*(\d+)\s*$', clean_name, re.IGNORECASE)
-    if quantity_match:
-        quantity = int(quantity_match.group(1))
-        clean_name = re.sub(r'\s*X\s*\d+\s*$', '', clean_name, flags=re.IGNORECASE)
-
-    clean_name = clean_name.strip()
-
-    # 가격 찾기
-    unit_price = price_data.get(clean_name, price_data.get("DEFAULT", 0))
-    total_price = unit_price * quantity
+    if not isinstance(price_data, PriceCatalog):
+        price_data = PriceCatalog(price_data)
 
     # 천 단위 콤마 포맷
-    return f"{total_price:,}"
+    return f"{price_data.price(product_name):,}"
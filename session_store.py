@@ -0,0 +1,135 @@
+"""
+로그인 세션 저장 모듈
+로그인 후 BrowserContext의 storage state(쿠키 + localStorage)를 암호화하여 로컬 파일에 저장하고,
+다음 실행에서 불러와 세션이 유효하면 로그인 과정을 건너뜁니다.
+세션 확인/복원은 async 함수(*_async)로 구현하고, 같은 이름의 sync 함수는 sync playwright 객체용 진입점입니다.
+"""
+from pathlib import Path
+import base64
+import json
+import os
+from cryptography.fernet import Fernet, InvalidToken
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+from playwright.sync_api import Page, BrowserContext
+from scraper import login_async
+from sync_bridge import ContextApi, PageApi, SyncContext, SyncPage, run_sync, to_thread
+from tracing import traced, wait_span
+from config import TARGET_URL, SESSION_FILE, SESSION_ENCRYPTION_KEY
+
+LOGGED_IN_SELECTOR = "button.MuiIconButton-edgeEnd"
+LOGGED_OUT_SELECTOR = 'button[aria-label="log in"]'
+
+
+def _fernet(secret: str, salt: bytes) -> Fernet:
+    """비밀값과 salt로 Fernet 키 생성 (PBKDF2-SHA256)"""
+    kdf = PBKDF2HMAC(algorithm=hashes.SHA256(), length=32, salt=salt, iterations=200_000)
+    return Fernet(base64.urlsafe_b64encode(kdf.derive(secret.encode("utf-8"))))
+
+
+def save_state(storage_state: dict, path: str = SESSION_FILE, secret: str = SESSION_ENCRYPTION_KEY) -> bool:
+    """storage state를 암호화하여 저장 (비밀값이 없으면 저장하지 않음)"""
+    if not secret:
+        return False
+
+    salt = os.urandom(16)
+    token = _fernet(secret, salt).encrypt(json.dumps(storage_state).encode("utf-8"))
+
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = target.with_suffix(".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"salt": base64.b64encode(salt).decode("ascii"), "token": token.decode("ascii")}, f)
+    os.chmod(tmp_path, 0o600)
+    os.replace(tmp_path, target)
+    return True
+
+
+def load_state(path: str = SESSION_FILE, secret: str = SESSION_ENCRYPTION_KEY) -> dict | None:
+    """저장된 storage state를 복호화하여 반환 (없거나 복호화 실패 시 None)"""
+    if not secret:
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            stored = json.load(f)
+        salt = base64.b64decode(stored["salt"])
+        return json.loads(_fernet(secret, salt).decrypt(stored["token"].encode("ascii")))
+    except FileNotFoundError:
+        return None
+    except (InvalidToken, KeyError, ValueError) as e:
+        print(f"[WARNING] 저장된 세션을 읽을 수 없어 새로 로그인합니다: {type(e).__name__}")
+        return None
+
+
+async def is_logged_in_async(page: PageApi, timeout: int = 10000) -> bool:
+    """
+    사용자 메뉴 버튼과 로그인 버튼 중 먼저 나타나는 쪽으로 로그인 상태를 확인합니다.
+    """
+    user_menu = page.locator(LOGGED_IN_SELECTOR)
+    try:
+        with wait_span("session_probe", timeout):
+            await user_menu.or_(page.locator(LOGGED_OUT_SELECTOR)).first.wait_for(state="visible", timeout=timeout)
+        return await user_menu.first.is_visible()
+    except Exception:
+        return False
+
+
+def is_logged_in(page: Page, timeout: int = 10000) -> bool:
+    """is_logged_in_async()의 sync 진입점"""
+    return run_sync(is_logged_in_async(SyncPage(page), timeout))
+
+
+async def restore_state_async(page: PageApi, context: ContextApi, storage_state: dict):
+    """
+    저장된 쿠키를 컨텍스트에 추가하고, 현재 페이지 origin의 localStorage 값을 채운 뒤 새로고침합니다.
+    """
+    await context.add_cookies(storage_state.get("cookies", []))
+
+    origin = await page.evaluate("location.origin")
+    items = [
+        item
+        for entry in storage_state.get("origins", [])
+        if entry.get("origin") == origin
+        for item in entry.get("localStorage", [])
+    ]
+    if items:
+        await page.evaluate(
+            "items => items.forEach(item => localStorage.setItem(item.name, item.value))",
+            items
+        )
+    await page.reload()
+
+
+def restore_state(page: Page, context: BrowserContext, storage_state: dict):
+    """restore_state_async()의 sync 진입점"""
+    run_sync(restore_state_async(SyncPage(page), SyncContext(context), storage_state))
+
+
+@traced()
+async def ensure_logged_in_async(page: PageApi, context: ContextApi, email: str, password: str) -> str:
+    """
+    세션이 유효하면 로그인을 건너뛰고, 아니면 저장된 세션 복원 → 전체 로그인 순으로 시도합니다.
+    전체 로그인을 한 경우 새 세션을 저장합니다. (세션 파일 복호화/암호화는 이벤트 루프 밖에서 실행)
+
+    Returns:
+        str: "existing" (이미 로그인됨), "restored" (저장된 세션 사용), "login" (새로 로그인)
+    """
+    await page.goto(TARGET_URL)
+    if await is_logged_in_async(page):
+        return "existing"
+
+    storage_state = await to_thread(load_state)
+    if storage_state:
+        await restore_state_async(page, context, storage_state)
+        if await is_logged_in_async(page):
+            return "restored"
+        print("저장된 세션이 만료되어 새로 로그인합니다.")
+
+    await login_async(page, email, password)
+    await to_thread(save_state, await context.storage_state())
+    return "login"
+
+
+def ensure_logged_in(page: Page, context: BrowserContext, email: str, password: str) -> str:
+    """ensure_logged_in_async()의 sync 진입점"""
+    return run_sync(ensure_logged_in_async(SyncPage(page), SyncContext(context), email, password))
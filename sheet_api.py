@@ -0,0 +1,194 @@
+"""
+Google Sheets API 호출 모듈
+gspread의 모든 HTTP 요청을 한 곳에서 감싸, 할당량 초과(429)와 일시적인 서버 오류(5xx)를
+지터(jitter)를 준 지수 백오프로 재시도하고 실행 동안의 API 호출 수와 응답 시간을 집계합니다.
+get_gspread_client()가 이 클라이언트로 인증하므로 시트 열기부터 저장까지 모든 호출에 적용됩니다.
+"""
+from collections import defaultdict
+from http import HTTPStatus
+import random
+import re
+import threading
+import time
+from gspread.exceptions import APIError
+from gspread.http_client import HTTPClient
+from config import SHEET_MAX_RETRIES, SHEET_BACKOFF_BASE, SHEET_BACKOFF_MAX
+
+# 다시 시도해도 되는 상태 코드 (요청 시간 초과, 할당량 초과)
+RETRYABLE_STATUS = (HTTPStatus.REQUEST_TIMEOUT, HTTPStatus.TOO_MANY_REQUESTS)
+# Drive API는 사용량 제한을 403으로 응답
+RATE_LIMIT_REASONS = ("rateLimitExceeded", "userRateLimitExceeded", "dailyLimitExceeded")
+
+# 같은 요청을 반복해도 결과가 같은 POST 요청 (값 읽기/덮어쓰기/지우기)
+# 그 밖의 POST(values:append, 행 삽입 등 구조를 바꾸는 batchUpdate, 파일 생성)는 5xx 시 다시 시도하지 않음
+IDEMPOTENT_POSTS = ("values:batchGet", "values:batchUpdate", "values:batchClear", "values:clear")
+
+# 스프레드시트 키 이후 경로 (예: /values/crawlingDB!A1:append -> values:append)
+SHEETS_PATH_RE = re.compile(r"/spreadsheets/[^/:]+(.*)$")
+
+
+def status_of(error: APIError) -> int:
+    return getattr(error.response, "status_code", None) or error.code
+
+
+def is_rate_limited(error: APIError) -> bool:
+    """요청이 처리되지 않고 거절된 할당량 초과 오류인지 확인"""
+    status = status_of(error)
+    if status == HTTPStatus.TOO_MANY_REQUESTS:
+        return True
+    if status == HTTPStatus.FORBIDDEN:
+        reasons = [e.get("reason") for e in error.error.get("errors", [])]
+        return any(reason in RATE_LIMIT_REASONS for reason in reasons)
+    return False
+
+
+def is_retryable(error: APIError, idempotent: bool = True) -> bool:
+    """
+    다시 시도할 오류인지 확인합니다.
+    행 추가(append), 행 삽입(batchUpdate)처럼 반복하면 결과가 달라지는 요청은 5xx 응답 시 이미 반영되었을 수 있으므로
+    할당량 초과로 거절된 경우에만 다시 시도합니다.
+    """
+    if is_rate_limited(error):
+        return True
+    if not idempotent:
+        return False
+    status = status_of(error)
+    return status in RETRYABLE_STATUS or status >= HTTPStatus.INTERNAL_SERVER_ERROR
+
+
+def backoff_delay(
+    attempt: int,
+    base: float = SHEET_BACKOFF_BASE,
+    cap: float = SHEET_BACKOFF_MAX
+) -> float:
+    """attempt번째 재시도 전 대기 시간 (0 ~ min(cap, base * 2^attempt) 사이 임의 값, full jitter)"""
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+def endpoint_label(method: str, endpoint: str) -> str:
+    """집계용 요청 이름 (예: "POST values:append", "GET metadata", "GET drive.files")"""
+    match = SHEETS_PATH_RE.search(endpoint.split("?")[0])
+    if match is None:
+        name = "drive.files" if "/drive/" in endpoint else endpoint
+    else:
+        path = match.group(1).lstrip("/:")
+        # values/<범위>:append 처럼 범위가 들어간 경로는 범위를 뺀 이름으로 묶음
+        name = re.sub(r"^values/[^:]+", "values", path) or "metadata"
+    return f"{method.upper()} {name}"
+
+
+def is_idempotent(label: str) -> bool:
+    """
+    endpoint_label()의 요청 이름으로 반복해도 안전한 요청인지 확인합니다.
+    GET/PUT과 IDEMPOTENT_POSTS만 안전한 것으로 보고, 나머지는 반영 여부를 알 수 없으므로 안전하지 않은 것으로 봅니다.
+    """
+    method, _, name = label.partition(" ")
+    if method in ("GET", "PUT"):
+        return True
+    return method == "POST" and name in IDEMPOTENT_POSTS
+
+
+class ApiStats:
+    """요청 이름별 호출 수, 재시도 수, 응답 시간 집계 (여러 스레드에서 동시에 사용 가능)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._records = defaultdict(list)  # 요청 이름 -> [(elapsed_ms, ok)]
+        self.retries = defaultdict(int)  # 요청 이름 -> 재시도 수
+        self.wait_seconds = 0.0  # 백오프로 대기한 총 시간
+
+    def record(self, label: str, elapsed_ms: float, ok: bool):
+        with self._lock:
+            self._records[label].append((elapsed_ms, ok))
+
+    def record_retry(self, label: str, delay: float):
+        with self._lock:
+            self.retries[label] += 1
+            self.wait_seconds += delay
+
+    @property
+    def call_count(self) -> int:
+        with self._lock:
+            return sum(len(values) for values in self._records.values())
+
+    def reset(self):
+        with self._lock:
+            self._records.clear()
+            self.retries.clear()
+            self.wait_seconds = 0.0
+
+    def summary_lines(self) -> list[str]:
+        """요청 이름별 요약 (호출 수가 많은 순서)"""
+        with self._lock:
+            records = {label: list(values) for label, values in self._records.items()}
+            retries = dict(self.retries)
+            wait_seconds = self.wait_seconds
+
+        if not records:
+            return []
+
+        lines = [f"{'request':<28}{'calls':>6}{'errors':>7}{'retries':>8}{'avg_ms':>9}{'max_ms':>9}"]
+        for label, values in sorted(records.items(), key=lambda item: -len(item[1])):
+            elapsed = [v[0] for v in values]
+            lines.append(
+                f"{label:<28}{len(values):>6}{sum(1 for v in values if not v[1]):>7}"
+                f"{retries.get(label, 0):>8}{sum(elapsed) / len(elapsed):>9.0f}{max(elapsed):>9.0f}"
+            )
+        total_calls = sum(len(values) for values in records.values())
+        lines.append(f"총 API 호출: {total_calls}회 (재시도 {sum(retries.values())}회, 백오프 대기 {wait_seconds:.1f}초)")
+        return lines
+
+    def print_summary(self):
+        lines = self.summary_lines()
+        if not lines:
+            return
+        print("\n[Google Sheets API 요약]")
+        for line in lines:
+            print(f"  {line}")
+
+
+# 전역 집계
+api_stats = ApiStats()
+
+
+def call_with_retry(
+    func,
+    label: str,
+    idempotent: bool = True,
+    max_retries: int = SHEET_MAX_RETRIES,
+    stats: ApiStats = api_stats,
+    sleep=time.sleep
+):
+    """
+    func()를 호출하고, 다시 시도할 수 있는 APIError면 백오프 후 최대 max_retries번 다시 호출합니다.
+    모든 시도의 응답 시간을 stats에 기록합니다.
+    """
+    attempt = 0
+    while True:
+        start = time.perf_counter()
+        try:
+            result = func()
+        except APIError as e:
+            stats.record(label, (time.perf_counter() - start) * 1000, ok=False)
+            if attempt >= max_retries or not is_retryable(e, idempotent):
+                raise
+            delay = backoff_delay(attempt)
+            stats.record_retry(label, delay)
+            print(f"[WARNING] Sheets API {label} 실패({status_of(e)}), {delay:.1f}초 후 다시 시도 ({attempt + 1}/{max_retries})")
+            sleep(delay)
+            attempt += 1
+            continue
+        stats.record(label, (time.perf_counter() - start) * 1000, ok=True)
+        return result
+
+
+class RetryingHTTPClient(HTTPClient):
+    """모든 요청에 재시도와 호출 집계를 적용하는 gspread HTTP 클라이언트"""
+
+    def request(self, method: str, endpoint: str, *args, **kwargs):
+        label = endpoint_label(method, endpoint)
+        return call_with_retry(
+            lambda: super(RetryingHTTPClient, self).request(method, endpoint, *args, **kwargs),
+            label,
+            idempotent=is_idempotent(label),
+        )
@@ -0,0 +1,164 @@
+"""
+시트 저장소 모듈
+sync_to_worksheet()가 사용하는 gspread Worksheet 메서드만 정의한 인터페이스와,
+구글 API 없이 같은 동작을 하는 SQLite 기반 로컬 워크시트를 제공합니다.
+SHEET_BACKEND=local로 실행하거나 테스트/벤치마크에서 실제 시트 대신 사용합니다.
+"""
+from pathlib import Path
+from typing import Protocol
+import json
+import re
+import sqlite3
+from gspread.utils import a1_range_to_grid_range, a1_to_rowcol, rowcol_to_a1
+
+
+class WorksheetBackend(Protocol):
+    """시트 저장에 필요한 Worksheet 메서드 (gspread.Worksheet가 그대로 만족)"""
+
+    id: int
+
+    def get_all_values(self) -> list[list]: ...
+
+    def batch_get(self, ranges: list[str]) -> list[list[list]]: ...
+
+    def append_row(self, values: list): ...
+
+    def append_rows(self, values: list[list]) -> dict: ...
+
+    def insert_row(self, values: list, index: int): ...
+
+    def batch_update(self, data: list[dict]): ...
+
+
+def to_cell(value) -> str:
+    """시트에 저장되는 셀 값 (bool은 구글 시트처럼 TRUE/FALSE)"""
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    return "" if value is None else str(value)
+
+
+def trim_row(row: list) -> list:
+    """구글 시트 응답처럼 행 끝의 빈 셀 제거"""
+    end = len(row)
+    while end and row[end - 1] == "":
+        end -= 1
+    return row[:end]
+
+
+class LocalWorksheet:
+    """
+    SQLite 파일(또는 ":memory:")에 행을 저장하는 워크시트
+    읽은 셀 수와 API 호출 수를 세어 구글 시트 사용량을 가늠할 수 있습니다.
+    """
+
+    id = 0
+    title = "local"
+
+    def __init__(self, path: str = ":memory:", rows: list[list] | None = None):
+        self.path = path
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        # SheetWriter 스레드에서 사용할 수 있도록 스레드 검사 해제 (동시 사용은 없음)
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS cells_rows (row_number INTEGER PRIMARY KEY, cells TEXT NOT NULL)"
+        )
+        self.read_cells = 0
+        self.api_calls = 0
+        self.update_calls = 0
+        if rows:
+            self._write_rows(self.row_count + 1, rows)
+
+    def close(self):
+        self.conn.close()
+
+    @property
+    def row_count(self) -> int:
+        return self.conn.execute("SELECT COALESCE(MAX(row_number), 0) FROM cells_rows").fetchone()[0]
+
+    @property
+    def rows(self) -> list[list]:
+        """전체 행 (테스트 확인용, 호출 수에 포함하지 않음)"""
+        return [
+            json.loads(cells)
+            for _, cells in self.conn.execute("SELECT row_number, cells FROM cells_rows ORDER BY row_number")
+        ]
+
+    def _write_rows(self, start_row: int, rows: list[list]):
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO cells_rows (row_number, cells) VALUES (?, ?)",
+            [
+                (start_row + offset, json.dumps([to_cell(v) for v in row], ensure_ascii=False))
+                for offset, row in enumerate(rows)
+            ]
+        )
+        self.conn.commit()
+
+    def _read_range(self, a1_range: str) -> list[list]:
+        grid = a1_range_to_grid_range(a1_range)
+        start_row = grid.get("startRowIndex", 0) + 1
+        end_row = grid.get("endRowIndex", self.row_count)
+        start_col = grid.get("startColumnIndex", 0)
+        end_col = grid.get("endColumnIndex")
+
+        by_row = dict(self.conn.execute(
+            "SELECT row_number, cells FROM cells_rows WHERE row_number BETWEEN ? AND ?",
+            (start_row, end_row)
+        ))
+        values = [
+            trim_row(json.loads(by_row[row_number])[start_col:end_col]) if row_number in by_row else []
+            for row_number in range(start_row, end_row + 1)
+        ]
+        while values and not values[-1]:
+            values.pop()
+        self.read_cells += sum(len(v) for v in values)
+        return values
+
+    def get_all_values(self) -> list[list]:
+        self.api_calls += 1
+        values = [trim_row(row) for row in self.rows]
+        self.read_cells += sum(len(v) for v in values)
+        return values
+
+    def batch_get(self, ranges: list[str]) -> list[list[list]]:
+        self.api_calls += 1
+        return [self._read_range(a1_range) for a1_range in ranges]
+
+    def append_row(self, values: list):
+        self.api_calls += 1
+        self._write_rows(self.row_count + 1, [values])
+
+    def append_rows(self, values: list[list]) -> dict:
+        self.api_calls += 1
+        start_row = self.row_count + 1
+        self._write_rows(start_row, values)
+        last_col = re.sub(r"\d", "", rowcol_to_a1(1, max((len(row) for row in values), default=1)))
+        return {"updates": {"updatedRange": f"{self.title}!A{start_row}:{last_col}{self.row_count}"}}
+
+    def insert_row(self, values: list, index: int = 1):
+        self.api_calls += 1
+        # 기본 키 충돌을 피하기 위해 음수로 옮긴 뒤 한 칸씩 밀기
+        self.conn.execute("UPDATE cells_rows SET row_number = -(row_number + 1) WHERE row_number >= ?", (index,))
+        self.conn.execute("UPDATE cells_rows SET row_number = -row_number WHERE row_number < 0")
+        self._write_rows(index, [values])
+
+    def batch_update(self, data: list[dict]):
+        self.api_calls += 1
+        self.update_calls += 1
+        for item in data:
+            row, col = a1_to_rowcol(item["range"])
+            for offset, values in enumerate(item["values"]):
+                existing = self.conn.execute(
+                    "SELECT cells FROM cells_rows WHERE row_number = ?", (row + offset,)
+                ).fetchone()
+                cells = json.loads(existing[0]) if existing else []
+                cells += [""] * (col - 1 + len(values) - len(cells))
+                cells[col - 1:col - 1 + len(values)] = [to_cell(v) for v in values]
+                self._write_rows(row + offset, [cells])
+
+    def delete_row(self, index: int):
+        """행 삭제 (테스트에서 시트를 직접 편집한 상황을 흉내 낼 때 사용)"""
+        self.conn.execute("DELETE FROM cells_rows WHERE row_number = ?", (index,))
+        self.conn.execute("UPDATE cells_rows SET row_number = -(row_number - 1) WHERE row_number > ?", (index,))
+        self.conn.execute("UPDATE cells_rows SET row_number = -row_number WHERE row_number < 0")
+        self.conn.commit()
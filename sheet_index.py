@@ -0,0 +1,190 @@
+"""
+구글 시트 예약번호 로컬 인덱스 모듈
+예약번호별 시트 행 번호와 내용 해시를 SQLite 파일에 보관하고,
+매 실행 시 마지막으로 확인한 행 이후의 예약번호 컬럼만 읽어 시트와 맞춥니다.
+중복 확인에 필요한 네트워크 트래픽이 전체 이력이 아닌 새로 추가된 행 수에 비례합니다.
+"""
+from pathlib import Path
+import hashlib
+import re
+import sqlite3
+from gspread.utils import rowcol_to_a1
+from config import RESERVATION_DATA_HEADERS
+
+# 예약번호 컬럼 (A1 표기의 열 문자)
+RESERVATION_NO_COLUMN = re.sub(r"\d", "", rowcol_to_a1(1, RESERVATION_DATA_HEADERS.index("예약번호") + 1))
+# 헤더 행 범위 (예: A1:K1)
+HEADER_RANGE = f"A1:{rowcol_to_a1(1, len(RESERVATION_DATA_HEADERS))}"
+
+
+def content_hash(row: list) -> str:
+    """시트 행 내용의 해시 (is_new 컬럼 제외, 시트에서 읽은 짧은 행은 빈 값으로 채움)"""
+    is_new_idx = RESERVATION_DATA_HEADERS.index("is_new")
+    padded = list(row[:len(RESERVATION_DATA_HEADERS)])
+    padded += [""] * (len(RESERVATION_DATA_HEADERS) - len(padded))
+    values = [str(value) for idx, value in enumerate(padded) if idx != is_new_idx]
+    return hashlib.sha1("\x1f".join(values).encode("utf-8")).hexdigest()
+
+
+def parse_updated_start_row(response: dict) -> int | None:
+    """append_rows 응답의 updatedRange(예: 'crawlingDB!A120:K125')에서 시작 행 번호를 추출"""
+    try:
+        updated_range = response["updates"]["updatedRange"]
+    except (KeyError, TypeError):
+        return None
+    match = re.search(r"![A-Z]+(\d+)", updated_range)
+    return int(match.group(1)) if match else None
+
+
+class SheetIndex:
+    """예약번호 -> (행 번호, 내용 해시) 로컬 인덱스"""
+
+    def __init__(self, path: str, sheet_id: str):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        # SheetWriter 스레드에서 열고 메인 스레드에서 닫을 수 있도록 스레드 검사 해제 (동시 사용은 없음)
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS reservations (
+                reservation_no TEXT PRIMARY KEY,
+                row_number INTEGER NOT NULL,
+                content_hash TEXT
+            );
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+        """)
+
+        # 다른 시트의 인덱스라면 초기화
+        if self._get_meta("sheet_id") != sheet_id:
+            self.clear()
+            self._set_meta("sheet_id", sheet_id)
+            self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+    def _get_meta(self, key: str) -> str | None:
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str):
+        self.conn.execute(
+            "INSERT INTO meta (key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, value)
+        )
+
+    @property
+    def row_count(self) -> int:
+        """시트에서 확인한 마지막 행 번호 (헤더 포함, 빈 시트는 0)"""
+        return int(self._get_meta("row_count") or 0)
+
+    def set_row_count(self, row_count: int):
+        self._set_meta("row_count", str(row_count))
+        self.conn.commit()
+
+    def clear(self):
+        """인덱스 전체 초기화"""
+        self.conn.execute("DELETE FROM reservations")
+        self.conn.execute("DELETE FROM meta WHERE key = 'row_count'")
+        self.conn.commit()
+
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM reservations").fetchone()[0]
+
+    def _reservation_no_at(self, row_number: int) -> str | None:
+        row = self.conn.execute(
+            "SELECT reservation_no FROM reservations WHERE row_number = ?", (row_number,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def _index_column(self, start_row: int, values: list[list]):
+        """start_row부터 읽은 예약번호 컬럼 값을 인덱스에 반영 (기존 해시는 유지)"""
+        self.conn.executemany(
+            "INSERT INTO reservations (reservation_no, row_number) VALUES (?, ?) "
+            "ON CONFLICT(reservation_no) DO UPDATE SET row_number = excluded.row_number",
+            [
+                (row[0], start_row + offset)
+                for offset, row in enumerate(values)
+                if row and row[0]
+            ]
+        )
+        self._set_meta("row_count", str(start_row + len(values) - 1))
+        self.conn.commit()
+
+    def reconcile(self, worksheet) -> list:
+        """
+        시트와 인덱스를 맞추고 헤더 행을 반환합니다.
+        마지막으로 확인한 행부터 예약번호 컬럼만 읽고, 그 행의 예약번호가 인덱스와 다르면
+        (행 삭제/정렬 등) 예약번호 컬럼 전체를 다시 읽어 인덱스를 재구성합니다.
+
+        Returns:
+            list: 시트의 첫 행 (비어 있으면 빈 리스트)
+        """
+        last_row = self.row_count
+        if last_row >= 2:
+            header, tail = worksheet.batch_get(
+                [HEADER_RANGE, f"{RESERVATION_NO_COLUMN}{last_row}:{RESERVATION_NO_COLUMN}"]
+            )
+            anchor = tail[0][0] if tail and tail[0] else ""
+            if anchor and anchor == self._reservation_no_at(last_row):
+                self._index_column(last_row, tail)
+                return header[0] if header else []
+            print("시트 인덱스가 시트와 일치하지 않아 예약번호 컬럼 전체를 다시 읽습니다.")
+
+        self.clear()
+        header, column = worksheet.batch_get(
+            [HEADER_RANGE, f"{RESERVATION_NO_COLUMN}2:{RESERVATION_NO_COLUMN}"]
+        )
+        header_row = header[0] if header else []
+        if column:
+            self._index_column(2, column)
+        else:
+            self.set_row_count(1 if header_row else 0)
+        return header_row
+
+    def shift_rows(self, offset: int):
+        """행 삽입으로 기존 행 번호가 밀린 경우 반영"""
+        self.conn.execute("UPDATE reservations SET row_number = row_number + ?", (offset,))
+        self._set_meta("row_count", str(self.row_count + offset))
+        self.conn.commit()
+
+    def lookup(self, reservation_nos: list[str]) -> dict[str, tuple[int, str | None]]:
+        """주어진 예약번호 중 인덱스에 있는 것의 (행 번호, 내용 해시)를 반환"""
+        found = {}
+        unique_nos = list(dict.fromkeys(no for no in reservation_nos if no))
+        # SQLite 변수 개수 제한을 피하기 위해 나눠서 조회
+        for i in range(0, len(unique_nos), 500):
+            chunk = unique_nos[i:i + 500]
+            placeholders = ",".join("?" * len(chunk))
+            for reservation_no, row_number, row_hash in self.conn.execute(
+                f"SELECT reservation_no, row_number, content_hash FROM reservations "
+                f"WHERE reservation_no IN ({placeholders})",
+                chunk
+            ):
+                found[reservation_no] = (row_number, row_hash)
+        return found
+
+    def record_rows(self, start_row: int, rows: list[list]):
+        """시트에 연속으로 쓴 행들의 예약번호/행 번호/내용 해시를 기록"""
+        self.record_row_numbers([(start_row + offset, row) for offset, row in enumerate(rows)])
+
+    def record_row_numbers(self, entries: list[tuple[int, list]]):
+        """(행 번호, 시트 행) 목록의 예약번호/행 번호/내용 해시를 기록"""
+        if not entries:
+            return
+        reservation_no_idx = RESERVATION_DATA_HEADERS.index("예약번호")
+        self.conn.executemany(
+            "INSERT INTO reservations (reservation_no, row_number, content_hash) VALUES (?, ?, ?) "
+            "ON CONFLICT(reservation_no) DO UPDATE SET "
+            "row_number = excluded.row_number, content_hash = excluded.content_hash",
+            [
+                (row[reservation_no_idx], row_number, content_hash(row))
+                for row_number, row in entries
+            ]
+        )
+        last_row = max(row_number for row_number, _ in entries)
+        if last_row > self.row_count:
+            self._set_meta("row_count", str(last_row))
+        self.conn.commit()
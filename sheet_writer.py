@@ -0,0 +1,196 @@
+"""
+구글 시트 백그라운드 저장 모듈
+날짜별 스크래핑 결과를 큐로 받아 모아 두었다가 일정 건수 또는 일정 시간마다 구글 시트에 저장합니다.
+브라우저 작업과 시트 네트워크 I/O가 겹쳐 실행되고, 실행 중 오류가 나도 이미 저장한 날짜는 남습니다.
+
+AsyncSheetWriter가 이벤트 루프에서 동작하는 작성기이고, SheetWriter는 sync 실행 경로(main.main)에서
+같은 작성기를 백그라운드 스레드의 이벤트 루프로 실행하는 진입점입니다.
+"""
+import asyncio
+import threading
+from gsheets_client import open_backend, sync_to_worksheet
+from reservation import Reservation
+from config import SHEET_UPSERT, SHEET_FLUSH_SIZE, SHEET_FLUSH_INTERVAL
+
+_STOP = object()
+
+
+class AsyncSheetWriter:
+    """스크래핑 결과를 모아서 구글 시트에 저장하는 asyncio 작성기 (저장(gspread)은 스레드에서 실행)"""
+
+    def __init__(
+        self,
+        flush_size: int = SHEET_FLUSH_SIZE,
+        flush_interval: float = SHEET_FLUSH_INTERVAL,
+        upsert: bool = SHEET_UPSERT,
+        open_target=None
+    ):
+        """
+        Args:
+            flush_size: 모인 예약이 이 건수 이상이면 저장
+            flush_interval: 첫 예약이 들어온 뒤 이 시간(초)이 지나면 저장
+            upsert: 변경된 기존 예약 갱신 여부
+            open_target: (worksheet, index)를 반환하는 함수 (기본값: 설정된 저장소)
+        """
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.upsert = upsert
+        self._open_target = open_target or open_backend
+
+        self.new_reservations = []
+        self.existing_reservations = []
+        self.modified_reservations = []
+        self.error = None
+
+        self._queue = asyncio.Queue()
+        # 저장 중에도 다음 묶음을 계속 모으되, 시트와 인덱스는 한 번에 한 묶음씩만 갱신
+        # (중복 판정과 행 위치가 앞선 저장 결과에 의존하므로 동시에 저장하지 않음)
+        self._flush_slots = asyncio.BoundedSemaphore(1)
+        self._flushes = set()
+        self._task = None
+        self._worksheet = None
+        self._index = None
+        self._closed = False
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+        return self
+
+    def put(self, rows: list[Reservation]):
+        """한 날짜의 스크래핑 결과를 저장 대기열에 추가"""
+        if rows:
+            self._queue.put_nowait(rows)
+
+    async def close(self, raise_error: bool = True):
+        """
+        남은 결과를 저장하고 작성기를 종료합니다.
+
+        Raises:
+            Exception: raise_error=True이고 저장 중 오류가 있었던 경우
+        """
+        if not self._closed:
+            self._closed = True
+            self._queue.put_nowait(_STOP)
+            await self._task
+            if self._index is not None:
+                self._index.close()
+        if raise_error and self.error is not None:
+            raise self.error
+
+    def _sync(self, buffer: list[Reservation]):
+        if self._worksheet is None:
+            self._worksheet, self._index = self._open_target()
+        return sync_to_worksheet(self._worksheet, self._index, buffer, upsert=self.upsert)
+
+    async def _flush(self, buffer: list[Reservation]):
+        async with self._flush_slots:
+            if not buffer or self.error is not None:
+                return
+            try:
+                new, existing, modified = await asyncio.to_thread(self._sync, buffer)
+            except Exception as e:
+                # 이후 결과는 저장하지 않고, close()에서 오류를 알림
+                print(f"[ERROR] 구글 시트 저장 실패: {e}")
+                self.error = e
+                return
+            self.new_reservations.extend(new)
+            self.existing_reservations.extend(existing)
+            self.modified_reservations.extend(modified)
+
+    def _start_flush(self, buffer: list[Reservation]):
+        """모은 묶음을 저장하는 태스크 시작 (앞선 묶음이 저장 중이면 순서대로 대기)"""
+        task = asyncio.create_task(self._flush(buffer))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        buffer = []
+        deadline = None
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - loop.time())
+            try:
+                item = await asyncio.wait_for(self._queue.get(), timeout)
+            except asyncio.TimeoutError:
+                item = None
+
+            if item is _STOP:
+                self._start_flush(buffer)
+                await asyncio.gather(*self._flushes)
+                return
+
+            if item is not None:
+                if not buffer:
+                    deadline = loop.time() + self.flush_interval
+                buffer.extend(item)
+
+            if buffer and (len(buffer) >= self.flush_size or loop.time() >= deadline):
+                self._start_flush(buffer)
+                buffer = []
+                deadline = None
+
+
+class SheetWriter:
+    """AsyncSheetWriter를 백그라운드 스레드의 이벤트 루프에서 실행하는 작성기 (sync 실행 경로용)"""
+
+    def __init__(
+        self,
+        flush_size: int = SHEET_FLUSH_SIZE,
+        flush_interval: float = SHEET_FLUSH_INTERVAL,
+        upsert: bool = SHEET_UPSERT,
+        open_target=None
+    ):
+        """인자는 AsyncSheetWriter와 같습니다."""
+        self._writer = AsyncSheetWriter(flush_size, flush_interval, upsert, open_target)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._closed = False
+
+    @property
+    def new_reservations(self) -> list[Reservation]:
+        return self._writer.new_reservations
+
+    @property
+    def existing_reservations(self) -> list[Reservation]:
+        return self._writer.existing_reservations
+
+    @property
+    def modified_reservations(self) -> list[Reservation]:
+        return self._writer.modified_reservations
+
+    @property
+    def error(self) -> Exception | None:
+        return self._writer.error
+
+    def _call(self, coroutine):
+        """백그라운드 이벤트 루프에서 코루틴을 실행하고 끝날 때까지 대기"""
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    async def _start(self):
+        self._writer.start()
+
+    def start(self):
+        self._thread.start()
+        self._call(self._start())
+        return self
+
+    def put(self, rows: list[Reservation]):
+        """한 날짜의 스크래핑 결과를 저장 대기열에 추가 (워커 스레드에서 호출 가능)"""
+        if rows:
+            self._loop.call_soon_threadsafe(self._writer.put, rows)
+
+    def close(self, raise_error: bool = True):
+        """
+        남은 결과를 저장하고 작성기와 백그라운드 스레드를 종료합니다.
+
+        Raises:
+            Exception: raise_error=True이고 저장 중 오류가 있었던 경우
+        """
+        if not self._closed:
+            self._closed = True
+            self._call(self._writer.close(raise_error=False))
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+        if raise_error and self.error is not None:
+            raise self.error
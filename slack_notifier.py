@@ -4,6 +4,9 @@ Slack 알림 전송 모듈
 import requests
 import json
 import os
+from reservation import Reservation
+from snapshot_diff import ReservationChange, HEADER_BY_FIELD
+from tracing import traced
 
 
 class SlackNotifier:
@@ -12,6 +15,7 @@ class SlackNotifier:
     def __init__(self, webhook_url=None):
         self.webhook_url = webhook_url or os.getenv('SLACK_WEBHOOK_URL')
 
+    @traced("slack_send_message")
     def send_message(self, message: str) -> bool:
         """
         슬랙 메시지 전송
@@ -48,15 +52,15 @@ class SlackNotifier:
     def _append_reservation_block(
         self,
         message: list,
-        res: dict,
+        res: Reservation,
         idx: int,
         include_date: bool,
         is_new_section: bool
     ):
         """예약 정보 블록을 메시지에 추가"""
         # 고객명
-        name = res.get('고객명', '고객')
-        team = res.get('팀', '')
+        name = res.customer_name or '고객'
+        team = res.team
         if team and team != 'TEAM 1':
             name_line = f"*{idx}. {name}* ({team})"
         else:
@@ -64,20 +68,19 @@ class SlackNotifier:
         message.append(name_line)
 
         # 시간, 채널, 인원
-        time_str = res.get('예약시간', '시간미정')
-        channel = res.get('채널', '-')
-        people = res.get('인원구분', '-')
+        time_str = res.time or '시간미정'
+        channel = res.channel or '-'
+        people = res.people or '-'
 
         # 날짜 포함 여부
         if include_date:
-            date = res.get('날짜', '')
-            message.append(f"📅 {date} | 🕐 {time_str} | 🧭 {channel} | 👤 {people}")
+            message.append(f"📅 {res.date} | 🕐 {time_str} | 🧭 {channel} | 👤 {people}")
         else:
             message.append(f"🕐 {time_str} | 🧭 {channel} | 👤 {people}")
 
         # 서비스 및 가격
-        product = res.get('예약상품', '-')
-        price = self._parse_price(res.get('금액', '0'))
+        product = res.product or '-'
+        price = res.price
 
         if is_new_section:
             message.append(f"✂️ {product}")
@@ -86,26 +89,25 @@ class SlackNotifier:
         else:
             message.append(f"✂️ {product} | 💰 {price:,}원\n")
 
-    def _parse_price(self, price_str: str) -> int:
-        """가격 문자열을 정수로 변환"""
-        if isinstance(price_str, (int, float)):
-            return int(price_str)
-        try:
-            return int(price_str.replace(',', ''))
-        except (ValueError, AttributeError):
-            return 0
+    def _format_delta(self, field: str, before, after) -> str:
+        """변경된 필드 한 줄 (예: "예약시간: 10:00 → 11:00")"""
+        if field == "price":
+            before, after = f"{before:,}원", f"{after:,}원"
+        return f"{HEADER_BY_FIELD.get(field, field)}: {before or '-'} → {after or '-'}"
 
-    def _calculate_total_price(self, reservations: list[dict]) -> int:
+    def _calculate_total_price(self, reservations: list[Reservation]) -> int:
         """전체 예약의 총 매출 계산"""
-        return sum(self._parse_price(res.get('금액', '0')) for res in reservations)
+        return sum(res.price for res in reservations)
 
     def format_daily_summary_message(
         self,
-        today_reservations: list[dict],
-        new_reservations: list[dict],
+        today_reservations: list[Reservation],
+        new_reservations: list[Reservation],
         today_date: str,
         notify_everyone: bool = False,
-        sheet_url: str = None
+        sheet_url: str = None,
+        removed_reservations: list[Reservation] = None,
+        changed_reservations: list[ReservationChange] = None
     ) -> str:
         """
         당일 예약현황과 새로 추가된 예약을 구분하여 메시지 생성
@@ -116,6 +118,8 @@ class SlackNotifier:
             today_date: 오늘 날짜 (예: "2026-01-18")
             notify_everyone: @channel 알림 포함 여부
             sheet_url: 구글 시트 URL (선택)
+            removed_reservations: 지난 실행 이후 사라진(취소된) 예약 리스트 (선택, 있을 때만 표시)
+            changed_reservations: 지난 실행 이후 내용이 바뀐 예약 리스트 (선택, 있을 때만 표시)
 
         Returns:
             str: 포맷팅된 메시지
@@ -163,6 +167,28 @@ class SlackNotifier:
         else:
             message.append("새로 추가된 예약이 없습니다.")
 
+        # ===== 취소된 예약 섹션 =====
+        if removed_reservations:
+            message.append("\n❌ *[취소된 예약]*")
+            message.append("━━━━━━━━━━━━━━━━━━")
+            for idx, res in enumerate(removed_reservations, 1):
+                self._append_reservation_block(
+                    message, res, idx, include_date=True, is_new_section=False
+                )
+            removed_total = self._calculate_total_price(removed_reservations)
+            message.append(f"💸 취소 금액: *{removed_total:,}원* ({len(removed_reservations)}건)")
+
+        # ===== 변경된 예약 섹션 =====
+        if changed_reservations:
+            message.append("\n✏️ *[변경된 예약]*")
+            message.append("━━━━━━━━━━━━━━━━━━")
+            for idx, change in enumerate(changed_reservations, 1):
+                res = change.after
+                message.append(f"*{idx}. {res.customer_name or '고객'}* ({res.reservation_no}) 📅 {res.date}")
+                for field, (before, after) in change.deltas.items():
+                    message.append(f"  • {self._format_delta(field, before, after)}")
+                message.append("")
+
         # 시트 바로가기
         if sheet_url:
             message.append(f"\n🔗 <{sheet_url}|시트 바로가기>")
@@ -0,0 +1,239 @@
+"""
+실행 간 예약 변경 감지 모듈
+지난 실행에서 날짜별로 수집한 예약을 SQLite 스냅샷으로 보관하고, 이번 실행의 날짜별 결과와
+예약번호로 해시 조인해 추가/취소/변경(필드별 변경 내용)을 한 번의 순회로 분류합니다.
+
+- 비교는 이번 실행에서 조회한 날짜(와 월간 예약 현황에서 0건으로 확인해 건너뛴 날짜)만 대상으로 하고, 날짜 하나씩 스냅샷을 읽으므로
+  메모리 사용량은 전체 이력이 아닌 조회한 날짜의 예약 수에 비례합니다.
+- 스냅샷이 있는 날짜에서 지난 실행과 같은 예약은 이미 시트에 저장되어 있으므로 시트 작성기로 넘기지 않습니다.
+- 스냅샷은 시트 저장이 끝난 뒤 commit()으로 반영하므로, 실행이 실패하면 다음 실행에서 다시 비교합니다.
+"""
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from pathlib import Path
+import json
+import sqlite3
+import threading
+from reservation import Reservation, ROW_FIELDS, FIELD_BY_HEADER
+
+# 변경 여부를 비교할 필드 (예약번호는 조인 키, is_new는 시트 저장 상태라 제외)
+COMPARED_FIELDS = [name for name in ROW_FIELDS if name not in ("reservation_no", "is_new")]
+
+# Reservation 필드 -> 시트 헤더(한글) (Slack 변경 내용 표시용)
+HEADER_BY_FIELD = {name: header for header, name in FIELD_BY_HEADER.items()}
+
+
+@dataclass(slots=True)
+class ReservationChange:
+    """내용이 바뀐 예약 한 건"""
+
+    before: Reservation
+    after: Reservation
+    deltas: dict[str, tuple] = field(default_factory=dict)  # 필드 -> (이전 값, 현재 값)
+
+
+@dataclass
+class ReservationDiff:
+    """지난 실행 대비 변경 내역"""
+
+    added: list[Reservation] = field(default_factory=list)
+    removed: list[Reservation] = field(default_factory=list)
+    modified: list[ReservationChange] = field(default_factory=list)
+    unchanged: list[Reservation] = field(default_factory=list)
+
+    def extend(self, other: "ReservationDiff"):
+        self.added.extend(other.added)
+        self.removed.extend(other.removed)
+        self.modified.extend(other.modified)
+        self.unchanged.extend(other.unchanged)
+
+
+def field_deltas(before: Reservation, after: Reservation) -> dict[str, tuple]:
+    """비교 필드 중 값이 다른 필드의 (이전 값, 현재 값)"""
+    deltas = {}
+    for name in COMPARED_FIELDS:
+        old, new = getattr(before, name), getattr(after, name)
+        if old != new:
+            deltas[name] = (old, new)
+    return deltas
+
+
+def diff_reservations(previous: list[Reservation], current: list[Reservation]) -> ReservationDiff:
+    """
+    예약번호로 해시 조인해 추가/취소/변경/동일 예약을 분류합니다. (O(이전 + 현재))
+    예약번호가 없는 행은 조인할 수 없으므로 추가로 분류하고, 같은 예약번호가 반복되면 첫 행만 비교합니다.
+    """
+    previous_by_no = {}
+    for reservation in previous:
+        previous_by_no.setdefault(reservation.reservation_no, reservation)
+
+    diff = ReservationDiff()
+    seen = set()
+    for reservation in current:
+        key = reservation.reservation_no
+        if not key:
+            diff.added.append(reservation)
+            continue
+        if key in seen:
+            continue
+        seen.add(key)
+
+        before = previous_by_no.pop(key, None)
+        if before is None:
+            diff.added.append(reservation)
+            continue
+        deltas = field_deltas(before, reservation)
+        if deltas:
+            diff.modified.append(ReservationChange(before, reservation, deltas))
+        else:
+            diff.unchanged.append(reservation)
+
+    diff.removed.extend(r for no, r in previous_by_no.items() if no)
+    return diff
+
+
+class SnapshotStore:
+    """날짜별 예약 스냅샷 (SQLite)"""
+
+    def __init__(self, path: str):
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        # 병렬/HTTP 조회에서는 on_result가 워커 스레드에서 호출되므로 lock으로 직렬화
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS snapshot_dates (
+                reservation_date TEXT PRIMARY KEY,
+                scraped_at TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS snapshot_rows (
+                reservation_date TEXT NOT NULL,
+                data TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS snapshot_rows_date ON snapshot_rows (reservation_date);
+        """)
+
+    def close(self):
+        self.conn.close()
+
+    def has(self, reservation_date: str) -> bool:
+        """해당 날짜의 스냅샷이 있는지 (예약 0건으로 기록된 날짜 포함)"""
+        with self._lock:
+            return self.conn.execute(
+                "SELECT 1 FROM snapshot_dates WHERE reservation_date = ?", (reservation_date,)
+            ).fetchone() is not None
+
+    def count(self, reservation_date: str) -> int:
+        """해당 날짜 스냅샷의 예약 수"""
+        with self._lock:
+            return self.conn.execute(
+                "SELECT COUNT(*) FROM snapshot_rows WHERE reservation_date = ?", (reservation_date,)
+            ).fetchone()[0]
+
+    def load(self, reservation_date: str) -> list[Reservation]:
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT data FROM snapshot_rows WHERE reservation_date = ?", (reservation_date,)
+            ).fetchall()
+        return [Reservation.from_dict(json.loads(data)) for (data,) in rows]
+
+    def replace(self, snapshots: dict[str, list[Reservation]], today: date):
+        """날짜별 스냅샷을 한 트랜잭션으로 교체하고 지난 날짜는 정리"""
+        scraped_at = datetime.now().isoformat(timespec="seconds")
+        today_str = today.isoformat()
+        with self._lock, self.conn:
+            for reservation_date, rows in snapshots.items():
+                self.conn.execute("DELETE FROM snapshot_rows WHERE reservation_date = ?", (reservation_date,))
+                self.conn.executemany(
+                    "INSERT INTO snapshot_rows (reservation_date, data) VALUES (?, ?)",
+                    [
+                        (reservation_date, json.dumps({**row.to_dict(), "is_new": None}, ensure_ascii=False))
+                        for row in rows
+                    ]
+                )
+                self.conn.execute(
+                    "INSERT INTO snapshot_dates (reservation_date, scraped_at) VALUES (?, ?) "
+                    "ON CONFLICT(reservation_date) DO UPDATE SET scraped_at = excluded.scraped_at",
+                    (reservation_date, scraped_at)
+                )
+            self.conn.execute("DELETE FROM snapshot_rows WHERE reservation_date < ?", (today_str,))
+            self.conn.execute("DELETE FROM snapshot_dates WHERE reservation_date < ?", (today_str,))
+
+
+class ChangeTracker:
+    """이번 실행의 날짜별 결과를 스냅샷과 비교하고, 시트 작성기로 넘길 예약만 골라 주는 기록기"""
+
+    def __init__(self, path: str):
+        self.store = SnapshotStore(path)
+        self.diff = ReservationDiff()
+        self._pending = {}  # 날짜 -> 이번 실행 결과 (commit 전까지 보관)
+        self._unbaselined = []  # 스냅샷이 없던 날짜의 예약 (날짜를 옮긴 예약 확인용)
+        self._lock = threading.Lock()
+
+    def track(self, reservation_date: str, rows: list[Reservation]) -> list[Reservation]:
+        """
+        한 날짜의 결과를 지난 스냅샷과 비교합니다.
+
+        Returns:
+            list[Reservation]: 시트 작성기로 넘길 예약 (스냅샷이 없는 날짜는 전체, 있으면 추가/변경된 예약만)
+        """
+        # 이후 시트 저장 과정에서 is_new가 바뀌어도 영향이 없도록 복사해서 보관
+        snapshot = [Reservation.from_dict(row.to_dict()) for row in rows]
+        if not self.store.has(reservation_date):
+            with self._lock:
+                self._pending[reservation_date] = snapshot
+                self._unbaselined.extend(snapshot)
+            return rows
+
+        diff = diff_reservations(self.store.load(reservation_date), rows)
+        with self._lock:
+            self._pending[reservation_date] = snapshot
+            self.diff.extend(diff)
+        return diff.added + [change.after for change in diff.modified]
+
+    def track_empty(self, reservation_dates: list[str]) -> list[str]:
+        """
+        조회하지 않고 예약 없음(0건)으로 확인된 날짜 중 스냅샷에 예약이 남아 있는 날짜를 0건으로 비교합니다.
+        예약이 모두 취소된 날짜가 월간 예약 현황으로 건너뛰어져도 취소로 알리고 스냅샷을 비웁니다.
+
+        Returns:
+            list[str]: 0건으로 비교한 날짜
+        """
+        cleared = [d for d in reservation_dates if self.store.count(d)]
+        for reservation_date in cleared:
+            self.track(reservation_date, [])
+        return cleared
+
+    def finalize(self) -> ReservationDiff:
+        """
+        날짜를 옮긴 예약(한 날짜에서 사라지고 다른 날짜에 같은 예약번호로 나타난 예약)을 변경으로 합쳐
+        이번 실행의 변경 내역을 반환합니다.
+        """
+        with self._lock:
+            removed_by_no = {r.reservation_no: r for r in self.diff.removed}
+            moved = {}
+            added = []
+            for reservation, is_added in (
+                [(r, True) for r in self.diff.added] + [(r, False) for r in self._unbaselined]
+            ):
+                key = reservation.reservation_no
+                if key and key in removed_by_no and key not in moved:
+                    before = removed_by_no[key]
+                    moved[key] = ReservationChange(before, reservation, field_deltas(before, reservation))
+                elif is_added:
+                    added.append(reservation)
+            return ReservationDiff(
+                added=added,
+                removed=[r for r in self.diff.removed if r.reservation_no not in moved],
+                modified=self.diff.modified + list(moved.values()),
+                unchanged=list(self.diff.unchanged)
+            )
+
+    def commit(self, today: date):
+        """시트 저장이 끝난 날짜들의 결과를 스냅샷으로 반영"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        self.store.replace(pending, today)
+
+    def close(self):
+        self.store.close()
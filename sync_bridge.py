@@ -0,0 +1,326 @@
+"""
+async 구현을 sync playwright 객체로 실행하는 모듈
+화면 조작은 async 함수(예: scraper.scrape_date_async)로 한 번만 구현하고, sync 진입점(scraper.scrape_date 등)은
+sync Page를 SyncPage로 감싸 run_sync()로 같은 코루틴을 실행합니다.
+
+async 구현이 쓸 수 있는 playwright API는 아래 Protocol(PageApi, LocatorApi, ResponseApi, ContextApi, KeyboardApi)로
+정한 범위뿐입니다. async 구현의 인자는 이 Protocol로 표기하고, async playwright 객체와 Sync* 어댑터가 모두
+같은 Protocol을 구현하는지, async 구현이 범위 밖의 API를 쓰지 않는지는 test_sync_bridge에서 확인합니다.
+새 API가 필요하면 Protocol과 어댑터에 함께 추가합니다.
+
+Sync* 어댑터의 메서드는 sync playwright 메서드를 호출하고 바로 결과를 반환하므로(중간에 멈추지 않음),
+run_sync()는 이벤트 루프 없이 코루틴을 한 번에 끝까지 실행합니다. 그 밖의 대기는 asyncio 대신
+sleep(), to_thread()를 사용합니다. (이벤트 루프에서는 asyncio.sleep, asyncio.to_thread로 동작)
+"""
+from contextlib import AbstractAsyncContextManager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Protocol
+import asyncio
+import time
+from playwright.sync_api import BrowserContext, Keyboard, Locator, Page, Response
+
+_running_sync = ContextVar("running_sync", default=False)
+
+
+# ---------------------------------------------------------------------------
+# async 구현이 사용하는 playwright API
+# ---------------------------------------------------------------------------
+
+class ResponseApi(Protocol):
+    @property
+    def url(self) -> str: ...
+
+    @property
+    def ok(self) -> bool: ...
+
+    @property
+    def status(self) -> int: ...
+
+    async def json(self) -> Any: ...
+
+
+class LocatorApi(Protocol):
+    @property
+    def first(self) -> "LocatorApi": ...
+
+    def or_(self, locator: "LocatorApi") -> "LocatorApi": ...
+
+    def filter(self, *, has: "LocatorApi | None" = None) -> "LocatorApi": ...
+
+    async def wait_for(self, *, state: str | None = None, timeout: float | None = None) -> None: ...
+
+    async def click(self, *, timeout: float | None = None) -> None: ...
+
+    async def fill(self, value: str, *, timeout: float | None = None) -> None: ...
+
+    async def inner_text(self, *, timeout: float | None = None) -> str: ...
+
+    async def get_attribute(self, name: str, *, timeout: float | None = None) -> str | None: ...
+
+    async def is_visible(self, *, timeout: float | None = None) -> bool: ...
+
+    async def count(self) -> int: ...
+
+
+class KeyboardApi(Protocol):
+    async def press(self, key: str) -> None: ...
+
+
+class ResponseEventApi(Protocol):
+    """expect_response()의 with 값 (블록이 끝난 뒤 value를 await하면 응답)"""
+
+    @property
+    def value(self) -> Awaitable[ResponseApi]: ...
+
+
+class PageApi(Protocol):
+    @property
+    def keyboard(self) -> KeyboardApi: ...
+
+    def locator(self, selector: str) -> LocatorApi: ...
+
+    def get_by_role(self, role: str, *, name: str | None = None, exact: bool | None = None) -> LocatorApi: ...
+
+    def expect_response(
+        self, url_or_predicate: Callable[[ResponseApi], bool], *, timeout: float | None = None
+    ) -> AbstractAsyncContextManager[ResponseEventApi]: ...
+
+    async def goto(self, url: str) -> Any: ...
+
+    async def reload(self) -> Any: ...
+
+    async def content(self) -> str: ...
+
+    async def evaluate(self, expression: str, arg: Any = None) -> Any: ...
+
+    async def wait_for_selector(
+        self, selector: str, *, state: str | None = None, timeout: float | None = None
+    ) -> Any: ...
+
+    async def wait_for_load_state(self, state: str | None = None, *, timeout: float | None = None) -> None: ...
+
+    async def wait_for_function(self, expression: str, *, arg: Any = None, timeout: float | None = None) -> Any: ...
+
+
+class ContextApi(Protocol):
+    async def add_cookies(self, cookies: list[dict]) -> None: ...
+
+    async def storage_state(self) -> dict: ...
+
+
+# ---------------------------------------------------------------------------
+# sync playwright 어댑터
+# ---------------------------------------------------------------------------
+
+def _options(**kwargs) -> dict:
+    """지정하지 않은(None) 옵션은 넘기지 않음 (playwright 기본값 사용)"""
+    return {key: value for key, value in kwargs.items() if value is not None}
+
+
+class SyncResponse:
+    """sync playwright Response를 ResponseApi로 쓰는 어댑터"""
+
+    __slots__ = ("response",)
+
+    def __init__(self, response: Response):
+        self.response = response
+
+    @property
+    def url(self) -> str:
+        return self.response.url
+
+    @property
+    def ok(self) -> bool:
+        return self.response.ok
+
+    @property
+    def status(self) -> int:
+        return self.response.status
+
+    async def json(self) -> Any:
+        return self.response.json()
+
+
+class SyncLocator:
+    """sync playwright Locator를 LocatorApi로 쓰는 어댑터"""
+
+    __slots__ = ("locator",)
+
+    def __init__(self, locator: Locator):
+        self.locator = locator
+
+    @property
+    def first(self) -> "SyncLocator":
+        return SyncLocator(self.locator.first)
+
+    def or_(self, locator: "SyncLocator") -> "SyncLocator":
+        return SyncLocator(self.locator.or_(locator.locator))
+
+    def filter(self, *, has: "SyncLocator | None" = None) -> "SyncLocator":
+        return SyncLocator(self.locator.filter(**_options(has=has.locator if has is not None else None)))
+
+    async def wait_for(self, *, state: str | None = None, timeout: float | None = None) -> None:
+        self.locator.wait_for(**_options(state=state, timeout=timeout))
+
+    async def click(self, *, timeout: float | None = None) -> None:
+        self.locator.click(**_options(timeout=timeout))
+
+    async def fill(self, value: str, *, timeout: float | None = None) -> None:
+        self.locator.fill(value, **_options(timeout=timeout))
+
+    async def inner_text(self, *, timeout: float | None = None) -> str:
+        return self.locator.inner_text(**_options(timeout=timeout))
+
+    async def get_attribute(self, name: str, *, timeout: float | None = None) -> str | None:
+        return self.locator.get_attribute(name, **_options(timeout=timeout))
+
+    async def is_visible(self, *, timeout: float | None = None) -> bool:
+        return self.locator.is_visible(**_options(timeout=timeout))
+
+    async def count(self) -> int:
+        return self.locator.count()
+
+
+class SyncKeyboard:
+    """sync playwright Keyboard를 KeyboardApi로 쓰는 어댑터"""
+
+    __slots__ = ("keyboard",)
+
+    def __init__(self, keyboard: Keyboard):
+        self.keyboard = keyboard
+
+    async def press(self, key: str) -> None:
+        self.keyboard.press(key)
+
+
+class SyncResponseEvent:
+    """sync expect_response()의 EventInfo를 ResponseEventApi로 쓰는 어댑터"""
+
+    __slots__ = ("event",)
+
+    def __init__(self, event):
+        self.event = event
+
+    @property
+    def value(self) -> Awaitable[SyncResponse]:
+        return self._value()
+
+    async def _value(self) -> SyncResponse:
+        return SyncResponse(self.event.value)
+
+
+class SyncResponseExpectation:
+    """sync expect_response() 컨텍스트 매니저를 async with로 쓰는 어댑터"""
+
+    __slots__ = ("manager",)
+
+    def __init__(self, manager):
+        self.manager = manager
+
+    async def __aenter__(self) -> SyncResponseEvent:
+        return SyncResponseEvent(self.manager.__enter__())
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return self.manager.__exit__(exc_type, exc, tb)
+
+
+class SyncPage:
+    """sync playwright Page를 PageApi로 쓰는 어댑터"""
+
+    __slots__ = ("page",)
+
+    def __init__(self, page: Page):
+        self.page = page
+
+    @property
+    def keyboard(self) -> SyncKeyboard:
+        return SyncKeyboard(self.page.keyboard)
+
+    def locator(self, selector: str) -> SyncLocator:
+        return SyncLocator(self.page.locator(selector))
+
+    def get_by_role(self, role: str, *, name: str | None = None, exact: bool | None = None) -> SyncLocator:
+        return SyncLocator(self.page.get_by_role(role, **_options(name=name, exact=exact)))
+
+    def expect_response(
+        self, url_or_predicate: Callable[[ResponseApi], bool], *, timeout: float | None = None
+    ) -> SyncResponseExpectation:
+        manager = self.page.expect_response(
+            lambda response: url_or_predicate(SyncResponse(response)), **_options(timeout=timeout)
+        )
+        return SyncResponseExpectation(manager)
+
+    async def goto(self, url: str) -> Any:
+        return self.page.goto(url)
+
+    async def reload(self) -> Any:
+        return self.page.reload()
+
+    async def content(self) -> str:
+        return self.page.content()
+
+    async def evaluate(self, expression: str, arg: Any = None) -> Any:
+        return self.page.evaluate(expression, arg)
+
+    async def wait_for_selector(
+        self, selector: str, *, state: str | None = None, timeout: float | None = None
+    ) -> Any:
+        return self.page.wait_for_selector(selector, **_options(state=state, timeout=timeout))
+
+    async def wait_for_load_state(self, state: str | None = None, *, timeout: float | None = None) -> None:
+        self.page.wait_for_load_state(state, **_options(timeout=timeout))
+
+    async def wait_for_function(self, expression: str, *, arg: Any = None, timeout: float | None = None) -> Any:
+        return self.page.wait_for_function(expression, **_options(arg=arg, timeout=timeout))
+
+
+class SyncContext:
+    """sync playwright BrowserContext를 ContextApi로 쓰는 어댑터"""
+
+    __slots__ = ("context",)
+
+    def __init__(self, context: BrowserContext):
+        self.context = context
+
+    async def add_cookies(self, cookies: list[dict]) -> None:
+        self.context.add_cookies(cookies)
+
+    async def storage_state(self) -> dict:
+        return self.context.storage_state()
+
+
+# ---------------------------------------------------------------------------
+# 실행
+# ---------------------------------------------------------------------------
+
+def run_sync(coroutine):
+    """
+    Sync* 어댑터만 await하는 코루틴을 현재 스레드에서 끝까지 실행하고 결과를 반환합니다.
+
+    Raises:
+        RuntimeError: 코루틴이 이벤트 루프 대기(asyncio.sleep, async playwright 객체 등)에서 멈춘 경우
+    """
+    token = _running_sync.set(True)
+    try:
+        coroutine.send(None)
+    except StopIteration as done:
+        return done.value
+    finally:
+        _running_sync.reset(token)
+    coroutine.close()
+    raise RuntimeError(f"{coroutine.__qualname__}: sync 실행 중 이벤트 루프 대기가 필요합니다.")
+
+
+async def sleep(seconds: float):
+    """run_sync() 안에서는 time.sleep, 이벤트 루프에서는 asyncio.sleep"""
+    if _running_sync.get():
+        time.sleep(seconds)
+    else:
+        await asyncio.sleep(seconds)
+
+
+async def to_thread(func, *args, **kwargs):
+    """run_sync() 안에서는 바로 호출하고, 이벤트 루프에서는 스레드에서 실행해 루프를 막지 않음"""
+    if _running_sync.get():
+        return func(*args, **kwargs)
+    return await asyncio.to_thread(func, *args, **kwargs)
@@ -0,0 +1,129 @@
+import asyncio
+import pytest
+import scraper
+from api_capture import map_reservation_payload
+from scraper import has_reservations_async, payload_has_reservations
+
+
+def test_map_reservation_payload_flat_list():
+    """
+    예약 레코드 리스트를 RESERVATION_DATA_HEADERS 형식으로 변환하는지 확인합니다.
+    """
+    payload = {
+        "data": [
+            {
+                "reservationNumber": "R-001",
+                "customerName": "Zhang Qingrong (1)",
+                "nationality": "CHINA",
+                "productName": "AB: CUT + STYLING X 1",
+                "timeRequest": "Time Request: 10:00",
+                "channel": "L",
+                "personInfo": "Adult 1",
+                "team": {"name": "TEAM 1"},
+            }
+        ]
+    }
+
+    rows = map_reservation_payload(payload, "2026-01-14")
+
+    assert len(rows) == 1
+    assert rows[0].date == "2026-01-14"
+    assert rows[0].team == "TEAM 1"
+    assert rows[0].customer_name == "Zhang Qingrong (1)"
+    assert rows[0].reservation_no == "R-001"
+    assert rows[0].time == "10:00"
+    assert rows[0].price == 0
+
+
+def test_map_reservation_payload_grouped_by_team():
+    """
+    팀 단위로 묶인 응답이면 상위 팀 이름을 각 예약에 붙이는지 확인합니다.
+    """
+    payload = [
+        {"teamName": "TEAM 1", "reservations": [{"reservationNo": "A1"}, {"reservationNo": "A2"}]},
+        {"teamName": "TEAM 2", "reservations": [{"reservationNo": "B1"}]},
+    ]
+
+    rows = map_reservation_payload(payload, "2026-01-14")
+
+    assert [(r.reservation_no, r.team) for r in rows] == [
+        ("A1", "TEAM 1"), ("A2", "TEAM 1"), ("B1", "TEAM 2")
+    ]
+
+
+def test_map_reservation_payload_empty():
+    """
+    예약이 없는 날짜의 응답은 빈 리스트로 변환되는지 확인합니다.
+    """
+    assert map_reservation_payload({"data": []}, "2026-01-14") == []
+
+
+def test_payload_has_reservations():
+    """
+    예약 목록 응답만으로 빈 날짜를 바로 판단하고, 해석할 수 없는 응답은 화면 확인으로 넘기는지 확인합니다.
+    """
+    assert payload_has_reservations({"data": []}, "2026-01-14") is False
+    assert payload_has_reservations([], "2026-01-14") is False
+    assert payload_has_reservations({"data": [{"reservationNumber": "R-001"}]}, "2026-01-14") is True
+    assert payload_has_reservations({"teams": [{"unknown": 1}]}, "2026-01-14") is None
+
+
+class FakeResponse:
+    def __init__(self, status: int, payload):
+        self.status = status
+        self.ok = 200 <= status < 300
+        self.payload = payload
+
+    async def json(self):
+        return self.payload
+
+
+class FakeLocator:
+    """항상 바로 보이는 요소"""
+
+    @property
+    def first(self):
+        return self
+
+    def or_(self, other):
+        return self
+
+    async def wait_for(self, state: str, timeout: int):
+        pass
+
+    async def is_visible(self) -> bool:
+        return True
+
+
+class FakePage:
+    """예약 목록이 화면에 표시된 페이지"""
+
+    def locator(self, selector: str):
+        return FakeLocator()
+
+
+def test_has_reservations_ignores_error_response():
+    """
+    예약 목록 API가 오류(500)를 반환하면 응답 본문으로 빈 날짜를 판단하지 않고 화면으로 확인하는지 확인합니다.
+    """
+    empty_body = {"data": []}
+    assert asyncio.run(has_reservations_async(FakePage(), 100, FakeResponse(200, empty_body), "2026-01-14")) is False
+    assert asyncio.run(has_reservations_async(FakePage(), 100, FakeResponse(500, empty_body), "2026-01-14")) is True
+
+
+def test_scrape_date_from_api_raises_on_error_response(monkeypatch):
+    """
+    SCRAPE_MODE=api에서 예약 목록 API가 오류를 반환하면 빈 날짜로 저장하지 않고 오류를 내는지 확인합니다.
+    """
+    async def click_date_button(page):
+        pass
+
+    async def click_calendar_date(page, day, year, month):
+        return FakeResponse(500, {"data": []})
+
+    monkeypatch.setattr(scraper, "RESERVATION_API_PATTERN", "/api/reservations")
+    monkeypatch.setattr(scraper, "click_date_button_async", click_date_button)
+    monkeypatch.setattr(scraper, "click_calendar_date_async", click_calendar_date)
+
+    with pytest.raises(RuntimeError, match="500"):
+        asyncio.run(scraper.scrape_date_from_api_async(FakePage(), "14", "2026-01-14"))
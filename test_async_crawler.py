@@ -0,0 +1,173 @@
+from datetime import date, timedelta
+from urllib.parse import urlparse, parse_qs
+import asyncio
+import json
+import pytest
+from playwright.async_api import async_playwright
+from playwright.sync_api import sync_playwright
+import async_crawler
+import scraper
+from benchmarks.bench_navigation import APP_URL, serve_app
+from benchmarks.synthetic_page import RESERVATION_APP_HTML, build_reservation_payload
+from scraper import wait_for_page_ready_async
+from sheet_writer import AsyncSheetWriter
+from sheet_backend import LocalWorksheet
+from sheet_index import SheetIndex
+
+
+def test_async_sheet_writer_flushes_while_scraping(tmp_path, make_reservation):
+    """
+    AsyncSheetWriter가 이벤트 루프를 막지 않고 건수 단위로 저장하고, 종료 시 남은 결과를 저장하는지 테스트합니다.
+    """
+    worksheet = LocalWorksheet()
+    index = SheetIndex(str(tmp_path / "index.sqlite3"), "test")
+
+    async def run():
+        writer = AsyncSheetWriter(flush_size=2, flush_interval=60, open_target=lambda: (worksheet, index)).start()
+        writer.put([make_reservation("R1", "2026-01-18"), make_reservation("R2", "2026-01-18")])
+        # 다른 날짜를 조회하는 동안 첫 묶음이 저장됨
+        for _ in range(100):
+            if len(worksheet.rows) == 3:
+                break
+            await asyncio.sleep(0.01)
+        saved_before_close = len(worksheet.rows)
+        writer.put([make_reservation("R3", "2026-01-19")])
+        await writer.close()
+        return writer, saved_before_close
+
+    writer, saved_before_close = asyncio.run(run())
+    assert saved_before_close == 3
+    assert [r.reservation_no for r in writer.new_reservations] == ["R1", "R2", "R3"]
+    assert len(worksheet.rows) == 4
+
+
+async def serve_app_async(route):
+    """benchmarks.bench_navigation.serve_app()의 async 버전 (가짜 SPA와 예약 목록 API 응답)"""
+    url = urlparse(route.request.url)
+    if url.path == "/api/reservations":
+        reservation_date = date.fromisoformat(parse_qs(url.query)["date"][0])
+        await route.fulfill(
+            content_type="application/json",
+            body=json.dumps(build_reservation_payload(reservation_date.day))
+        )
+    else:
+        await route.fulfill(content_type="text/html", body=RESERVATION_APP_HTML)
+
+
+def use_synthetic_app(monkeypatch) -> list:
+    """
+    scraper/async_crawler가 가짜 SPA를 쓰도록 대상 URL과 페이지 설정을 바꾸고,
+    페이지 설정을 적용한 컨텍스트 목록을 반환합니다.
+    """
+    # reset_page의 reload와 새 페이지가 가짜 SPA를 불러오도록 대상 URL 교체
+    monkeypatch.setattr(scraper, "TARGET_URL", APP_URL)
+    monkeypatch.setattr(async_crawler, "TARGET_URL", APP_URL)
+    profiled = []
+
+    async def apply_app_route(context, page=None):
+        """리소스 차단 대신 새 컨텍스트도 가짜 SPA로 응답하도록 설정"""
+        profiled.append(context)
+        await context.route("https://bench.local/**", serve_app_async)
+
+    monkeypatch.setattr(async_crawler, "apply_page_profile", apply_app_route)
+    return profiled
+
+
+def crawl_async(dates: list[tuple[str, str]], workers: int):
+    """
+    가짜 SPA에서 async_crawler.scrape_dates를 실행합니다.
+
+    Returns:
+        tuple | Exception: (예약 리스트, on_result로 받은 날짜 리스트), Chromium을 실행할 수 없으면 그 예외
+    """
+    async def run():
+        async with async_playwright() as playwright:
+            try:
+                browser = await playwright.chromium.launch()
+            except Exception as e:
+                return e
+            try:
+                context = await browser.new_context()
+                await async_crawler.apply_page_profile(context)
+                page = await context.new_page()
+                await page.goto(APP_URL)
+                await wait_for_page_ready_async(page)
+
+                released = []
+                rows = await async_crawler.scrape_dates(
+                    browser, page, {"cookies": [], "origins": []}, dates, workers=workers,
+                    on_result=lambda reservation_date, scraped_data: released.append(reservation_date)
+                )
+                return rows, released
+            finally:
+                await browser.close()
+
+    return asyncio.run(run())
+
+
+def crawl_sync(dates: list[tuple[str, str]]):
+    """
+    가짜 SPA에서 sync 진입점 scraper.scrape_date를 날짜마다 실행합니다.
+
+    Returns:
+        list | Exception: 날짜 순서대로 병합된 예약 리스트, Chromium을 실행할 수 없으면 그 예외
+    """
+    with sync_playwright() as playwright:
+        try:
+            browser = playwright.chromium.launch()
+        except Exception as e:
+            return e
+        try:
+            page = browser.new_page()
+            page.route("https://bench.local/**", serve_app)
+            page.goto(APP_URL)
+            scraper.wait_for_page_ready(page)
+            rows = []
+            for target_day, reservation_date in dates:
+                rows.extend(scraper.scrape_date(page, target_day, reservation_date))
+            return rows
+        finally:
+            browser.close()
+
+
+def test_scrape_dates_spreads_dates_over_bounded_pages(monkeypatch):
+    """
+    가짜 SPA에서 scrape_dates가 날짜마다 scrape_date_async를 실행해 날짜 순서대로 결과를 넘기고,
+    동시에 쓰는 페이지를 workers개로 제한하는지 확인합니다. (Chromium을 실행할 수 없으면 건너뜀)
+    """
+    profiled = use_synthetic_app(monkeypatch)
+    targets = [date.today() + timedelta(days=offset) for offset in range(1, 5)]
+    dates = [(str(target.day), target.isoformat()) for target in targets]
+
+    result = crawl_async(dates, workers=2)
+    if isinstance(result, Exception):
+        pytest.skip(f"Chromium을 실행할 수 없습니다 (playwright install chromium 필요): {result}")
+
+    rows, released = result
+    assert released == [reservation_date for _, reservation_date in dates]
+    assert [row.reservation_no for row in rows] == [
+        f"R{target.day * 1000 + i:06d}" for target in targets for i in range(8)
+    ]
+    assert [row.date for row in rows] == [target.isoformat() for target in targets for _ in range(8)]
+    # 로그인한 페이지의 컨텍스트 1개 + 새로 만든 컨텍스트 workers - 1개
+    assert len(profiled) == 2
+
+
+def test_sync_scrape_date_matches_async_scrape_dates(monkeypatch):
+    """
+    같은 async 구현을 sync 진입점(scraper.scrape_date, sync playwright)과 async_crawler.scrape_dates
+    (async playwright)로 실행했을 때 가짜 SPA에서 같은 예약을 읽는지 확인합니다. (Chromium을 실행할 수 없으면 건너뜀)
+    """
+    use_synthetic_app(monkeypatch)
+    targets = [date.today() + timedelta(days=offset) for offset in range(1, 4)]
+    dates = [(str(target.day), target.isoformat()) for target in targets]
+
+    sync_rows = crawl_sync(dates)
+    if isinstance(sync_rows, Exception):
+        pytest.skip(f"Chromium을 실행할 수 없습니다 (playwright install chromium 필요): {sync_rows}")
+    async_rows, _ = crawl_async(dates, workers=2)
+
+    assert [row.reservation_no for row in sync_rows] == [
+        f"R{target.day * 1000 + i:06d}" for target in targets for i in range(8)
+    ]
+    assert [row.to_row() for row in sync_rows] == [row.to_row() for row in async_rows]
@@ -0,0 +1,39 @@
+from http.server import BaseHTTPRequestHandler, HTTPServer
+import threading
+import pytest
+from browser_controller import find_free_port, wait_for_cdp_endpoint
+
+
+class VersionHandler(BaseHTTPRequestHandler):
+    """Chrome CDP의 /json/version만 응답하는 핸들러"""
+
+    def do_GET(self):
+        self.send_response(200 if self.path == "/json/version" else 404)
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, format, *args):
+        pass
+
+
+def test_wait_for_cdp_endpoint_returns_ready_endpoint():
+    """
+    지정한 포트의 CDP가 응답하면 해당 엔드포인트를 반환하는지 확인합니다.
+    """
+    server = HTTPServer(("127.0.0.1", find_free_port()), VersionHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        endpoint = f"http://127.0.0.1:{server.server_port}"
+        assert wait_for_cdp_endpoint(endpoint, timeout=5) == endpoint
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_wait_for_cdp_endpoint_raises_on_timeout():
+    """
+    CDP가 준비되지 않으면 준비되지 않은 엔드포인트를 반환하지 않고 오류를 내는지 확인합니다.
+    """
+    with pytest.raises(TimeoutError):
+        wait_for_cdp_endpoint(f"http://127.0.0.1:{find_free_port()}", timeout=0.2)
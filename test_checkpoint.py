@@ -0,0 +1,37 @@
+import json
+from checkpoint import CheckpointStore
+from reservation import Reservation
+
+
+def test_checkpoint_resume_replays_completed_dates(tmp_path):
+    """
+    --resume 실행 시 같은 실행 구간에서 완료된 날짜와 결과를 그대로 불러오는지 확인합니다.
+    """
+    store = CheckpointStore(str(tmp_path), "2026-01-18_2026-01-31")
+    store.record("2026-01-18", [Reservation("2026-01-18", reservation_no="R1", price=66000)])
+    store.record("2026-01-19", [])
+
+    resumed = CheckpointStore(str(tmp_path), "2026-01-18_2026-01-31", resume=True)
+    assert resumed.completed_dates() == {"2026-01-18", "2026-01-19"}
+    assert resumed.get("2026-01-18") == [Reservation("2026-01-18", reservation_no="R1", price=66000)]
+    assert resumed.get("2026-01-20") is None
+
+
+def test_checkpoint_discards_corrupted_entry_and_fresh_run(tmp_path):
+    """
+    다이제스트가 맞지 않는 날짜는 버리고, resume 없이 실행하면 기존 체크포인트를 지우는지 확인합니다.
+    """
+    store = CheckpointStore(str(tmp_path), "2026-01-18_2026-01-31")
+    store.record("2026-01-18", [Reservation("2026-01-18", reservation_no="R1")])
+    store.record("2026-01-19", [Reservation("2026-01-19", reservation_no="R2")])
+
+    entries = json.loads(store.path.read_text(encoding="utf-8"))
+    entries["2026-01-19"]["rows"][0]["reservation_no"] = "R9"
+    store.path.write_text(json.dumps(entries), encoding="utf-8")
+
+    resumed = CheckpointStore(str(tmp_path), "2026-01-18_2026-01-31", resume=True)
+    assert resumed.completed_dates() == {"2026-01-18"}
+
+    fresh = CheckpointStore(str(tmp_path), "2026-01-18_2026-01-31")
+    assert fresh.completed_dates() == set()
+    assert not fresh.path.exists()
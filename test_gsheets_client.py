@@ -3,6 +3,7 @@ from gsheets_client import save_to_sheet
 from config import GOOGLE_SHEET_TITLE, GOOGLE_WORKSHEET_NAME, RESERVATION_DATA_HEADERS
 import gspread
 from datetime import datetime
+from reservation import Reservation
 
 import os
 
@@ -56,22 +57,22 @@ def test_save_to_sheet(gsheet_client):
     """
     # 1. 테스트용 모의 데이터 생성
     mock_data = [
-        {
-            "이름": "Test User 1",
-            "상품명": "Test Product A",
-            "예약시간": "10:00",
-            "예약번호": "TEST001",
-            "국적": "KOREA",
-            "크롤링 일자": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        },
-        {
-            "이름": "Test User 2",
-            "상품명": "Test Product B",
-            "예약시간": "11:00",
-            "예약번호": "TEST002",
-            "국적": "USA",
-            "크롤링 일자": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        }
+        Reservation(
+            date=datetime.now().strftime("%Y-%m-%d"),
+            customer_name="Test User 1",
+            product="Test Product A",
+            time="10:00",
+            reservation_no="TEST001",
+            country="KOREA",
+        ),
+        Reservation(
+            date=datetime.now().strftime("%Y-%m-%d"),
+            customer_name="Test User 2",
+            product="Test Product B",
+            time="11:00",
+            reservation_no="TEST002",
+            country="USA",
+        ),
     ]
 
     # 2. 저장 함수 호출
@@ -92,15 +93,11 @@ def test_save_to_sheet(gsheet_client):
     assert all_values[0] == RESERVATION_DATA_HEADERS
 
     # 저장된 데이터 확인
-    # 실제 저장될 때 크롤링 일자는 실시간으로 생성되므로 비교에서 제외
-    expected_row1 = [mock_data[0]["이름"], mock_data[0]["상품명"], mock_data[0]["예약시간"], mock_data[0]["예약번호"], mock_data[0]["국적"], mock_data[0]["크롤링 일자"]]
-    expected_row2 = [mock_data[1]["이름"], mock_data[1]["상품명"], mock_data[1]["예약시간"], mock_data[1]["예약번호"], mock_data[1]["국적"], mock_data[1]["크롤링 일자"]]
+    expected_row1 = mock_data[0].to_row()
+    expected_row2 = mock_data[1].to_row()
 
     # 마지막 행에 추가되므로, 마지막 두 행을 가져와서 비교합니다.
     actual_rows = worksheet.get_all_values()[-2:]
 
-    # 실제 저장된 '크롤링 일자'는 mock_data와 다를 수 있으므로 해당 필드는 비교에서 제외하거나
-    # 실제 저장된 값을 가져와서 비교해야 합니다. 여기서는 간략하게 다른 필드만 비교
-    
     assert actual_rows[0][0:5] == expected_row1[0:5]
-    assert actual_rows[1][0:5] == expected_row2[0:5]
\ No newline at end of file
+    assert actual_rows[1][0:5] == expected_row2[0:5]
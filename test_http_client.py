@@ -0,0 +1,92 @@
+import threading
+import pytest
+import requests
+from http_client import ReservationHttpClient, SessionExpiredError, find_auth_token, scrape_dates_http
+
+
+class StubClient(ReservationHttpClient):
+    """첫 조회에서 한 날짜가 인증 만료되는 테스트용 클라이언트"""
+
+    def __init__(self, storage_state: dict):
+        super().__init__(storage_state, max_workers=2, api_url="https://example.test/r?date={date}")
+        self.authorized = False
+
+    def fetch_date(self, reservation_date: str):
+        if reservation_date == "2026-01-19" and not self.authorized:
+            raise SessionExpiredError("HTTP 401")
+        return [{"reservationNo": f"R-{reservation_date}", "productName": "CUT + STYLING"}]
+
+    def load_storage_state(self, storage_state: dict):
+        super().load_storage_state(storage_state)
+        self.authorized = bool(storage_state.get("cookies"))
+
+
+def test_find_auth_token():
+    """
+    localStorage에서 이름에 token이 들어간 값을 인증 토큰으로 찾는지 확인합니다.
+    """
+    storage_state = {
+        "cookies": [],
+        "origins": [{"origin": "https://guide.ktourstory.com", "localStorage": [
+            {"name": "theme", "value": "dark"},
+            {"name": "accessToken", "value": "abc"},
+        ]}],
+    }
+    assert find_auth_token(storage_state) == "abc"
+
+
+def test_scrape_dates_http_reauth_on_expired_session():
+    """
+    인증 만료된 날짜만 재로그인 후 다시 조회하고, 결과를 날짜 순서대로 병합하는지 확인합니다.
+    """
+    client = StubClient({"cookies": []})
+    new_state = {"cookies": [{"name": "sid", "value": "1", "domain": "example.test", "path": "/"}]}
+    reauth_calls = []
+
+    def reauth():
+        reauth_calls.append(True)
+        return new_state
+
+    dates = [("18", "2026-01-18"), ("19", "2026-01-19"), ("20", "2026-01-20")]
+    rows = scrape_dates_http(client, dates, reauth)
+
+    assert len(reauth_calls) == 1
+    assert [r.reservation_no for r in rows] == ["R-2026-01-18", "R-2026-01-19", "R-2026-01-20"]
+
+
+def test_scrape_dates_http_streams_results_and_reports_failures():
+    """
+    조회가 끝난 날짜부터 on_result로 넘기고, 한 날짜가 실패해도 나머지 날짜는 그대로 수집하는지 확인합니다.
+    """
+    emitted = threading.Event()
+
+    class SlowFailingClient(ReservationHttpClient):
+        def fetch_date(self, reservation_date: str):
+            if reservation_date == "2026-01-18":
+                # 다른 날짜의 결과가 on_result로 넘어간 뒤에 끝남
+                assert emitted.wait(5)
+            if reservation_date == "2026-01-19":
+                raise requests.HTTPError("500 Server Error")
+            return [{"reservationNo": f"R-{reservation_date}", "productName": "CUT + STYLING"}]
+
+    client = SlowFailingClient({}, max_workers=3, api_url="https://example.test/r?date={date}")
+    received = []
+
+    def on_result(reservation_date, scraped_data):
+        received.append(reservation_date)
+        emitted.set()
+
+    dates = [("18", "2026-01-18"), ("19", "2026-01-19"), ("20", "2026-01-20")]
+    rows = scrape_dates_http(client, dates, reauth=dict, on_result=on_result)
+
+    assert received == ["2026-01-20", "2026-01-18"]
+    assert [r.reservation_no for r in rows] == ["R-2026-01-18", "R-2026-01-20"]
+
+
+def test_client_requires_api_url(monkeypatch):
+    """
+    RESERVATION_API_URL 없이 클라이언트를 만들면 오류가 나는지 확인합니다.
+    """
+    monkeypatch.setattr("http_client.RESERVATION_API_URL", "")
+    with pytest.raises(RuntimeError):
+        ReservationHttpClient({}, api_url="")
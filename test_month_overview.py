@@ -0,0 +1,69 @@
+from datetime import date
+from month_overview import OverviewHistory, parse_overview_payload, marker_count, month_marker_counts
+
+
+def test_parse_overview_payload():
+    """
+    날짜 키 객체, 날짜/건수 레코드 리스트, 감싼 응답을 날짜별 건수로 변환하는지 확인합니다.
+    """
+    assert parse_overview_payload({"2026-01-18": 3, "2026-01-19": 0, "total": 3}) == {
+        "2026-01-18": 3, "2026-01-19": 0
+    }
+    assert parse_overview_payload({"data": [
+        {"date": "2026-01-18T00:00:00", "count": "2"},
+        {"reservationDate": "2026-01-19", "reservations": [{"id": 1}]},
+        {"day": "2026-01-20", "note": "?"},
+    ]}) == {"2026-01-18": 2, "2026-01-19": 1, "2026-01-20": None}
+
+    assert marker_count(None) == 0
+    assert marker_count("12") == 12
+    assert marker_count("") is None
+
+
+def test_skip_empty_and_unchanged_dates(tmp_path):
+    """
+    예약 없는 날짜는 건너뛰고, 오늘과 건수를 모르는 날짜는 조회하며,
+    지난 실행과 건수가 같은 날짜는 OVERVIEW_SKIP_UNCHANGED일 때만 건너뛰는지 확인합니다.
+    """
+    path = str(tmp_path / "overview.json")
+    today = date(2026, 1, 18)
+    targets = [date(2026, 1, day) for day in range(18, 24)]
+    counts = {"2026-01-18": 0, "2026-01-19": 0, "2026-01-20": 2, "2026-01-21": 5, "2026-01-22": None}
+
+    history = OverviewHistory(path)
+    due, empty, unchanged = history.select(targets, counts, today, skip_unchanged=True)
+    assert due == [date(2026, 1, 18), date(2026, 1, 20), date(2026, 1, 21), date(2026, 1, 22), date(2026, 1, 23)]
+    assert empty == [date(2026, 1, 19)]
+    assert unchanged == []
+
+    history.save(counts, today)
+    counts = {**counts, "2026-01-21": 6, "2026-01-22": 4}
+    reloaded = OverviewHistory(path)
+    due, empty, unchanged = reloaded.select(targets, counts, today, skip_unchanged=True)
+    assert unchanged == [date(2026, 1, 20)]
+    assert due == [date(2026, 1, 18), date(2026, 1, 21), date(2026, 1, 22), date(2026, 1, 23)]
+
+    due, _, unchanged = reloaded.select(targets, counts, today)
+    assert unchanged == []
+    assert date(2026, 1, 20) in due
+
+
+def test_missing_markers_skip_nothing(tmp_path):
+    """
+    달력에서 날짜 표시를 하나도 찾지 못한 달(셀렉터 오류, 화면 구조 변경)은 예약 없음이 아닌
+    알 수 없음으로 처리해 어떤 날짜도 건너뛰지 않는지 확인합니다.
+    """
+    today = date(2026, 1, 18)
+    targets = [date(2026, 1, day) for day in range(18, 32)]
+    markers = [[str(day), None] for day in range(1, 32)]
+
+    counts = month_marker_counts(2026, 1, markers)
+    assert counts == {}
+    due, empty, unchanged = OverviewHistory(str(tmp_path / "overview.json")).select(targets, counts, today)
+    assert due == targets
+    assert empty == [] and unchanged == []
+
+    markers[19] = ["20", "2"]
+    counts = month_marker_counts(2026, 1, markers)
+    assert counts["2026-01-20"] == 2
+    assert counts["2026-01-21"] == 0
@@ -0,0 +1,69 @@
+import json
+import os
+from price_catalog import PriceCatalog, get_price_catalog
+from scraper import calculate_price
+
+PRICES = {
+    "PERSONAL STYLE CONSULTING + CUT + STYLING": 110000,
+    "PERSONAL STYLE CONSULTING": 55000,
+    "CUT + STYLING": 66000,
+    "DEFAULT": 0,
+    "ALIASES": {"HAIRCUT & STYLING": "CUT + STYLING"},
+}
+
+
+def test_price_catalog_matches_drifted_names():
+    """
+    정확히 일치, 대소문자/공백 차이, 별칭, 접두어 매칭과 찾지 못한 상품 기록을 확인합니다.
+    """
+    catalog = PriceCatalog(PRICES)
+
+    assert catalog.price("AB: PERSONAL STYLE CONSULTING + CUT + STYLING X 1") == 110000
+    assert catalog.price("AB: cut+styling x 2") == 132000
+    assert catalog.price("VI: HAIRCUT & STYLING X 1") == 66000
+    assert catalog.price("AB: PERSONAL STYLE CONSULTING (ENGLISH) X 1") == 55000
+    assert catalog.unmatched == set()
+    assert catalog.fuzzy == {
+        "HAIRCUT & STYLING": "CUT + STYLING",
+        "PERSONAL STYLE CONSULTING (ENGLISH)": "PERSONAL STYLE CONSULTING",
+    }
+
+    assert catalog.price("AB: SCALP CARE X 1") == 0
+    assert catalog.unmatched == {"SCALP CARE"}
+    assert calculate_price("AB: CUT + STYLING X 3", catalog) == "198,000"
+    assert calculate_price("AB: CUT + STYLING X 1", {"CUT + STYLING": 66000}) == "66,000"
+
+
+def test_price_catalog_rejects_prefix_with_extra_products(capsys):
+    """
+    접두어 뒤에 "+ 상품"이 더 붙은 이름은 짧은 상품 가격으로 계산하지 않고, 찾지 못한 상품으로 보고하는지 확인합니다.
+    """
+    catalog = PriceCatalog({"CUT + STYLING": 66000, "CUT + PERM + STYLING": 220000, "DEFAULT": 0})
+
+    assert catalog.price("AB: CUT + PERM + STYLING X 1") == 220000
+    assert catalog.price("AB: CUT + STYLING + PERM X 1") == 0
+    assert catalog.price("AB: CUT + STYLING (EN) X 1") == 66000
+    assert catalog.unmatched == {"CUT + STYLING + PERM"}
+    assert catalog.fuzzy == {"CUT + STYLING (EN)": "CUT + STYLING"}
+
+    catalog.report_unmatched()
+    output = capsys.readouterr().out
+    assert "CUT + STYLING (EN) → CUT + STYLING" in output
+    assert "CUT + STYLING + PERM" in output
+
+
+def test_price_catalog_reloads_only_when_file_changes(tmp_path):
+    """
+    같은 파일은 한 번만 읽고, 수정 시각이 바뀌면 다시 읽는지 확인합니다.
+    """
+    path = tmp_path / "price.json"
+    path.write_text(json.dumps({"CUT + STYLING": 66000}), encoding="utf-8")
+
+    catalog = get_price_catalog(str(path))
+    assert get_price_catalog(str(path)) is catalog
+
+    path.write_text(json.dumps({"CUT + STYLING": 70000}), encoding="utf-8")
+    os.utime(path, (catalog.mtime + 10, catalog.mtime + 10))
+    reloaded = get_price_catalog(str(path))
+    assert reloaded is not catalog
+    assert reloaded.price("AB: CUT + STYLING X 1") == 70000
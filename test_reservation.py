@@ -0,0 +1,23 @@
+from reservation import Reservation
+from config import RESERVATION_DATA_HEADERS
+
+
+def test_reservation_row_round_trip():
+    """
+    시트 행으로 변환할 때 금액은 콤마 문자열로, 시트에서 읽을 때는 정수로 바뀌는지 확인합니다.
+    """
+    reservation = Reservation(
+        "2026-01-18", team="TEAM 1", customer_name="Guest (2)", reservation_no="R1",
+        product="AB: CUT + STYLING X 2", price=132000
+    )
+    row = reservation.to_row()
+
+    assert len(row) == len(RESERVATION_DATA_HEADERS)
+    assert row[RESERVATION_DATA_HEADERS.index("금액")] == "132,000"
+    assert row[RESERVATION_DATA_HEADERS.index("is_new")] == ""
+    assert Reservation.from_row(row) == reservation
+
+    # 시트에서 읽은 짧은 행과 TRUE/FALSE 값
+    stored = Reservation.from_row(row[:-1] + ["TRUE"])
+    assert stored.is_new is True
+    assert Reservation.from_row(["2026-01-18", "", "", "R2"]).price == 0
@@ -0,0 +1,60 @@
+from resource_filter import should_block, ResourceStats
+
+
+def test_should_block_heavy_and_third_party_requests():
+    """
+    이미지/폰트/미디어와 외부 사이트의 부가 요청은 차단하고, 앱 동작에 필요한 요청은 통과시키는지 확인합니다.
+    """
+    rules = dict(
+        first_party_host="guide.ktourstory.com",
+        blocked_types=["image", "font", "media"],
+        block_third_party=True,
+        allow_hosts=["cdn.example.com"],
+    )
+
+    assert should_block("image", "https://guide.ktourstory.com/logo.png", **rules)
+    assert should_block("font", "https://fonts.gstatic.com/a.woff2", **rules)
+    assert should_block("script", "https://www.googletagmanager.com/gtag.js", **rules)
+
+    assert not should_block("script", "https://guide.ktourstory.com/main.js", **rules)
+    assert not should_block("fetch", "https://api.ktourstory.com/reservations", **rules)
+    assert not should_block("xhr", "https://firestore.googleapis.com/v1/x", **rules)
+    assert not should_block("script", "https://a.cdn.example.com/sdk.js", **rules)
+    assert not should_block("script", "https://www.googletagmanager.com/gtag.js",
+                            **{**rules, "block_third_party": False})
+
+
+def test_co_kr_third_party_hosts_are_blocked():
+    """
+    TARGET_URL이 co.kr 도메인이어도 같은 co.kr 아래의 다른 사이트(추적 스크립트 등)는 차단하는지 확인합니다.
+    """
+    rules = dict(
+        first_party_host="www.ktour.co.kr",
+        blocked_types=[],
+        block_third_party=True,
+        allow_hosts=[],
+    )
+
+    assert should_block("script", "https://log.tracker.co.kr/collect.js", **rules)
+    assert should_block("image", "https://pixel.ads.or.kr/p.gif", **rules)
+    assert not should_block("script", "https://www.ktour.co.kr/app.js", **rules)
+    assert not should_block("script", "https://cdn.www.ktour.co.kr/app.js", **rules)
+    assert not should_block("script", "https://static.ktour.co.kr/app.js",
+                            **{**rules, "allow_hosts": ["static.ktour.co.kr"]})
+
+
+def test_resource_stats_summary():
+    """
+    차단/불러온 요청 집계가 요약에 반영되는지 확인합니다.
+    """
+    stats = ResourceStats()
+    assert stats.summary_lines() == []
+
+    stats.record_blocked("image")
+    stats.record_blocked("image")
+    stats.record_blocked("font")
+    stats.record_loaded(1024 * 1024)
+
+    lines = stats.summary_lines()
+    assert lines[0] == "차단한 요청: 3건 (image 2, font 1)"
+    assert "1건" in lines[1] and "1.0MB" in lines[1]
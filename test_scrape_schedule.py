@@ -0,0 +1,40 @@
+from datetime import date, timedelta
+from scrape_schedule import AdaptiveScheduler
+
+
+def test_near_and_unknown_dates_are_always_due(tmp_path):
+    """
+    가까운 날짜와 이력이 없는 먼 날짜는 항상 조회 대상인지 확인합니다.
+    """
+    scheduler = AdaptiveScheduler(str(tmp_path / "schedule.json"), near_days=3, max_interval=7)
+    today = date(2026, 1, 30)
+    targets = [today + timedelta(days=offset) for offset in range(10)]
+
+    due, skipped = scheduler.select(targets, today)
+    assert due == targets
+    assert skipped == []
+
+
+def test_stable_far_dates_are_scraped_less_often(tmp_path):
+    """
+    예약 건수가 바뀌지 않는 먼 날짜는 조회 간격이 늘어나고, 자주 바뀌는 날짜는 매번 조회하는지 확인합니다.
+    """
+    path = str(tmp_path / "schedule.json")
+    scheduler = AdaptiveScheduler(path, near_days=3, max_interval=7)
+    stable, busy = date(2026, 3, 1), date(2026, 3, 2)
+
+    day = date(2026, 2, 1)
+    for i in range(10):
+        scheduler.record(stable.isoformat(), 2, day)
+        scheduler.record(busy.isoformat(), i, day)
+
+    reloaded = AdaptiveScheduler(path, near_days=3, max_interval=7)
+    assert reloaded.interval_for(stable.isoformat()) > 1
+    assert reloaded.interval_for(busy.isoformat()) == 1
+
+    due, skipped = reloaded.select([stable, busy], day + timedelta(days=1))
+    assert due == [busy]
+    assert skipped == [stable]
+
+    due, _ = reloaded.select([stable], day + timedelta(days=7))
+    assert due == [stable]
@@ -1,6 +1,6 @@
 import pytest
 from playwright.sync_api import Page, BrowserContext
-from browser_controller import setup_browser
+from browser_controller import setup_browser, close_browser
 from config import TARGET_URL, LOGIN_ID, LOGIN_PASSWORD
 from scraper import (
     close_login_dialog,
@@ -18,10 +18,9 @@ def browser_context():
     """
     테스트 세션 전체에서 한 번만 브라우저와 컨텍스트를 설정합니다.
     """
-    _page, browser, context = setup_browser()
+    _page, browser, context, driver = setup_browser()
     yield context
-    context.close()
-    browser.close()
+    close_browser(context, browser, driver)
 
 @pytest.fixture(scope="function")
 def page(browser_context: BrowserContext):
@@ -93,7 +92,7 @@ def test_scrape_reservation_details(logged_in_page: Page):
     click_team_button(page)
 
     # 데이터 스크래핑 함수 호출
-    scraped_data = scrape_details(page)
+    scraped_data = scrape_details(page, "2026-01-14")
 
     # 결과 확인
     assert scraped_data is not None
@@ -101,11 +100,11 @@ def test_scrape_reservation_details(logged_in_page: Page):
     assert len(scraped_data) > 0
 
     first_reservation = scraped_data[0]
-    assert "이름" in first_reservation
-    assert "상품명" in first_reservation
-    assert "예약시간" in first_reservation
-    assert "예약번호" in first_reservation
-    assert "국적" in first_reservation
+    assert first_reservation.date == "2026-01-14"
+    assert first_reservation.product
+    assert first_reservation.time
+    assert first_reservation.reservation_no
+    assert first_reservation.country
 
     # 간단한 데이터 값 검증
-    assert first_reservation["이름"] == "Zhang Qingrong (1)"
+    assert first_reservation.customer_name == "Zhang Qingrong (1)"
@@ -0,0 +1,121 @@
+from datetime import date, timedelta
+import pytest
+from playwright.sync_api import sync_playwright
+import scraper
+from benchmarks.bench_navigation import APP_URL, serve_app
+from benchmarks.synthetic_page import build_reservation_page
+from config import RESERVATION_WAIT_TIMEOUT, EMPTY_DATE_TIMEOUT
+
+
+@pytest.fixture(scope="module")
+def browser():
+    with sync_playwright() as playwright:
+        try:
+            browser = playwright.chromium.launch()
+        except Exception as e:
+            pytest.skip(f"Chromium을 실행할 수 없습니다 (playwright install chromium 필요): {e}")
+        yield browser
+        browser.close()
+
+
+@pytest.fixture
+def offline_page(browser):
+    """모든 네트워크 요청을 막은 페이지"""
+    context = browser.new_context()
+    context.route("**/*", lambda route: route.abort())
+    page = context.new_page()
+    yield page
+    context.close()
+
+
+class SlowLocator:
+    """render_ms 뒤에 보이는 요소 (wait_for의 timeout이 그보다 짧으면 TimeoutError)"""
+
+    def __init__(self, render_ms: int, waits: list):
+        self.render_ms = render_ms
+        self.waits = waits
+
+    @property
+    def first(self):
+        return self
+
+    def or_(self, other):
+        return self
+
+    def wait_for(self, state: str, timeout: int):
+        self.waits.append(timeout)
+        if timeout < self.render_ms:
+            raise TimeoutError(f"{timeout}ms 안에 나타나지 않음")
+
+    def is_visible(self) -> bool:
+        return True
+
+
+class SlowPage:
+    """상호(예약 목록)가 render_ms 뒤에 나타나는 가짜 페이지"""
+
+    def __init__(self, render_ms: int):
+        self.waits = []
+        self.render_ms = render_ms
+
+    def locator(self, selector: str):
+        return SlowLocator(self.render_ms, self.waits)
+
+
+def test_has_reservations_waits_long_without_empty_state_selector(monkeypatch):
+    """
+    빈 화면 셀렉터가 없으면 느리게(5초) 렌더링되는 예약 목록을 예약 없음으로 판단하지 않도록
+    RESERVATION_WAIT_TIMEOUT까지 기다리고, 셀렉터가 있을 때만 짧은 EMPTY_DATE_TIMEOUT을 쓰는지 확인합니다.
+    """
+    monkeypatch.setattr(scraper, "EMPTY_STATE_SELECTOR", "")
+    page = SlowPage(render_ms=5000)
+    assert scraper.has_reservations(page)
+    assert page.waits == [RESERVATION_WAIT_TIMEOUT]
+
+    monkeypatch.setattr(scraper, "EMPTY_STATE_SELECTOR", "p.empty-state")
+    page = SlowPage(render_ms=0)
+    assert scraper.has_reservations(page)
+    assert page.waits == [EMPTY_DATE_TIMEOUT]
+
+
+def test_scrape_details_assigns_rows_to_their_team(offline_page):
+    """
+    여러 팀이 있는 예약 상세 화면에서 각 예약 행이 바로 위 팀 헤더에 귀속되는지 확인합니다.
+    """
+    offline_page.set_content(build_reservation_page(6, teams=2))
+
+    reservations = scraper.scrape_details(offline_page, "2026-01-18")
+    assert [(r.reservation_no, r.team) for r in reservations] == [
+        ("R000000", "TEAM 1"), ("R000001", "TEAM 1"), ("R000002", "TEAM 1"),
+        ("R000003", "TEAM 2"), ("R000004", "TEAM 2"), ("R000005", "TEAM 2"),
+    ]
+    assert all(r.date == "2026-01-18" for r in reservations)
+
+
+def test_inplace_navigation_does_not_reuse_previous_date_rows(browser, monkeypatch):
+    """
+    inplace 방식으로 가짜 SPA에서 두 날짜를 연달아 조회할 때, 두 번째 날짜가 첫 날짜의 예약 행을
+    다시 읽지 않고 자기 날짜의 예약만 반환하는지 확인합니다.
+    """
+    # reset_page()의 대체 reload가 가짜 SPA를 다시 불러오도록 대상 URL 교체
+    monkeypatch.setattr(scraper, "TARGET_URL", APP_URL)
+    context = browser.new_context()
+    page = context.new_page()
+    page.route("https://bench.local/**", serve_app)
+    page.goto(APP_URL)
+    scraper.wait_for_page_ready(page)
+
+    targets = [date.today() + timedelta(days=offset) for offset in (1, 2)]
+    try:
+        results = [
+            scraper.scrape_date(page, str(target.day), target.isoformat(), navigation_mode="inplace")
+            for target in targets
+        ]
+    finally:
+        context.close()
+
+    for target, rows in zip(targets, results):
+        assert [row.reservation_no for row in rows] == [f"R{target.day * 1000 + i:06d}" for i in range(8)]
+        assert all(row.date == target.isoformat() for row in rows)
+    first, second = ({row.reservation_no for row in rows} for rows in results)
+    assert not first & second
@@ -0,0 +1,32 @@
+from session_store import save_state, load_state
+
+
+STATE = {
+    "cookies": [{"name": "sid", "value": "abc", "domain": "example.com", "path": "/"}],
+    "origins": [{"origin": "https://example.com", "localStorage": [{"name": "token", "value": "t"}]}],
+}
+
+
+def test_session_state_is_encrypted_and_restored(tmp_path):
+    """
+    storage state가 암호화되어 저장되고 같은 키로 그대로 복원되는지 확인합니다.
+    """
+    path = tmp_path / "session.enc"
+    assert save_state(STATE, path=str(path), secret="secret")
+
+    # 파일에 평문 토큰이 남지 않음
+    assert "abc" not in path.read_text(encoding="utf-8")
+    assert load_state(path=str(path), secret="secret") == STATE
+
+
+def test_session_state_requires_matching_key(tmp_path):
+    """
+    키가 없으면 저장하지 않고, 키가 다르거나 파일이 없으면 None을 반환하는지 확인합니다.
+    """
+    path = tmp_path / "session.enc"
+    assert not save_state(STATE, path=str(path), secret="")
+    assert not path.exists()
+
+    save_state(STATE, path=str(path), secret="secret")
+    assert load_state(path=str(path), secret="other") is None
+    assert load_state(path=str(tmp_path / "missing.enc"), secret="secret") is None
@@ -0,0 +1,111 @@
+import json
+import pytest
+import requests
+from gspread.exceptions import APIError
+from gspread.worksheet import Worksheet
+import sheet_api
+from sheet_api import ApiStats, RetryingHTTPClient, call_with_retry, endpoint_label, is_idempotent
+
+
+def make_api_error(status: int, reason: str = "") -> APIError:
+    response = requests.Response()
+    response.status_code = status
+    error = {"code": status, "message": "error", "errors": [{"reason": reason}] if reason else []}
+    response._content = json.dumps({"error": error}).encode("utf-8")
+    return APIError(response)
+
+
+def test_call_with_retry_backs_off_on_quota_errors():
+    """
+    할당량 초과(429, Drive 403 rateLimitExceeded)는 백오프 후 다시 시도하고, 모든 시도를 집계하는지 테스트합니다.
+    """
+    stats = ApiStats()
+    delays = []
+    errors = [make_api_error(429), make_api_error(403, "rateLimitExceeded")]
+
+    def flaky():
+        if errors:
+            raise errors.pop(0)
+        return "ok"
+
+    assert call_with_retry(flaky, "POST values:batchGet", stats=stats, sleep=delays.append) == "ok"
+    assert len(delays) == 2
+    assert stats.call_count == 3
+    assert stats.retries["POST values:batchGet"] == 2
+    assert stats.summary_lines()[-1].startswith("총 API 호출: 3회 (재시도 2회")
+
+    # 권한 오류는 바로 실패
+    def forbidden():
+        raise make_api_error(403)
+
+    with pytest.raises(APIError):
+        call_with_retry(forbidden, "GET metadata", stats=stats, sleep=delays.append)
+    assert len(delays) == 2
+
+
+def test_call_with_retry_does_not_repeat_append_on_server_error():
+    """
+    행 추가(append)는 5xx 응답 시 이미 반영되었을 수 있으므로 다시 시도하지 않고,
+    다른 요청은 재시도 한도까지만 다시 시도하는지 테스트합니다.
+    """
+    stats = ApiStats()
+    delays = []
+
+    def unavailable():
+        raise make_api_error(503)
+
+    label = endpoint_label("post", "https://sheets.googleapis.com/v4/spreadsheets/abc123/values/crawlingDB!A1:append")
+    assert label == "POST values:append"
+    with pytest.raises(APIError):
+        call_with_retry(unavailable, label, idempotent=False, stats=stats, sleep=delays.append)
+    assert delays == []
+
+    with pytest.raises(APIError):
+        call_with_retry(unavailable, "POST values:batchUpdate", max_retries=2, stats=stats, sleep=delays.append)
+    assert len(delays) == 2
+    assert stats.call_count == 4
+
+    assert endpoint_label("get", "https://sheets.googleapis.com/v4/spreadsheets/abc123") == "GET metadata"
+    assert endpoint_label("get", "https://www.googleapis.com/drive/v3/files") == "GET drive.files"
+
+
+class UnavailableSession:
+    """모든 요청에 503을 응답하는 가짜 세션 (요청 기록)"""
+
+    def __init__(self):
+        self.calls = []
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((method.upper(), url))
+        response = requests.Response()
+        response.status_code = 503
+        response._content = json.dumps({"error": {"code": 503, "message": "unavailable"}}).encode("utf-8")
+        return response
+
+
+def test_structural_batch_update_is_not_retried(monkeypatch):
+    """
+    insert_row()의 행 삽입(batchUpdate)은 503 응답 시 이미 반영되었을 수 있으므로 다시 시도하지 않고,
+    값 읽기(GET)는 다시 시도하는지 테스트합니다.
+    """
+    monkeypatch.setattr(sheet_api, "backoff_delay", lambda attempt: 0)
+    session = UnavailableSession()
+    client = RetryingHTTPClient(auth=None, session=session)
+    worksheet = Worksheet(
+        None, {"sheetId": 0, "title": "crawlingDB", "gridProperties": {"rowCount": 1}},
+        spreadsheet_id="abc123", client=client
+    )
+
+    with pytest.raises(APIError):
+        worksheet.insert_row(["날짜", "팀"], index=1)
+    assert session.calls == [("POST", "https://sheets.googleapis.com/v4/spreadsheets/abc123:batchUpdate")]
+
+    assert not is_idempotent("POST batchUpdate")
+    assert not is_idempotent("POST values:append")
+    assert is_idempotent("POST values:batchUpdate")
+    assert is_idempotent("PUT values")
+
+    session.calls.clear()
+    with pytest.raises(APIError):
+        worksheet.get_all_values()
+    assert len(session.calls) == sheet_api.SHEET_MAX_RETRIES + 1
@@ -0,0 +1,150 @@
+from dataclasses import replace
+from config import RESERVATION_DATA_HEADERS
+from gsheets_client import sync_to_worksheet
+from sheet_backend import LocalWorksheet
+from sheet_index import SheetIndex
+from sheet_writer import SheetWriter
+
+
+def test_sync_to_worksheet_uses_local_index(tmp_path, make_reservation):
+    """
+    두 번째 실행부터는 마지막으로 확인한 행 이후의 예약번호 컬럼만 읽어 중복을 확인하는지 테스트합니다.
+    """
+    worksheet = LocalWorksheet()
+    index = SheetIndex(str(tmp_path / "index.sqlite3"), "test")
+
+    new, existing, _ = sync_to_worksheet(worksheet, index, [make_reservation("R1"), make_reservation("R2")])
+    assert [r.reservation_no for r in new] == ["R1", "R2"]
+    assert existing == []
+    assert worksheet.rows[0] == RESERVATION_DATA_HEADERS
+    assert len(worksheet.rows) == 3
+    # 빈 시트의 헤더와 새 예약을 한 번의 append_rows로 추가 (헤더 확인 batch_get 1회 + 추가 1회)
+    assert worksheet.api_calls == 2
+
+    # 다른 작성자가 시트에 직접 추가한 행
+    worksheet.append_row(make_reservation("R3").to_row())
+
+    worksheet.read_cells = 0
+    new, existing, _ = sync_to_worksheet(
+        worksheet, index, [make_reservation("R2"), make_reservation("R3"), make_reservation("R4")]
+    )
+    assert [r.reservation_no for r in new] == ["R4"]
+    assert [r.reservation_no for r in existing] == ["R2", "R3"]
+    # 헤더 + 마지막으로 확인한 행(R2)부터의 예약번호 컬럼만 읽음
+    assert worksheet.read_cells == len(RESERVATION_DATA_HEADERS) + 2
+    index.close()
+
+
+def test_sync_to_worksheet_rebuilds_index_when_sheet_changed(tmp_path, make_reservation):
+    """
+    시트 행이 삭제되어 인덱스와 어긋나면 예약번호 컬럼 전체를 다시 읽는지 테스트합니다.
+    """
+    worksheet = LocalWorksheet()
+    index = SheetIndex(str(tmp_path / "index.sqlite3"), "test")
+    sync_to_worksheet(worksheet, index, [make_reservation("R1"), make_reservation("R2")])
+
+    worksheet.delete_row(2)  # R1 삭제
+
+    new, existing, _ = sync_to_worksheet(worksheet, index, [make_reservation("R1"), make_reservation("R2")])
+    assert [r.reservation_no for r in new] == ["R1"]
+    assert [r.reservation_no for r in existing] == ["R2"]
+    index.close()
+
+
+def test_sync_to_worksheet_upsert_updates_changed_rows(tmp_path, make_reservation):
+    """
+    upsert 모드에서 내용이 바뀐 기존 예약만 한 번의 batch_update로 갱신하는지 테스트합니다.
+    """
+    # 인덱스에 해시가 없는 기존 시트 (다른 경로로 작성된 행)
+    worksheet = LocalWorksheet(rows=[RESERVATION_DATA_HEADERS] + [make_reservation(no).to_row() for no in ("R1", "R2", "R3")])
+    index = SheetIndex(str(tmp_path / "index.sqlite3"), "test")
+
+    changed_r1 = replace(make_reservation("R1"), time="15:00")
+    changed_r3 = replace(make_reservation("R3"), price=132000)
+    new, existing, modified = sync_to_worksheet(
+        worksheet, index,
+        [changed_r1, make_reservation("R2"), changed_r3, make_reservation("R4")],
+        upsert=True
+    )
+
+    assert [r.reservation_no for r in new] == ["R4"]
+    assert [r.reservation_no for r in existing] == ["R2"]
+    assert [r.reservation_no for r in modified] == ["R1", "R3"]
+    assert worksheet.update_calls == 1
+    time_idx = RESERVATION_DATA_HEADERS.index("예약시간")
+    price_idx = RESERVATION_DATA_HEADERS.index("금액")
+    assert worksheet.rows[1][time_idx] == "15:00"
+    assert worksheet.rows[3][price_idx] == "132,000"
+
+    # 같은 내용으로 다시 실행하면 갱신하지 않음
+    _, existing, modified = sync_to_worksheet(worksheet, index, [changed_r1, changed_r3], upsert=True)
+    assert modified == []
+    assert len(existing) == 2
+    assert worksheet.update_calls == 1
+    index.close()
+
+
+def test_sheet_writer_flushes_in_batches(tmp_path, make_reservation):
+    """
+    SheetWriter가 날짜별 결과를 모아 건수 단위로 저장하고, 종료 시 남은 결과를 저장하는지 테스트합니다.
+    """
+    worksheet = LocalWorksheet()
+    index = SheetIndex(str(tmp_path / "index.sqlite3"), "test")
+    writer = SheetWriter(flush_size=2, flush_interval=60, open_target=lambda: (worksheet, index)).start()
+
+    writer.put([make_reservation("R1", "2026-01-18")])
+    writer.put([make_reservation("R2", "2026-01-19"), make_reservation("R3", "2026-01-19")])
+    writer.put([make_reservation("R1", "2026-01-18"), make_reservation("R4", "2026-01-20")])
+    writer.close()
+
+    assert [r.reservation_no for r in writer.new_reservations] == ["R1", "R2", "R3", "R4"]
+    assert [r.reservation_no for r in writer.existing_reservations] == ["R1"]
+    assert len(worksheet.rows) == 5
+
+
+def test_local_worksheet_ranges_and_insert():
+    """
+    LocalWorksheet가 구글 시트처럼 범위 읽기, 행 삽입, 추가 응답(updatedRange)을 처리하는지 테스트합니다.
+    """
+    worksheet = LocalWorksheet(rows=[["R1", "a"], ["R2", "b", ""]])
+
+    response = worksheet.append_rows([["R3", True]])
+    assert response["updates"]["updatedRange"] == "local!A3:B3"
+
+    worksheet.insert_row(["no", "value"], 1)
+    assert worksheet.batch_get(["A1:B1", "A3:A"]) == [[["no", "value"]], [["R2"], ["R3"]]]
+    assert worksheet.get_all_values()[-1] == ["R3", "TRUE"]
+    assert worksheet.api_calls == 4
+
+
+def test_sync_to_worksheet_upsert_rechecks_reordered_rows(tmp_path, make_reservation):
+    """
+    마지막 행은 그대로 두고 중간 행 순서만 바뀐 시트에서, 갱신 전에 대상 행의 예약번호를 확인해
+    인덱스를 재구성하고 올바른 행을 갱신하는지 테스트합니다. (다른 예약 행을 덮어쓰지 않음)
+    """
+    worksheet = LocalWorksheet()
+    index = SheetIndex(str(tmp_path / "index.sqlite3"), "test")
+    original = [make_reservation(no) for no in ("R1", "R2", "R3", "R4")]
+    sync_to_worksheet(worksheet, index, original)
+
+    # 다른 작성자가 R1과 R2 행의 순서를 바꿈 (마지막 행 R4는 그대로)
+    worksheet.batch_update([
+        {"range": "A2", "values": [original[1].to_row()]},
+        {"range": "A3", "values": [original[0].to_row()]},
+    ])
+    worksheet.update_calls = 0
+
+    changed_r1 = replace(make_reservation("R1"), time="15:00")
+    new, existing, modified = sync_to_worksheet(worksheet, index, [changed_r1, make_reservation("R2")], upsert=True)
+
+    assert new == []
+    assert [r.reservation_no for r in existing] == ["R2"]
+    assert [r.reservation_no for r in modified] == ["R1"]
+    assert worksheet.update_calls == 1
+    no_idx = RESERVATION_DATA_HEADERS.index("예약번호")
+    time_idx = RESERVATION_DATA_HEADERS.index("예약시간")
+    assert [row[no_idx] for row in worksheet.rows[1:]] == ["R2", "R1", "R3", "R4"]
+    assert worksheet.rows[1][time_idx] == "10:00"
+    assert worksheet.rows[2][time_idx] == "15:00"
+    assert {no: row for no, (row, _) in index.lookup(["R1", "R2"]).items()} == {"R1": 3, "R2": 2}
+    index.close()
@@ -0,0 +1,88 @@
+from dataclasses import replace
+from datetime import date
+from snapshot_diff import ChangeTracker, diff_reservations
+from slack_notifier import SlackNotifier
+
+DATE = "2026-01-20"
+
+
+def test_diff_reservations(make_reservation):
+    """
+    예약번호로 추가/취소/변경/동일 예약을 분류하고, 변경된 필드만 변경 내용에 담는지 확인합니다.
+    """
+    previous = [make_reservation("A", DATE), make_reservation("B", DATE), make_reservation("C", DATE)]
+    current = [
+        make_reservation("A", DATE),
+        make_reservation("B", DATE, time="11:00", price=40000, is_new=True),
+        make_reservation("D", DATE),
+    ]
+
+    diff = diff_reservations(previous, current)
+    assert [r.reservation_no for r in diff.added] == ["D"]
+    assert [r.reservation_no for r in diff.removed] == ["C"]
+    assert [r.reservation_no for r in diff.unchanged] == ["A"]
+    assert len(diff.modified) == 1
+    assert diff.modified[0].deltas == {"time": ("10:00", "11:00"), "price": (66000, 40000)}
+
+
+def test_change_tracker_feeds_sheet_and_slack(tmp_path, make_reservation):
+    """
+    스냅샷이 없는 날짜는 전체를, 있는 날짜는 추가/변경된 예약만 시트 작성기로 넘기고,
+    날짜를 옮긴 예약은 취소가 아닌 변경으로 합쳐 Slack 메시지에 표시하는지 확인합니다.
+    """
+    path = str(tmp_path / "snapshot.sqlite3")
+    today = date(2026, 1, 18)
+    first_day = [make_reservation("A", DATE), make_reservation("B", DATE), make_reservation("C", DATE)]
+
+    tracker = ChangeTracker(path)
+    assert tracker.track("2026-01-20", first_day) == first_day
+    tracker.commit(today)
+    tracker.close()
+
+    tracker = ChangeTracker(path)
+    moved = make_reservation("C", "2026-01-21")
+    changed = replace(first_day[1], customer_name="홍길동")
+    assert tracker.track("2026-01-20", [first_day[0], changed]) == [changed]
+    assert tracker.track("2026-01-21", [moved]) == [moved]
+
+    changes = tracker.finalize()
+    assert changes.removed == []
+    assert [c.after.reservation_no for c in changes.modified] == ["B", "C"]
+    assert changes.modified[1].deltas == {"date": ("2026-01-20", "2026-01-21")}
+
+    tracker.commit(today)
+    assert [r.reservation_no for r in tracker.store.load("2026-01-20")] == ["A", "B"]
+    tracker.close()
+
+    message = SlackNotifier(webhook_url="").format_daily_summary_message(
+        today_reservations=[], new_reservations=[], today_date="2026-01-18",
+        removed_reservations=[first_day[0]], changed_reservations=changes.modified
+    )
+    assert "[취소된 예약]" in message
+    assert "고객명: 고객B → 홍길동" in message
+    assert "날짜: 2026-01-20 → 2026-01-21" in message
+
+
+def test_skipped_empty_date_reports_cancellations(tmp_path, make_reservation):
+    """
+    월간 예약 현황에서 0건으로 확인되어 조회하지 않은 날짜도 스냅샷에 예약이 남아 있으면
+    취소로 알리고 스냅샷을 비우는지 확인합니다. (예약이 없던 날짜는 비교하지 않음)
+    """
+    path = str(tmp_path / "snapshot.sqlite3")
+    today = date(2026, 1, 18)
+    rows = [make_reservation("A", DATE), make_reservation("B", DATE)]
+
+    tracker = ChangeTracker(path)
+    tracker.track("2026-01-20", rows)
+    tracker.track("2026-01-22", [])
+    tracker.commit(today)
+    tracker.close()
+
+    tracker = ChangeTracker(path)
+    assert tracker.track_empty(["2026-01-20", "2026-01-21", "2026-01-22"]) == ["2026-01-20"]
+    changes = tracker.finalize()
+    assert [r.reservation_no for r in changes.removed] == ["A", "B"]
+    tracker.commit(today)
+    assert tracker.store.count("2026-01-20") == 0
+    assert tracker.track_empty(["2026-01-20"]) == []
+    tracker.close()
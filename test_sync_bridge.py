@@ -0,0 +1,173 @@
+import ast
+import asyncio
+import inspect
+import pytest
+from playwright import async_api
+import month_overview
+import scraper
+import session_store
+from sync_bridge import (
+    ContextApi, KeyboardApi, LocatorApi, PageApi, ResponseApi,
+    SyncContext, SyncKeyboard, SyncLocator, SyncPage, SyncResponse, run_sync, sleep, to_thread
+)
+
+# Protocol, async playwright 클래스, sync 어댑터
+API_CLASSES = [
+    (PageApi, async_api.Page, SyncPage),
+    (LocatorApi, async_api.Locator, SyncLocator),
+    (ResponseApi, async_api.Response, SyncResponse),
+    (ContextApi, async_api.BrowserContext, SyncContext),
+    (KeyboardApi, async_api.Keyboard, SyncKeyboard),
+]
+
+
+def member_kind(cls, name: str) -> str:
+    value = inspect.getattr_static(cls, name)
+    if isinstance(value, property):
+        return "property"
+    return "async" if inspect.iscoroutinefunction(value) else "sync"
+
+
+def protocol_members(protocol) -> list[str]:
+    return [name for name in vars(protocol) if not name.startswith("_")]
+
+
+@pytest.mark.parametrize("protocol, async_class, adapter", API_CLASSES, ids=lambda cls: cls.__name__)
+def test_protocol_matches_async_playwright_and_adapter(protocol, async_class, adapter):
+    """
+    Protocol의 모든 API가 async playwright 클래스와 sync 어댑터에 같은 형태(프로퍼티/async/sync)로 있고,
+    Protocol에 적은 인자를 둘 다 받는지 확인합니다.
+    """
+    for name in protocol_members(protocol):
+        kind = member_kind(protocol, name)
+        for implementation in (async_class, adapter):
+            assert member_kind(implementation, name) == kind, f"{implementation.__name__}.{name}"
+            if kind != "property":
+                expected = inspect.signature(getattr(protocol, name)).parameters
+                actual = inspect.signature(getattr(implementation, name)).parameters
+                assert set(expected) <= set(actual), f"{implementation.__name__}.{name}"
+
+
+def test_async_implementations_use_only_protocol_api():
+    """
+    scraper/session_store/month_overview의 async 구현이 Protocol로 표기한 인자(page, context, response)에서
+    Protocol에 없는 속성을 쓰지 않는지 확인합니다. (sync 진입점에서 어댑터에 없는 API로 실패하지 않도록)
+    """
+    protocols = {"PageApi": PageApi, "ContextApi": ContextApi, "ResponseApi": ResponseApi}
+    checked = 0
+    for module in (scraper, session_store, month_overview):
+        tree = ast.parse(inspect.getsource(module))
+        for function in ast.walk(tree):
+            if not isinstance(function, (ast.AsyncFunctionDef, ast.FunctionDef)):
+                continue
+            typed_args = {}
+            for arg in function.args.args:
+                annotation = ast.unparse(arg.annotation) if arg.annotation else ""
+                for protocol_name, protocol in protocols.items():
+                    if annotation.startswith(protocol_name):
+                        typed_args[arg.arg] = protocol
+            for node in ast.walk(function):
+                if (
+                    isinstance(node, ast.Attribute)
+                    and isinstance(node.value, ast.Name)
+                    and node.value.id in typed_args
+                ):
+                    protocol = typed_args[node.value.id]
+                    assert node.attr in protocol_members(protocol), (
+                        f"{module.__name__}.{function.name}: {node.value.id}.{node.attr}는 "
+                        f"{protocol.__name__}에 없습니다."
+                    )
+                    checked += 1
+    assert checked > 0
+
+
+class FakeEventInfo:
+    value = None
+
+
+class FakeExpectation:
+    """sync page.expect_response()처럼 with 블록이 끝날 때 값을 채우는 컨텍스트 매니저"""
+
+    def __init__(self, predicate, response):
+        self.info = FakeEventInfo()
+        self.predicate = predicate
+        self.response = response
+
+    def __enter__(self):
+        return self.info
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.predicate(self.response):
+            self.info.value = self.response
+
+
+class FakeResponse:
+    url = "https://example.test/api/reservations"
+    ok = True
+    status = 200
+
+    def json(self):
+        return {"rows": [1, 2]}
+
+
+class FakeLocator:
+    def __init__(self, page: "FakeSyncPage", selector: str):
+        self.page = page
+        self.selector = selector
+
+    @property
+    def first(self):
+        return self
+
+    def or_(self, other: "FakeLocator"):
+        return FakeLocator(self.page, f"{self.selector}, {other.selector}")
+
+    def click(self):
+        self.page.clicked.append(self.selector)
+
+    def inner_text(self, timeout: float = 30000) -> str:
+        return f" {self.selector} "
+
+
+class FakeSyncPage:
+    """sync playwright Page처럼 메서드가 바로 값을 반환하는 가짜 페이지"""
+
+    def __init__(self):
+        self.clicked = []
+
+    def locator(self, selector: str):
+        return FakeLocator(self, selector)
+
+    def expect_response(self, predicate, timeout: float):
+        return FakeExpectation(predicate, FakeResponse())
+
+
+def test_run_sync_drives_async_code_with_adapters():
+    """
+    async 구현이 어댑터로 감싼 sync 객체를 await하고, async with로 sync 컨텍스트 매니저를 쓰고,
+    sleep()/to_thread()를 이벤트 루프 없이 실행하는지 확인합니다.
+    """
+    async def click_and_read(page: PageApi):
+        locator = page.locator("a").or_(page.locator("b")).first
+        await locator.click()
+        async with page.expect_response(lambda response: "/api/" in response.url, timeout=1000) as response_info:
+            await page.locator("ok").click()
+        response = await response_info.value
+        await sleep(0)
+        rows = await to_thread(len, (await response.json())["rows"])
+        return (await locator.inner_text()).strip(), rows, response
+
+    page = FakeSyncPage()
+    text, rows, response = run_sync(click_and_read(SyncPage(page)))
+    assert (text, rows) == ("a, b", 2)
+    assert isinstance(response, SyncResponse) and isinstance(response.response, FakeResponse)
+    assert page.clicked == ["a, b", "ok"]
+
+
+def test_run_sync_rejects_event_loop_waits():
+    """실제 이벤트 루프 대기가 필요한 코루틴은 sync로 실행하지 않고 오류를 내는지 확인합니다."""
+    async def needs_loop():
+        await asyncio.sleep(0.01)
+
+    with pytest.raises(RuntimeError):
+        run_sync(needs_loop())
@@ -0,0 +1,83 @@
+import asyncio
+import json
+import pytest
+from tracing import Tracer, percentile
+
+
+def test_tracer_writes_nested_spans_and_summary(tmp_path):
+    """
+    span이 JSON 한 줄씩 기록되고, 중첩 관계(parent_id)와 실패 여부, 단계별 요약이 남는지 테스트합니다.
+    """
+    tracer = Tracer()
+    path = tmp_path / "trace.jsonl"
+    tracer.start(str(path), run_id="test")
+
+    with tracer.span("scrape_date", reservation_date="2026-01-18"):
+        with tracer.span("click_date_button"):
+            pass
+        with pytest.raises(ValueError):
+            with tracer.span("has_reservations"):
+                raise ValueError("timeout")
+    tracer.close()
+
+    records = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    by_name = {r["name"]: r for r in records}
+    assert [r["name"] for r in records] == ["click_date_button", "has_reservations", "scrape_date"]
+    assert by_name["click_date_button"]["parent_id"] == by_name["scrape_date"]["span_id"]
+    assert by_name["scrape_date"]["parent_id"] is None
+    assert by_name["scrape_date"]["attrs"] == {"reservation_date": "2026-01-18"}
+    assert by_name["has_reservations"]["status"] == "error"
+    assert all(r["run_id"] == "test" for r in records)
+
+    lines = tracer.summary_lines()
+    assert lines[0].split()[:4] == ["span", "count", "errors", "p50_ms"]
+    assert len(lines) == 4
+
+
+def test_traced_decorator_supports_async_and_percentiles(monkeypatch):
+    """
+    traced 데코레이터가 async 함수의 인자를 속성으로 기록하고, 백분위수가 nearest-rank로 계산되는지 테스트합니다.
+    """
+    import tracing
+
+    tracer = Tracer()
+    monkeypatch.setattr(tracing, "tracer", tracer)
+
+    @tracing.traced(attrs=("reservation_date",))
+    async def scrape_date(page, target_day, reservation_date):
+        await asyncio.sleep(0)
+        return reservation_date
+
+    assert asyncio.run(scrape_date(None, "18", reservation_date="2026-01-18")) == "2026-01-18"
+
+    assert tracer.summary_lines()[1].startswith("scrape_date")
+    values = sorted(float(v) for v in range(1, 101))
+    assert percentile(values, 0.5) == 50
+    assert percentile(values, 0.95) == 95
+    assert percentile([], 0.5) == 0
+
+
+def test_wait_span_records_waits_in_the_same_summary(monkeypatch):
+    """
+    wait_span이 대기를 최대 대기 시간이 붙은 span으로 기록하고, 타임아웃을 errors로 집계해
+    단계별 요약 하나에 limit_ms와 총 대기 시간을 함께 표시하는지 테스트합니다.
+    """
+    import tracing
+
+    tracer = Tracer()
+    monkeypatch.setattr(tracing, "tracer", tracer)
+
+    with tracer.span("scrape_date"):
+        with tracing.wait_span("date_button", 15000):
+            pass
+        with pytest.raises(TimeoutError):
+            with tracing.wait_span("date_button", 5000):
+                raise TimeoutError("15000ms")
+
+    lines = tracer.summary_lines()
+    assert lines[0].split() == ["span", "count", "errors", "p50_ms", "p95_ms", "max_ms", "limit_ms", "total_s"]
+    rows = {line.split()[0]: line.split() for line in lines[1:-1]}
+    assert rows["date_button"][1:3] == ["2", "1"]
+    assert rows["date_button"][6] == "15000"
+    assert rows["scrape_date"][6] == "-"
+    assert lines[-1].startswith("총 대기 시간:")
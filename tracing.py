@@ -0,0 +1,207 @@
+"""
+실행 추적(tracing) 모듈
+브라우저 실행, 로그인, 날짜별 조회 단계, 시트 저장, Slack 전송 등 주요 단계의 소요 시간을 span으로 기록합니다.
+요소/응답 대기(wait_span)도 최대 대기 시간(timeout_ms)을 붙인 span으로 같은 trace에 기록합니다.
+각 span은 끝나는 즉시 TRACE_FILE에 JSON 한 줄로 추가되고, 실행 종료 시 단계별 p50/p95/max 요약을 한 번 출력합니다.
+GitHub Actions에서는 trace 파일을 아티팩트로 올려 실행 간 소요 시간 변화를 비교할 수 있습니다.
+
+JSON 한 줄 형식:
+    {"run_id": ..., "span_id": 3, "parent_id": 1, "name": "scrape_date", "start": 1768700000.123,
+     "duration_ms": 1834.2, "status": "ok", "thread": "MainThread", "attrs": {"reservation_date": "2026-01-18"}}
+"""
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from pathlib import Path
+import functools
+import inspect
+import itertools
+import json
+import math
+import os
+import threading
+import time
+from config import TRACE_FILE
+
+# 현재 실행 중인 span id (async 태스크/호출 단위로 분리되어 중첩 관계를 기록)
+_current_span: ContextVar[int | None] = ContextVar("current_span", default=None)
+
+
+def percentile(values: list[float], q: float) -> float:
+    """정렬된 값 목록의 nearest-rank 백분위수 (q: 0~1)"""
+    if not values:
+        return 0.0
+    return values[max(0, math.ceil(q * len(values)) - 1)]
+
+
+class Tracer:
+    """span 기록기 (여러 스레드와 async 태스크에서 동시에 사용 가능)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._durations = defaultdict(list)  # span 이름 -> [duration_ms]
+        self._errors = defaultdict(int)  # span 이름 -> 실패 수
+        self._limits = {}  # 대기 span 이름 -> 최대 대기 시간(ms)
+        self._file = None
+        self.run_id = None
+        self.path = None
+
+    def start(self, path: str = TRACE_FILE, run_id: str | None = None):
+        """새 실행의 trace 파일을 엽니다. (이전 실행의 파일은 덮어씀, path가 비어 있으면 파일 기록 안 함)"""
+        self.close()
+        self.reset()
+        self.run_id = run_id or os.getenv("GITHUB_RUN_ID") or datetime.now().strftime("%Y%m%dT%H%M%S")
+        self.path = path or None
+        if self.path:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "w", encoding="utf-8")
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def reset(self):
+        with self._lock:
+            self._durations.clear()
+            self._errors.clear()
+            self._limits.clear()
+
+    def _emit(self, record: dict):
+        with self._lock:
+            self._durations[record["name"]].append(record["duration_ms"])
+            if record["status"] != "ok":
+                self._errors[record["name"]] += 1
+            timeout_ms = record["attrs"].get("timeout_ms")
+            if timeout_ms is not None:
+                self._limits[record["name"]] = max(self._limits.get(record["name"], 0), timeout_ms)
+            if self._file is not None:
+                self._file.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+                self._file.flush()
+
+    @contextmanager
+    def span(self, name: str, **attrs):
+        """
+        with 블록의 소요 시간을 span으로 기록합니다.
+        블록에서 예외가 발생하면 status="error"와 오류 내용을 기록한 뒤 예외를 그대로 전달합니다.
+        """
+        span_id = next(self._ids)
+        parent_id = _current_span.get()
+        token = _current_span.set(span_id)
+        started_at = time.time()
+        start = time.perf_counter()
+        status, error = "ok", None
+        try:
+            yield
+        except BaseException as e:
+            status, error = "error", f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            _current_span.reset(token)
+            record = {
+                "run_id": self.run_id,
+                "span_id": span_id,
+                "parent_id": parent_id,
+                "name": name,
+                "start": round(started_at, 3),
+                "duration_ms": round((time.perf_counter() - start) * 1000, 1),
+                "status": status,
+                "thread": threading.current_thread().name,
+                "attrs": attrs,
+            }
+            if error:
+                record["error"] = error[:500]
+            self._emit(record)
+
+    def summary_lines(self) -> list[str]:
+        """
+        span 이름별 요약 (총 소요 시간이 긴 순서)
+        대기 span은 limit_ms(최대 대기 시간)를 함께 표시하고, errors는 타임아웃 수입니다.
+        """
+        with self._lock:
+            durations = {name: sorted(values) for name, values in self._durations.items()}
+            errors = dict(self._errors)
+            limits = dict(self._limits)
+
+        if not durations:
+            return []
+
+        lines = [
+            f"{'span':<28}{'count':>6}{'errors':>7}{'p50_ms':>9}{'p95_ms':>9}{'max_ms':>9}"
+            f"{'limit_ms':>9}{'total_s':>9}"
+        ]
+        for name, values in sorted(durations.items(), key=lambda item: -sum(item[1])):
+            limit = f"{limits[name]:.0f}" if name in limits else "-"
+            lines.append(
+                f"{name:<28}{len(values):>6}{errors.get(name, 0):>7}"
+                f"{percentile(values, 0.5):>9.0f}{percentile(values, 0.95):>9.0f}{values[-1]:>9.0f}"
+                f"{limit:>9}{sum(values) / 1000:>9.1f}"
+            )
+        if limits:
+            wait_total = sum(sum(durations[name]) for name in limits)
+            lines.append(f"총 대기 시간: {wait_total / 1000:.1f}초")
+        return lines
+
+    def print_summary(self):
+        lines = self.summary_lines()
+        if not lines:
+            return
+        print("\n[단계별 소요 시간]")
+        for line in lines:
+            print(f"  {line}")
+        if self.path:
+            print(f"  trace 파일: {self.path}")
+
+
+# 전역 기록기
+tracer = Tracer()
+
+
+def span(name: str, **attrs):
+    """전역 기록기의 span (with span("sheet_flush", rows=10): ...)"""
+    return tracer.span(name, **attrs)
+
+
+def wait_span(step: str, timeout_ms: float):
+    """
+    요소/응답 대기를 span으로 기록합니다. (with wait_span("date_button", 15000): ...)
+    블록에서 예외가 발생하면 status="error"로 남아 요약의 errors에 타임아웃으로 집계됩니다.
+    """
+    return tracer.span(step, timeout_ms=timeout_ms)
+
+
+def traced(name: str | None = None, attrs: tuple[str, ...] = ()):
+    """
+    함수 호출 전체를 span으로 기록하는 데코레이터 (async 함수도 지원)
+
+    Args:
+        name: span 이름 (기본값: 함수 이름, sync 진입점과 같은 이름으로 기록되도록 _async 접미사는 제외)
+        attrs: span 속성으로 기록할 인자 이름 (예: ("reservation_date",))
+    """
+    def decorator(func):
+        span_name = name or func.__name__.removesuffix("_async")
+        signature = inspect.signature(func)
+
+        def span_attrs(args, kwargs) -> dict:
+            if not attrs:
+                return {}
+            bound = signature.bind_partial(*args, **kwargs)
+            return {key: bound.arguments[key] for key in attrs if key in bound.arguments}
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with tracer.span(span_name, **span_attrs(args, kwargs)):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with tracer.span(span_name, **span_attrs(args, kwargs)):
+                return func(*args, **kwargs)
+        return wrapper
+
+    return decorator